@@ -84,11 +84,17 @@ The whale constellation watches over our multi-perspective universe
 """
 from collections import Counter
 import time
+import json
+import sys
+import threading
+import itertools
+import bisect
+import heapq
 import hashlib
 import math
 import random
 from typing import Dict, List, Set, Tuple, Optional, Any, Deque, FrozenSet
-from collections import defaultdict, deque
+from collections import defaultdict, deque, OrderedDict
 from enum import Enum
 from dataclasses import dataclass, field
 from selenium.webdriver.common.by import By
@@ -1858,24 +1864,8 @@ class ROSE:
         if not neuron_id:
             return {}
         
-        # Get recent axons for this neuron
-        all_axons = axon_network.get_axon_log_for_neuron(neuron_id)
-        current_time = time.time()
-        recent_axons = [a for a in all_axons if time.time() - a['absolute_time'] <= 60]
-                        
-        # Calculate pattern frequencies from axons
-        pattern_counts = defaultdict(int)
-        for axon in recent_axons:
-            axon_type = axon['axon_type']
-            # Map axon types to patterns
-            if 'SUCCESS' in axon_type:
-                pattern = axon['data'].get('pattern', 'UNKNOWN')
-                pattern_counts[pattern] += 3  # Success weight
-            elif 'FAILURE' in axon_type:
-                pattern = axon['data'].get('pattern', 'UNKNOWN')
-                pattern_counts[pattern] -= 2  # Failure penalty
-            elif 'DISCOVERY' in axon_type:
-                pattern_counts['UNKNOWN'] += 1  # Discovery weight
+        # Pattern weights from the neuron's sliding-window outcome tallies
+        pattern_counts = axon_network.get_outcome_tallies(neuron_id, window=60)
         
         # Convert to priority updates
         updates = {}
@@ -1900,59 +1890,321 @@ Enhanced with matrix-based calculations and continuous Baesian recycling
 
 # ===== Rerouting objects to maximize information gain, the membrane 
 
+class CoordinateIndex:
+    """
+    Coordinates known to hold an element, for void candidate search without browser
+    lookups. Seeded from the priori coordinate space; every neuron read confirms the
+    coordinate and keeps its dom_state, a failed lookup or a void report drops it, and a
+    DOM_EVENT expires the cached states in the changed element's parent subtree and
+    restores the coordinates dropped there (the element may be back). Cached states
+    older than max_age are not served.
+    """
+    
+    def __init__(self, coordinates=(), max_age: float = 5.0):
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self.known: Set[Tuple[int, ...]] = set()
+        self.states = {}  # coordinate -> (dom_state, observed_at) from the last successful read
+        self.dropped: Set[Tuple[int, ...]] = set()  # known once, missing since - re-seeded on DOM_EVENT
+        self.stats = defaultdict(int)
+        # Lock-free counters exist up front so get_metrics' copy never sees the dict grow
+        for key in ('lookups', 'state_hits', 'state_misses', 'confirmed', 'confirm_failed'):
+            self.stats[key] = 0
+        self.seed(coordinates)
+    
+    def seed(self, coordinates):
+        """Add scanned coordinates (priori / re-scan) - existence only, no states"""
+        with self._lock:
+            before = len(self.known)
+            self.known.update(tuple(coord) for coord in coordinates)
+            self.dropped.difference_update(self.known)
+            self.stats['seeded'] += len(self.known) - before
+    
+    def observed(self, coordinate: Tuple[int, ...], dom_state: Dict):
+        with self._lock:
+            self.known.add(coordinate)
+            self.dropped.discard(coordinate)
+            self.states[coordinate] = (dom_state, time.time())
+            self.stats['observed'] += 1
+    
+    def mark_missing(self, coordinate: Tuple[int, ...]):
+        with self._lock:
+            if coordinate in self.known:
+                self.known.discard(coordinate)
+                self.dropped.add(coordinate)
+                self.stats['dropped'] += 1
+            self.states.pop(coordinate, None)
+    
+    def invalidate(self, prefix: Tuple[int, ...]):
+        """
+        Subtree changed: expire cached states under a prefix and re-seed the coordinates
+        dropped there. Existence is kept either way - the chosen candidate is confirmed.
+        """
+        with self._lock:
+            stale = [coord for coord in self.states if coord[:len(prefix)] == prefix]
+            for coord in stale:
+                del self.states[coord]
+            self.stats['invalidated'] += len(stale)
+            
+            returning = [coord for coord in self.dropped if coord[:len(prefix)] == prefix]
+            self.dropped.difference_update(returning)
+            self.known.update(returning)
+            self.stats['reseeded'] += len(returning)
+    
+    def exists(self, coordinate: Tuple[int, ...]) -> bool:
+        self.stats['lookups'] += 1
+        return coordinate in self.known
+    
+    def cached_state(self, coordinate: Tuple[int, ...]) -> Optional[Dict]:
+        entry = self.states.get(coordinate)
+        if entry is None or time.time() - entry[1] > self.max_age:
+            self.stats['state_misses'] += 1
+            return None
+        self.stats['state_hits'] += 1
+        return entry[0]
+    
+    def get_metrics(self) -> Dict:
+        with self._lock:
+            return {'known': len(self.known), 'cached_states': len(self.states),
+                    'dropped_pending': len(self.dropped), **self.stats}
+
+
 class VoidSystem:
-    """Simplified void rerouting using T() transform as specified"""
+    """
+    Void rerouting using the T() transform. A membrane engine thread (start / stop)
+    runs batched passes on its own cadence, woken early when a void registers: every
+    pending (neuron, void) connection across all membranes gets its candidates from
+    the CoordinateIndex, each distinct candidate is read once, observations are
+    encoded per neuron in one batch at the connection's own position, and the winner
+    is picked by T-profile similarity. Without the engine running, neurons run a pass
+    inline (process_voids).
+    """
+    
+    SIMILARITY_BINS = (0, 5, 10, 20, 40)  # lower edges - dot products of binary 87D profiles
+    
     def __init__(self, axon_network):
         self.axon_network = axon_network
         self.membranes = {}  # void_coordinate -> MembraneState
+        self._lock = threading.RLock()
+        
+        # ===== ENGINE =====
+        self.interval = 0.25
+        self._thread = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        
+        # ===== METRICS =====
+        self.stats = defaultdict(int, {'passes': 0, 'resolved': 0, 'unresolved': 0, 'reads': 0})
+        self.reroute_latency_ms = deque(maxlen=500)  # registration -> reroute, per connection
+        self.reroute_latency_max_ms = 0.0
+        self.similarity_histogram = {self._similarity_bin(edge): 0 for edge in self.SIMILARITY_BINS}
+        self.last_pass_ms = 0.0
+        self.pass_ms_total = 0.0
         
     def register_void(self, void_coordinate, neuron_id, neuron_data):
         """Neuron registers at a void"""
-        if void_coordinate not in self.membranes:
-            self.membranes[void_coordinate] = self.MembraneState(void_coordinate)
-            
-        membrane = self.membranes[void_coordinate]
-        membrane.add_neuron(neuron_id, neuron_data)
+        with self._lock:
+            if void_coordinate not in self.membranes:
+                self.membranes[void_coordinate] = self.MembraneState(void_coordinate)
+                
+            membrane = self.membranes[void_coordinate]
+            membrane.add_neuron(neuron_id, neuron_data)
+        self.wake()
+    
+    # ===== ENGINE =====
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self, interval: float = 0.25):
+        """Run membrane passes on a background thread every `interval` seconds (or when woken)"""
+        if self.running:
+            return
+        self.interval = interval
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="membrane-engine", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 2.0):
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def wake(self):
+        self._wake.set()
+    
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if self._stop.is_set():
+                break
+            try:
+                if self.pending_count():
+                    self.process_voids()
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"⚠️ Membrane pass failed: {e}")
+    
+    def pending_count(self) -> int:
+        with self._lock:
+            return sum(1 for membrane in self.membranes.values() if membrane.port
+                       for conn in membrane.connections.values() if not conn['processed'])
         
     def process_voids(self):
-        """Process all active voids"""
-        processed_any = False
+        """One batched pass over every pending connection - True if any got a reroute"""
+        started = time.perf_counter()
+        index = self.axon_network.coordinate_index
+        
+        # 1. Pending connections, neurons by id, candidates from the index (no browser calls)
+        pairs = []  # (membrane, neuron, conn, P_i_k, position_idx, pos_idx, candidates)
+        with self._lock:
+            for membrane in list(self.membranes.values()):
+                if not membrane.port:
+                    continue
+                for neuron_id, conn in list(membrane.connections.items()):
+                    if conn['processed']:
+                        continue
+                    neuron = self.axon_network.neuron_objects.get(neuron_id)
+                    if neuron is None:
+                        membrane.remove_neuron(neuron_id)
+                        self.stats['orphaned'] += 1
+                        continue
+                    position = conn.get('input_direction')
+                    if position not in neuron.neighbor_positions:
+                        continue
+                    P_i_k = getattr(neuron, 'P_permuted', None)
+                    if P_i_k is None:
+                        P_i_k = neuron.P_matrix  # Fallback to original P matrix
+                    pairs.append((membrane, neuron, conn, P_i_k.copy(),
+                                  neuron.neighbor_positions.index(position),
+                                  neuron.position_names.index(position),
+                                  membrane._find_candidates(neuron, conn)))
+        if not pairs:
+            return False
         
-        for void_coord, membrane in list(self.membranes.items()):
-            if not membrane.port:
-                continue
-                
-            # Process each unprocessed neuron
-            for neuron_id, conn in list(membrane.connections.items()):
-                if not conn['processed']:
-                    # Get neuron object - FIX: axon_network needs get_neuron_by_id method
-                    # For now, we'll find it by coordinate
-                    neuron = None
-                    for coord, neuron_data in self.axon_network.neuron_registry.items():
-                        if neuron_data.get('id') == neuron_id:
-                            # Need to store neuron references somewhere accessible
-                            # This is a hack - you need a proper neuron lookup
-                            pass
-                    
-                    if neuron:
-                        processed = membrane.process_neuron(neuron_id, neuron)
-                        if processed:
-                            processed_any = True
-                                
+        # 2. Each distinct candidate read once - the index's cached state first, then the browser
+        states = {}
+        from_cache = set()
+        for _, neuron, _, _, _, _, candidates in pairs:
+            for coord in candidates:
+                if coord is None:
+                    continue
+                if coord in states:
+                    self.stats['deduplicated'] += 1  # shared with another connection this pass
+                    continue
+                dom_state = index.cached_state(coord)
+                if dom_state is not None:
+                    from_cache.add(coord)
+                else:
+                    self.stats['reads'] += 1
+                    try:
+                        dom_state = neuron._read_dom_state(coord, record_hash=False)
+                    except Exception:
+                        dom_state = None
+                states[coord] = dom_state if dom_state and dom_state.get('exists', False) else None
+        
+        # 3. Encode per neuron in one batch, at the connection's position
+        batches = {}  # neuron_id -> (neuron, jobs, [(pair_idx, candidate_idx)])
+        for pair_idx, (_, neuron, _, _, _, pos_idx, candidates) in enumerate(pairs):
+            neuron_batch = batches.setdefault(neuron.id, (neuron, [], []))
+            for candidate_idx, coord in enumerate(candidates):
+                if coord is not None and states.get(coord) is not None:
+                    neuron_batch[1].append((states[coord], neuron.current_pattern_idx, pos_idx))
+                    neuron_batch[2].append((pair_idx, candidate_idx))
+        observations = [[None] * len(pair[6]) for pair in pairs]
+        for neuron, jobs, targets in batches.values():
+            for (pair_idx, candidate_idx), vector in zip(targets, neuron._encode_observations(jobs)):
+                observations[pair_idx][candidate_idx] = vector
+        
+        # 4. Score, confirm a cache-scored winner live, record
+        confirmed = {}
+        results = []
+        for pair_idx, (membrane, neuron, conn, P_i_k, position_idx, _, candidates) in enumerate(pairs):
+            self.stats['pairs_scored'] += 1
+            similarities = self.MembraneState.score_candidates(P_i_k, position_idx, observations[pair_idx])
+            best = None
+            for best_idx in np.argsort(-similarities, kind='stable'):
+                coord = candidates[best_idx]
+                if similarities[best_idx] <= 0 or coord is None or observations[pair_idx][best_idx] is None:
+                    break
+                if coord in from_cache:
+                    if coord not in confirmed:
+                        confirmed[coord] = neuron._confirm_coordinate(coord, record_hash=False)
+                    if not confirmed[coord]:
+                        continue
+                best = (coord, float(similarities[best_idx]))
+                break
+            results.append((membrane, conn, best))
+        
+        processed_any = False
+        with self._lock:
+            now = time.monotonic()
+            for membrane, conn, best in results:
+                if best is None:
+                    self.stats['unresolved'] += 1
+                    continue
+                if conn['processed'] or membrane.connections.get(conn['neuron_id']) is not conn:
+                    continue  # re-registered / removed while we scored
+                membrane.resolve(conn['neuron_id'], *best)
+                latency_ms = (now - conn['registered_at']) * 1000
+                self.reroute_latency_ms.append(latency_ms)
+                self.reroute_latency_max_ms = max(self.reroute_latency_max_ms, latency_ms)
+                self.similarity_histogram[self._similarity_bin(best[1])] += 1
+                self.stats['resolved'] += 1
+                processed_any = True
+        
+        self.stats['passes'] += 1
+        self.last_pass_ms = (time.perf_counter() - started) * 1000
+        self.pass_ms_total += self.last_pass_ms
         return processed_any
         
     def get_reroute(self, neuron_id, void_coordinate):
         """Get reroute result for a neuron"""
-        if void_coordinate in self.membranes:
-            membrane = self.membranes[void_coordinate]
-            if neuron_id in membrane.connections:
-                conn = membrane.connections[neuron_id]
-                if conn['processed']:
-                    return {
-                        'reroute_to': conn['reroute_to'],
-                        'similarity': conn['similarity']
-                    }
+        with self._lock:
+            if void_coordinate in self.membranes:
+                membrane = self.membranes[void_coordinate]
+                if neuron_id in membrane.connections:
+                    conn = membrane.connections[neuron_id]
+                    if conn['processed']:
+                        return {
+                            'reroute_to': conn['reroute_to'],
+                            'similarity': conn['similarity']
+                        }
         return None
+    
+    # ===== METRICS =====
+    
+    def _similarity_bin(self, similarity: float) -> str:
+        edges = self.SIMILARITY_BINS
+        for low, high in zip(edges, edges[1:]):
+            if similarity < high:
+                return f"{low}-{high}"
+        return f"{edges[-1]}+"
+    
+    def get_metrics(self) -> Dict:
+        latencies = sorted(self.reroute_latency_ms)
+        with self._lock:
+            active = sum(1 for membrane in self.membranes.values() if membrane.port)
+        return {
+            'running': self.running,
+            'membranes': len(self.membranes),
+            'active_membranes': active,
+            'pending_voids': self.pending_count(),
+            'reroute_latency_ms': {
+                'count': len(latencies),
+                'p50': latencies[len(latencies) // 2] if latencies else 0.0,
+                'p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] if latencies else 0.0,
+                'max': self.reroute_latency_max_ms
+            },
+            'similarity_histogram': dict(self.similarity_histogram),
+            'last_pass_ms': self.last_pass_ms,
+            'mean_pass_ms': self.pass_ms_total / self.stats['passes'] if self.stats['passes'] else 0.0,
+            **self.stats
+        }
         
     class MembraneState:
         def __init__(self, void_coordinate):
@@ -1971,112 +2223,49 @@ class VoidSystem:
                 **neuron_data,
                 'processed': False,
                 'reroute_to': None,
-                'similarity': 0.0
+                'similarity': 0.0,
+                'registered_at': time.monotonic()
             }
+        
+        def remove_neuron(self, neuron_id):
+            self.connections.pop(neuron_id, None)
+            self._settle()
             
-        def process_neuron(self, neuron_id, neuron):
-            """Process rerouting for specific neuron"""
-            if neuron_id not in self.connections:
-                return False
-                
+        def resolve(self, neuron_id, reroute_to, similarity):
+            """Record a neuron's reroute"""
             conn = self.connections[neuron_id]
-            
-            # Get neuron's current expectation matrix
-            if not hasattr(neuron, 'P_permuted') or neuron.P_permuted is None:
-                # Fallback to original P matrix
-                P_i_k = neuron.P_matrix.copy()
-            else:
-                P_i_k = neuron.P_permuted.copy()  # 5×25
-            
-            # Get position index
-            position_idx = neuron.neighbor_positions.index(conn['input_direction'])
-            
-            # Find 4 candidate coordinates
-            candidates = self._find_candidates(neuron, conn)
-            
-            # Find best reroute
-            result = self._find_best_reroute(neuron, P_i_k, position_idx, candidates)
-            
-            if result:
-                conn['processed'] = True
-                conn['reroute_to'] = result['best_candidate']
-                conn['similarity'] = result['best_similarity']
-                
-                # If all connections processed, return to waiting state
-                if all(c['processed'] for c in self.connections.values()):
-                    self.port = False
-                    self.void = True
-                    
-                return True
-                
-            return False
-            
-        def _find_best_reroute(self, neuron, P_i_k, position_idx, candidates):
-            """Find best reroute using simplified T() transform flow"""
-            if not candidates:
-                return None
-                
-            # Step 1: Transform original expectations to 87D
-            P_87d = neuron.T(P_i_k)  # 5×87
-            original_expectation_87d = P_87d[position_idx]  # 1×87
-            
-            # Step 2: Process each candidate
-            profiles = []
-            valid_candidates = []
-            
-            for i, candidate_coord in enumerate(candidates):
-                if candidate_coord is None:
-                    profiles.append(np.zeros(87))
-                    valid_candidates.append(None)
+            conn['processed'] = True
+            conn['reroute_to'] = reroute_to
+            conn['similarity'] = similarity
+            self._settle()
+        
+        def _settle(self):
+            # If all connections processed, return to waiting state
+            if all(c['processed'] for c in self.connections.values()):
+                self.port = False
+                self.void = True
+            
+        @staticmethod
+        def score_candidates(P_i_k, position_idx, observations):
+            """
+            sim_k = T(P_m)[position] · T(P)[position], P_m holding candidate k's observation
+            at the void's row. Candidates without an observation score 0.
+            """
+            original_expectation_87d = relational_transform(P_i_k)[position_idx]  # 1×87
+            similarities = np.zeros(len(observations))
+            for k, obs_vector in enumerate(observations):
+                if obs_vector is None:
                     continue
-                    
-                try:
-                    # Get observation
-                    obs_vector = neuron._observe_coordinate(candidate_coord)  # 1×25
-                    
-                    # Create modified matrix P_m
-                    P_m = P_i_k.copy()  # 5×25
-                    P_m[position_idx] = obs_vector  # Replace with observation
-                    
-                    # Transform modified matrix
-                    Q = neuron.T(P_m)  # 5×87
-                    
-                    # Extract profile for this position
-                    profile = Q[position_idx]  # 1×87
-                    
-                    profiles.append(profile)
-                    valid_candidates.append(candidate_coord)
-                    
-                except Exception as e:
-                    # Observation failed
-                    profiles.append(np.zeros(87))
-                    valid_candidates.append(None)
-                    
-            if not valid_candidates or all(c is None for c in valid_candidates):
-                return None
-                
-            # Step 3: Compute similarities
-            profiles_matrix = np.array(profiles)  # 4×87
-            similarities = np.dot(profiles_matrix, original_expectation_87d)  # Shape: (4,)
-            
-            # Step 4: Select best candidate
-            best_idx = np.argmax(similarities)
-            best_similarity = similarities[best_idx]
-            
-            if best_similarity > 0 and valid_candidates[best_idx] is not None:
-                return {
-                    'best_candidate': valid_candidates[best_idx],
-                    'best_similarity': float(best_similarity),
-                    'all_similarities': similarities.tolist(),
-                    'candidates': valid_candidates
-                }
-                
-            return None
+                P_m = P_i_k.copy()  # 5×25
+                P_m[position_idx] = obs_vector  # Replace with observation
+                similarities[k] = np.dot(relational_transform(P_m)[position_idx], original_expectation_87d)
+            return similarities
             
         def _find_candidates(self, neuron, connection):
-            """Find 4 candidate coordinates around void"""
+            """Find 4 candidate coordinates around void (known coordinates only - no browser lookups)"""
             void_coord = self.coordinate
-            excluded = {void_coord, connection['neuron_coord']}
+            index = neuron.axon_network.coordinate_index
+            excluded = {void_coord, connection.get('neuron_coordinate')}
             
             # Exclude other reroutes from this membrane
             for other_id, other_conn in self.connections.items():
@@ -2098,14 +2287,9 @@ class VoidSystem:
                         continue
                         
                     # Check if coordinate has element
-                    try:
-                        xpath = neuron._coord_to_xpath(candidate)
-                        element = neuron.dom_driver.find_element(By.XPATH, xpath)
-                        if element:
-                            candidates.append(candidate)
-                            excluded.add(candidate)
-                    except:
-                        excluded.add(candidate)
+                    if index.exists(candidate):
+                        candidates.append(candidate)
+                    excluded.add(candidate)
                         
                     if len(candidates) == 4:
                         break
@@ -2137,20 +2321,560 @@ class VoidSystem:
                 return None
                 
             return tuple(coord)
+
+class OscillationDetector:
+    """
+    Watches a neuron's recent (pattern, confident) history for flip-flopping.
+    A short repeating period or a high flip rate marks the neuron as oscillating;
+    while it is, pattern switches need an extra hysteresis margin and the b update
+    is damped. It calms down after `cooldown` cycles without a flip.
+    """
     
-          
+    def __init__(self, window: int = 20, max_period: int = 4, min_repeats: int = 2,
+                 flip_rate_threshold: float = 0.3, hysteresis_margin: float = 0.15,
+                 damping: float = 0.5, cooldown: int = 10):
+        self.window = window
+        self.max_period = max_period
+        self.min_repeats = min_repeats
+        self.flip_rate_threshold = flip_rate_threshold
+        self.hysteresis_margin = hysteresis_margin
+        self.damping = damping  # weight of the new b in a damped update
+        self.cooldown = cooldown
+        
+        self.history = deque(maxlen=window)  # (pattern, confident)
+        self.flips = deque(maxlen=window)    # 1 if the state changed that cycle
+        self.total_flips = 0
+        self.oscillating = False
+        self.period = None
+        self.detections = 0
+        self._calm_cycles = 0
+    
+    @property
+    def flip_rate(self) -> float:
+        return sum(self.flips) / len(self.flips) if self.flips else 0.0
+    
+    def record(self, pattern: str, confident: bool) -> bool:
+        """Add one cycle's outcome. Returns True while oscillating."""
+        state = (pattern, confident)
+        flipped = bool(self.history) and self.history[-1] != state
+        self.history.append(state)
+        self.flips.append(1 if flipped else 0)
+        self.total_flips += flipped
+        
+        period = self._detect_limit_cycle()
+        high_rate = len(self.flips) >= self.window // 2 and self.flip_rate >= self.flip_rate_threshold
+        
+        if period is not None or high_rate:
+            if not self.oscillating:
+                self.detections += 1
+            self.oscillating = True
+            self.period = period
+            self._calm_cycles = 0
+        elif self.oscillating:
+            self._calm_cycles = 0 if flipped else self._calm_cycles + 1
+            if self._calm_cycles >= self.cooldown:
+                self.oscillating = False
+                self.period = None
+        return self.oscillating
+    
+    def _detect_limit_cycle(self) -> Optional[int]:
+        """Smallest period p whose last p*min_repeats states repeat exactly"""
+        history = list(self.history)
+        for period in range(2, self.max_period + 1):
+            span = period * self.min_repeats
+            if len(history) < span:
+                break
+            tail = history[-span:]
+            if len(set(tail[:period])) < 2:
+                continue
+            if all(tail[i] == tail[i - period] for i in range(period, span)):
+                return period
+        return None
+    
+    def get_metrics(self) -> Dict:
+        return {
+            'flip_rate': self.flip_rate,
+            'total_flips': self.total_flips,
+            'oscillating': self.oscillating,
+            'period': self.period,
+            'detections': self.detections
+        }
+    
+
+class AdaptiveRateController:
+    """
+    Per-neuron cycle rate. A neuron whose eigen certainty is high and whose
+    b_final and observations have stopped moving backs off exponentially up
+    to a cap; any DOM change or neighbour activity snaps it back to full rate.
+    """
+    
+    def __init__(self, certainty_threshold: float = 0.8, b_delta_threshold: float = 0.01,
+                 observation_delta_threshold: float = 0.05, settle_cycles: int = 3,
+                 max_multiplier: float = 32.0, max_interval: float = 10.0):
+        self.certainty_threshold = certainty_threshold
+        self.b_delta_threshold = b_delta_threshold
+        self.observation_delta_threshold = observation_delta_threshold
+        self.settle_cycles = settle_cycles
+        self.max_multiplier = max_multiplier
+        self.max_interval = max_interval  # never stretch a cadence beyond this (seconds)
+        
+        self.multiplier = 1.0
+        self.settled_streak = 0
+        self._last_b = None
+        self._last_observations = None
+        
+        self.backoffs = 0
+        self.snapbacks = defaultdict(int)  # reason -> count
+        self.last_signals = {}
+    
+    def observe_cycle(self, certainty: float, b_final: np.ndarray, observations: np.ndarray) -> float:
+        """Feed one completed cycle's convergence signals. Returns the new multiplier."""
+        b_delta = (float(np.linalg.norm(b_final - self._last_b)) 
+                   if self._last_b is not None else float('inf'))
+        observation_delta = (float(np.max(np.abs(observations - self._last_observations)))
+                             if self._last_observations is not None 
+                             and self._last_observations.shape == observations.shape else float('inf'))
+        self._last_b = np.array(b_final, dtype=float)
+        self._last_observations = np.array(observations, dtype=float)
+        
+        settled = (certainty >= self.certainty_threshold and 
+                   b_delta < self.b_delta_threshold and 
+                   observation_delta < self.observation_delta_threshold)
+        self.last_signals = {'certainty': certainty, 'b_delta': b_delta, 
+                             'observation_delta': observation_delta, 'settled': settled}
+        
+        if settled:
+            self.settled_streak += 1
+            if self.settled_streak >= self.settle_cycles and self.multiplier < self.max_multiplier:
+                self.multiplier = min(self.max_multiplier, self.multiplier * 2)
+                self.backoffs += 1
+        else:
+            self.settled_streak = 0
+            self.multiplier = 1.0
+        return self.multiplier
+    
+    def prime(self, b_final: np.ndarray, observations: Optional[np.ndarray]):
+        """Warm start: resume from a checkpoint's baseline, one settled cycle from backing off"""
+        self._last_b = np.array(b_final, dtype=float)
+        self._last_observations = (np.array(observations, dtype=float) 
+                                   if observations is not None else None)
+        self.settled_streak = max(0, self.settle_cycles - 1)
+    
+    def reset(self):
+        self.multiplier = 1.0
+        self.settled_streak = 0
+        self._last_b = None
+        self._last_observations = None
+    
+    def snap_back(self, reason: str) -> bool:
+        """Return to full rate. True if the neuron was backed off."""
+        was_backed_off = self.multiplier > 1.0
+        if was_backed_off:
+            self.snapbacks[reason] += 1
+        self.multiplier = 1.0
+        self.settled_streak = 0
+        return was_backed_off
+    
+    @property
+    def backed_off(self) -> bool:
+        return self.multiplier > 1.0
+    
+    def scale(self, interval: float) -> float:
+        """Stretch a base cadence by the current backoff, capped"""
+        if self.multiplier <= 1.0:
+            return interval
+        return min(interval * self.multiplier, max(interval, self.max_interval))
+    
+    def get_metrics(self) -> Dict:
+        return {
+            'multiplier': self.multiplier,
+            'settled_streak': self.settled_streak,
+            'backoffs': self.backoffs,
+            'snapbacks': dict(self.snapbacks)
+        }
+
+
+class CycleBudget:
+    """
+    Per-cycle time budget, checked at phase boundaries. Optional expensive steps
+    (tensor fallback, reroute search, circuitry / eigen logging) ask allows()
+    first, which compares what is left of the budget with what the step cost last
+    times; if it doesn't fit it is deferred to a later cycle - at most max_deferrals
+    in a row, then it runs anyway so nothing starves. Phase durations and the phase
+    in which a cycle went over budget are counted.
+    """
+    
+    PHASES = ('self_observation', 'competitive_assignment', 'neighbor_observation',
+              'matrix_updates', 'confidence_decision', 'tensor_fallback', 'completion')
+    
+    def __init__(self, budget_ms: float = 250.0, max_deferrals: int = 3,
+                 phase_budgets_ms: Optional[Dict[str, float]] = None):
+        self.budget_ms = budget_ms                       # None / 0 = unbounded
+        self.max_deferrals = max_deferrals
+        self.phase_budgets_ms = phase_budgets_ms or {}   # optional caps per phase
+        
+        self._cycle_start = None
+        self._phase = None
+        self._phase_start = None
+        self._over = False
+        
+        self.phase_ms = {phase: 0.0 for phase in self.PHASES}       # last cycle
+        self.phase_mean_ms = {phase: 0.0 for phase in self.PHASES}  # EMA over cycles
+        self.overruns = defaultdict(int)     # phase -> cycles that crossed a budget during it
+        self.deferred = defaultdict(int)     # step -> times deferred
+        self.forced = defaultdict(int)       # step -> times run over budget after max_deferrals
+        self.step_cost_ms = {}               # step -> EMA of its duration when it ran
+        self._deferral_streak = defaultdict(int)
+        self._requested = set()              # steps that asked allows() this cycle
+        
+        self.cycles = 0
+        self.over_budget_cycles = 0
+        self.last_cycle_ms = 0.0
+        self.max_cycle_ms = 0.0
+        self.recent_cycle_ms = deque(maxlen=200)
+    
+    def start_cycle(self):
+        now = time.perf_counter()
+        self._cycle_start = now
+        self._phase = None
+        self._phase_start = now
+        self._over = False
+        self._requested.clear()
+        for phase in self.PHASES:
+            self.phase_ms[phase] = 0.0
+    
+    def phase(self, name: str):
+        """Phase boundary: close the running phase, start `name`"""
+        self._close_phase()
+        self._phase = name
+        self._phase_start = time.perf_counter()
+    
+    def _close_phase(self):
+        if self._phase is None or self._cycle_start is None:
+            return
+        duration_ms = (time.perf_counter() - self._phase_start) * 1000
+        self.phase_ms[self._phase] = self.phase_ms.get(self._phase, 0.0) + duration_ms
+        
+        if self._phase == 'tensor_fallback':
+            self._record_cost(self._phase, duration_ms)
+        
+        cap = self.phase_budgets_ms.get(self._phase)
+        crossed = not self._over and self.exhausted
+        if crossed or (cap is not None and duration_ms > cap):
+            self.overruns[self._phase] += 1
+        if crossed:
+            self._over = True
+        self._phase = None
+    
+    def end_cycle(self) -> float:
+        self._close_phase()
+        if self._cycle_start is None:
+            return 0.0
+        cycle_ms = self.elapsed_ms
+        self._cycle_start = None
+        
+        # A deferred step that wasn't asked for again is no longer pending
+        for step in list(self._deferral_streak):
+            if step not in self._requested:
+                del self._deferral_streak[step]
+        
+        self.cycles += 1
+        if self._over:
+            self.over_budget_cycles += 1
+        for phase in self.PHASES:
+            self.phase_mean_ms[phase] = 0.9 * self.phase_mean_ms[phase] + 0.1 * self.phase_ms[phase]
+        self.last_cycle_ms = cycle_ms
+        self.max_cycle_ms = max(self.max_cycle_ms, cycle_ms)
+        self.recent_cycle_ms.append(cycle_ms)
+        return cycle_ms
+    
+    @property
+    def elapsed_ms(self) -> float:
+        if self._cycle_start is None:
+            return 0.0
+        return (time.perf_counter() - self._cycle_start) * 1000
+    
+    @property
+    def remaining_ms(self) -> float:
+        if not self.budget_ms:
+            return float('inf')
+        return self.budget_ms - self.elapsed_ms
+    
+    @property
+    def exhausted(self) -> bool:
+        return self.remaining_ms <= 0
+    
+    def _record_cost(self, step: str, duration_ms: float):
+        previous = self.step_cost_ms.get(step)
+        self.step_cost_ms[step] = duration_ms if previous is None else 0.7 * previous + 0.3 * duration_ms
+    
+    def record(self, step: str, started: float):
+        """Record a step's cost (started = time.perf_counter() before it ran)"""
+        self._record_cost(step, (time.perf_counter() - started) * 1000)
+    
+    def allows(self, step: str, estimate_ms: float = 0.0) -> bool:
+        """May an optional step run now? False = defer it to a later cycle"""
+        self._requested.add(step)
+        if self.remaining_ms > self.step_cost_ms.get(step, estimate_ms):
+            self._deferral_streak[step] = 0
+            return True
+        if self._deferral_streak[step] >= self.max_deferrals:
+            self._deferral_streak[step] = 0
+            self.forced[step] += 1
+            return True
+        self._deferral_streak[step] += 1
+        self.deferred[step] += 1
+        return False
+    
+    def is_deferred(self, step: str) -> bool:
+        """Step was deferred last cycle and is still wanted (cleared once a cycle doesn't ask for it)"""
+        return self._deferral_streak[step] > 0
+    
+    def cycle_percentile(self, q: float) -> float:
+        recent = sorted(self.recent_cycle_ms)
+        if not recent:
+            return 0.0
+        return recent[min(len(recent) - 1, int(len(recent) * q))]
+    
+    def get_metrics(self) -> Dict:
+        return {
+            'budget_ms': self.budget_ms,
+            'cycles': self.cycles,
+            'over_budget_cycles': self.over_budget_cycles,
+            'last_cycle_ms': self.last_cycle_ms,
+            'p95_cycle_ms': self.cycle_percentile(0.95),
+            'max_cycle_ms': self.max_cycle_ms,
+            'phase_mean_ms': dict(self.phase_mean_ms),
+            'overruns': dict(self.overruns),
+            'deferred': dict(self.deferred),
+            'forced': dict(self.forced),
+            'step_cost_ms': dict(self.step_cost_ms)
+        }
+
+
+# ===== PURE CYCLE MATH (module level - no neuron state) =====
+
+def relational_transform(vectors_array: np.ndarray) -> np.ndarray:
+    """
+    Transform n 25D vectors to n 87D binary vectors.
+    
+    Args:
+        vectors_array: Shape (n, 25) - n vectors to transform together
+    
+    Returns:
+        Shape (n, 87) - binary relational encoding
+    """
+    n = vectors_array.shape[0]
+    output = np.zeros((n, 87), dtype=np.float32)
+    
+    # First 15 dimensions: combination features (already binary 0/1)
+    output[:, :15] = vectors_array[:, 10:25]
+    
+    # For each base dimension d (0-8)
+    for d in range(9):
+        # Get values for this dimension across all vectors
+        dim_values = vectors_array[:, d]
+    
+        # For each vector i
+        for i in range(n):
+            value_i = dim_values[i]
+    
+            # === SHARING QUESTIONS (4 flags) ===
+            # Count how many vectors share this EXACT value
+            same_mask = np.abs(dim_values - value_i) < 1e-6
+            same_count = np.sum(same_mask)
+    
+            # Q1: ≥4 patterns share this value?
+            if same_count >= 4:
+                output[same_mask, 15 + 8*d + 0] = 1
+    
+            # Q2: ≥3 patterns share this value?
+            if same_count >= 3:
+                output[same_mask, 15 + 8*d + 1] = 1
+    
+            # Q3: Exactly 2 patterns share this value?
+            if same_count == 2:
+                output[same_mask, 15 + 8*d + 2] = 1
+    
+            # Q4: Exactly 1 pattern has this value (unique)?
+            if same_count == 1:
+                output[same_mask, 15 + 8*d + 3] = 1
+    
+            # === OPTIONALITY QUESTIONS (4 flags) ===
+            # Only if value = 0.5 (asymmetric: 0.5 = 1, but 1 ≠ 0.5)
+            if abs(value_i - 0.5) < 1e-6:
+                # Count how many vectors have 0.5 in this dimension
+                optional_mask = np.abs(dim_values - 0.5) < 1e-6
+                optional_count = np.sum(optional_mask)
+    
+                # Q5: ≥4 patterns have 0.5?
+                if optional_count >= 4:
+                    output[optional_mask, 15 + 8*d + 4] = 1
+    
+                # Q6: ≥3 patterns have 0.5?
+                if optional_count >= 3:
+                    output[optional_mask, 15 + 8*d + 5] = 1
+    
+                # Q7: Exactly 2 patterns have 0.5?
+                if optional_count == 2:
+                    output[optional_mask, 15 + 8*d + 6] = 1
+    
+                # Q8: Exactly 1 pattern has 0.5?
+                if optional_count == 1:
+                    output[optional_mask, 15 + 8*d + 7] = 1
+            # If value ≠ 0.5, optionality flags remain 0 (asymmetric)
+    
+    return output
+
+
+def compute_D_87d(P_matrix: np.ndarray, O_matrix: np.ndarray) -> np.ndarray:
+    """D = T(P) @ T(W_p)^T, W_p holding only the observed (non-zero) neighbour rows"""
+    P_i_k_87d = relational_transform(P_matrix)  # 5×87
+    
+    # Get neighbor observations in 87D
+    W_p_87d = np.zeros((5, 87))
+    observed_indices = [i for i in range(5) if np.any(O_matrix[i] != 0)]
+    if observed_indices:
+        transformed_observed = relational_transform(np.array([O_matrix[i] for i in observed_indices]))
+        for idx, row_idx in enumerate(observed_indices):
+            W_p_87d[row_idx] = transformed_observed[idx]
+    
+    return P_i_k_87d @ W_p_87d.T  # 5×5
+
+
+def definition_matches_dom(definition: str, tag: str, attrs: Dict, 
+                           states: List[str], text: str, value: str) -> bool:
+    """Check if a definition matches DOM state"""
+    # Tag matches
+    if definition == tag:
+        return True
+    
+    # State matches
+    if definition in states:
+        return True
+    
+    # Attribute value matches
+    if definition in attrs.values():
+        return True
+    
+    # Input type variations
+    if definition.startswith('input_') and tag == 'input':
+        expected_type = definition.replace('input_', '')
+        return attrs.get('type') == expected_type
+    
+    # Role matches
+    if definition.startswith('role_') and attrs.get('role'):
+        expected_role = definition.replace('role_', '')
+        return attrs.get('role') == expected_role
+    
+    # Data attribute matches
+    if definition.startswith('data_') and definition.replace('_', '-') in attrs:
+        return True
+    
+    return False
+
+
+def dom_to_vocabulary(dom_state: Dict) -> Dict['EnhancedGrandClass', Set[str]]:
+    """
+    Map DOM observation to our attribute vocabulary.
+    Simplified version - in production would use full EnhancedGrandClass definitions.
+    """
+    element_vectors = defaultdict(set)
+    all_definitions = EnhancedGrandClass.get_base_attribute_definitions()
+    
+    # Extract from DOM
+    tag = dom_state.get('tag', '')
+    attrs = dom_state.get('attributes', {})
+    states = dom_state.get('states', [])
+    text = dom_state.get('text', '')
+    value = dom_state.get('value', '')
+    
+    # Check each grand class
+    for gc, definitions in all_definitions.items():
+        for definition in definitions:
+            if definition_matches_dom(definition, tag, attrs, states, text, value):
+                element_vectors[gc].add(definition)
+    
+    return element_vectors
+
+
+def encode_observation(dom_state: Dict, expectation_dict: Dict) -> np.ndarray:
+    """25D observation vector: AttributeExpression.evaluate() per dimension (0.0 or 1.0)"""
+    vector = np.zeros(25)
+    if not dom_state.get('exists', False):
+        return vector
+    
+    our_attributes = dom_to_vocabulary(dom_state)
+    for i, dimension in enumerate(EnhancedGrandClass.get_all_dimensions()):
+        if dimension in expectation_dict:
+            vector[i] = expectation_dict[dimension].evaluate(our_attributes.get(dimension, set()))
+    return vector
+
+
+class NeuronTemplate:
+    """
+    Coordinate-independent construction state: the ROSE library, expectation
+    tensors / dictionaries, per-pattern B matrices and T_exp. Every neuron derives
+    these identically, so a spawn batch builds them once and shares them read-only.
+    """
+    
+    # Arrays handed out by reference - frozen so an accidental in-place write fails loudly
+    SHARED_ARRAYS = ('expectation_tensor', 'pattern_sum_expectations', 
+                     'self_expectation_matrix', 'neighbor_expectation_tensor', 'T_exp')
+    
+    _shared = None
+    
+    def __init__(self):
+        proto = Neuron.__new__(Neuron)
+        proto.coordinate = ()
+        proto.rose = ROSE(initial_pattern="UNKNOWN", coordinate=())
+        proto._extract_all_expectations_once()
+        proto._init_T_exp()
+        
+        self.rose = proto.rose
+        self.expectation_dicts = proto.expectation_dicts
+        self.B_matrices_dict = proto.B_matrices_dict  # copied by neurons before use
+        for name in self.SHARED_ARRAYS:
+            array = getattr(proto, name)
+            array.setflags(write=False)
+            setattr(self, name, array)
+    
+    @classmethod
+    def shared(cls) -> 'NeuronTemplate':
+        """Process-wide template (the pattern library is static)"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+    
+    def apply(self, neuron):
+        """Point a neuron's expectation state at the shared copies"""
+        neuron.rose = self.rose
+        neuron.expectation_dicts = self.expectation_dicts
+        neuron.B_matrices_dict = self.B_matrices_dict
+        for name in self.SHARED_ARRAYS:
+            setattr(neuron, name, getattr(self, name))
+
+
 class Neuron:
     
     pattern_names = ["DATA_INPUT", "ACTION_ELEMENT", "CONTEXT_ELEMENT", 
                         "STRUCTURAL", "UNKNOWN"]
     position_names = ["self", "parent", "up", "down", "left", "right"]
+    # Broadcasts from the neighbourhood that count as neighbour activity
+    NEIGHBOUR_AXON_TYPES = {'PATTERN_CHANGE', 'NEURON_CREATED', 'DOM_EVENT', 
+                            'VOID_SIGNAL', 'VOID_BROADCAST'}
+    # Seconds a DOM / pattern change keeps the neuron scheduled as active
+    ACTIVE_WINDOW = 2.0
+    # Weight kept on an adopted b (checkpoint) in the first β update after adopting it
+    B_CARRY_WEIGHT = 0.5
         
     """
     Autonomous DOM Neural Unit - COMPLETE IMPLEMENTATION
     Extracts everything once, uses for all operations with proper logging
     """
     def __init__(self, coordinate: Tuple[int, ...], priori_pattern: str, 
-                    dom_driver: Any, axon_network: Any):
+                    dom_driver: Any, axon_network: Any, 
+                    template: 'NeuronTemplate' = None, register: bool = True):
             # Core identity
             self.coordinate = coordinate
             self.id = self._generate_id()
@@ -2161,17 +2885,20 @@ class Neuron:
             # FIX: Set current_pattern BEFORE calling axon_network.register_neuron
             self.current_pattern = priori_pattern  
             self.current_pattern_idx = self._get_pattern_idx(priori_pattern)
+            self.priori_pattern = priori_pattern  # fallback when a checkpoint turns out stale
             
-            # Now register with axon_network
-            self.axon_network.register_neuron(self)
+            # Now register with axon_network (spawn_batch registers the whole batch at once)
+            if register:
+                self.axon_network.register_neuron(self)
             
             self.learning_mode = "Normal" 
             # ===== PHASE 0: ONE-TIME EXTRACTION =====
             print(f"🧠 Neuron {self.id} initializing at {coordinate} as {priori_pattern}")
             
 
-            # Create ROSE for dictionary definitions (ONCE)
-            self.rose = ROSE(initial_pattern=priori_pattern, coordinate=coordinate)
+            # Create ROSE for dictionary definitions (ONCE) - a batch template already has one
+            if template is None:
+                self.rose = ROSE(initial_pattern=priori_pattern, coordinate=coordinate)
             
             #extraction parameters 
             self.position_names = ["self", "parent", "up", "down", "left", "right"]
@@ -2193,8 +2920,11 @@ class Neuron:
             self.eigen_gamma_v = None        # v_γ from T_gamma 
             self.eigen_zeta = None           # ζ from tensor fallback
             
-            # Extract EVERYTHING once
-            self._extract_all_expectations_once()
+            # Extract EVERYTHING once (or share the batch template's read-only copy)
+            if template is None:
+                self._extract_all_expectations_once()
+            else:
+                template.apply(self)
             
             self.membrane_waiting_for = None  # Void coordinate we're waiting on
             self.membrane_reroutes = {}  # position -> rerouted coordinate
@@ -2204,7 +2934,8 @@ class Neuron:
 
             # Initialize matrices from extracted data
             self._initialize_matrices_from_extracted_data()
-            self.T_exp = self._init_T_exp()
+            if template is None:
+                self.T_exp = self._init_T_exp()
             self.T_obs = None 
             
 
@@ -2215,6 +2946,8 @@ class Neuron:
             self.eigen_beta_v = None         # Dominant eigenvector for B*
             self.b_initial = np.array([0.2, 0.2, 0.2, 0.2, 0.2])  # Exact as specified
             self.b_final = self.b_initial.copy()
+            self.b_carry = False             # next β update stays close to an adopted b
+            self._seed_from_population_prior()  # B / b from same-pattern neurons, if enabled
             
             # 87D transformation storage
             self.S_matrix_87d = None          # T(E(X)) = S (expectation matrix in 87D)
@@ -2246,14 +2979,92 @@ class Neuron:
             self.b_vectors_history = deque(maxlen=10)
             self.B_matrices_history = deque(maxlen=10)
             
+            # ===== NEIGHBOURHOOD FINGERPRINT (cycle fast path) =====
+            self._cycle_dom_hashes = []          # element hashes seen by this cycle's observations
+            self.neighbourhood_fingerprint = None
+            self.fast_path_cycles = 0
+            self.full_path_cycles = 0
+            
+            # ===== OSCILLATION DAMPING =====
+            self.oscillation_detector = OscillationDetector()
+            
+            # ===== ADAPTIVE CYCLE RATE =====
+            self.rate_controller = AdaptiveRateController()
+            
+            # ===== CYCLE BUDGET (optional steps deferred once a cycle runs long) =====
+            self.cycle_budget = CycleBudget(getattr(axon_network, 'cycle_budget_ms', 250.0))
+            self.eigen_certainty = 0.0
+            self.last_dom_hash = None
+            self.wake_callback = None  # set by the scheduler - makes this neuron due now
+            
+            # ===== WARM START / TIME TO STEADY STATE =====
+            self.warm_started = False
+            self.checkpoint_dom_hash = None  # element hash the restored state was learned against
+            self.spawned_at = time.time()
+            self.spawn_cycle = 0
+            self.steady_after = None         # seconds from spawn (or restore) to first settle
+            self.steady_cycles = None
+            
+            # ===== NEIGHBOURHOOD SUBSCRIPTION =====
+            # Broadcasts from siblings (and their subtrees) land in our inbox by reference
+            self.neighbour_activity = 0
+            self.neighbour_patterns = {}  # sibling neuron_id -> last pattern it broadcast
+            self.neighbour_subscription = None
+            if register:
+                self._subscribe_neighbourhood()
+            
             # ===== PUBLIC NEXUS INTERFACE =====
             self.monitoring_active = False
             self.last_activity = time.time()
             
-            # Fire creation axon
-            self._fire_creation_axon()
+            # Fire creation axon (batch members fire once the batch is registered)
+            if register:
+                self._fire_creation_axon()
             print(f"  ✓ Neuron initialized with exact flow specification")
 
+    def _subscribe_neighbourhood(self):
+        if hasattr(self.axon_network, 'subscribe'):
+            self.neighbour_subscription = self.axon_network.subscribe(
+                f"neuron:{self.id}",
+                axon_types=self.NEIGHBOUR_AXON_TYPES,
+                coordinate_prefix=self.coordinate[:-1],
+                ignore_source=self.id,
+                maxlen=64,
+                notify=self._on_neighbour_axon
+            )
+
+    @classmethod
+    def spawn_batch(cls, specs: List[Tuple[Tuple[int, ...], str]], dom_driver: Any, 
+                    axon_network: Any, template: 'NeuronTemplate' = None,
+                    checkpoints: Dict[Tuple[int, ...], Dict] = None) -> List['Neuron']:
+        """
+        Create neurons for [(coordinate, priori_pattern)] sharing one template.
+        The batch is registered in a single network operation before any
+        NEURON_CREATED fires, so neighbours see a consistent registry. Members
+        subscribe after their creation axons fire, so a batch of siblings does
+        not fan its own announcements out to itself. Checkpointed coordinates
+        are restored before registration so the registry sees the learned pattern.
+        """
+        template = template or NeuronTemplate.shared()
+        seen = set()
+        neurons = []
+        for coordinate, pattern in specs:
+            if coordinate in seen:
+                continue
+            seen.add(coordinate)
+            neuron = cls(coordinate, pattern, dom_driver, axon_network,
+                         template=template, register=False)
+            if checkpoints and coordinate in checkpoints:
+                neuron.restore_state(checkpoints[coordinate])
+            neurons.append(neuron)
+        
+        axon_network.register_neurons(neurons)
+        for neuron in neurons:
+            neuron._fire_creation_axon()
+        for neuron in neurons:
+            neuron._subscribe_neighbourhood()
+        return neurons
+
 
     def _try_observe_with_locking(self, position: str, coordinate: Tuple) -> Optional[np.ndarray]:
         """Try to observe coordinate with locking, returns observation or None if locked"""
@@ -2283,9 +3094,7 @@ class Neuron:
         
         # We have the lock, proceed with observation
         try:
-            xpath = self._coord_to_xpath(coordinate)
-            element = self.dom_driver.find_element(By.XPATH, xpath)
-            dom_state = self._observe_element(element)
+            dom_state = self._read_dom_state(coordinate)
             
             if dom_state.get('exists', False):
                 obs_vector = self._dom_state_to_observation_vector(
@@ -2351,77 +3160,8 @@ class Neuron:
         
 
     def T(self, vectors_array: np.ndarray) -> np.ndarray: 
-        """
-        
-        Transform n 25D vectors to n 87D binary vectors.
-        
-        Args:
-            vectors_array: Shape (n, 25) - n vectors to transform together
-        
-        Returns:
-            Shape (n, 87) - binary relational encoding
-        """
-        n = vectors_array.shape[0]
-        output = np.zeros((n, 87), dtype=np.float32)
-        
-        # First 15 dimensions: combination features (already binary 0/1)
-        output[:, :15] = vectors_array[:, 10:25]
-        
-        # For each base dimension d (0-8)
-        for d in range(9):
-            # Get values for this dimension across all vectors
-            dim_values = vectors_array[:, d]
-            
-            # For each vector i
-            for i in range(n):
-                value_i = dim_values[i]
-                
-                # === SHARING QUESTIONS (4 flags) ===
-                # Count how many vectors share this EXACT value
-                same_mask = np.abs(dim_values - value_i) < 1e-6
-                same_count = np.sum(same_mask)
-                
-                # Q1: ≥4 patterns share this value?
-                if same_count >= 4:
-                    output[same_mask, 15 + 8*d + 0] = 1
-                
-                # Q2: ≥3 patterns share this value?
-                if same_count >= 3:
-                    output[same_mask, 15 + 8*d + 1] = 1
-                
-                # Q3: Exactly 2 patterns share this value?
-                if same_count == 2:
-                    output[same_mask, 15 + 8*d + 2] = 1
-                
-                # Q4: Exactly 1 pattern has this value (unique)?
-                if same_count == 1:
-                    output[same_mask, 15 + 8*d + 3] = 1
-                
-                # === OPTIONALITY QUESTIONS (4 flags) ===
-                # Only if value = 0.5 (asymmetric: 0.5 = 1, but 1 ≠ 0.5)
-                if abs(value_i - 0.5) < 1e-6:
-                    # Count how many vectors have 0.5 in this dimension
-                    optional_mask = np.abs(dim_values - 0.5) < 1e-6
-                    optional_count = np.sum(optional_mask)
-                    
-                    # Q5: ≥4 patterns have 0.5?
-                    if optional_count >= 4:
-                        output[optional_mask, 15 + 8*d + 4] = 1
-                    
-                    # Q6: ≥3 patterns have 0.5?
-                    if optional_count >= 3:
-                        output[optional_mask, 15 + 8*d + 5] = 1
-                    
-                    # Q7: Exactly 2 patterns have 0.5?
-                    if optional_count == 2:
-                        output[optional_mask, 15 + 8*d + 6] = 1
-                    
-                    # Q8: Exactly 1 pattern has 0.5?
-                    if optional_count == 1:
-                        output[optional_mask, 15 + 8*d + 7] = 1
-                # If value ≠ 0.5, optionality flags remain 0 (asymmetric)
-        
-        return output
+        """Transform n 25D vectors to n 87D binary vectors (see relational_transform)"""
+        return relational_transform(vectors_array)
 
 
     #Tensor fallback array construction 
@@ -2436,10 +3176,13 @@ class Neuron:
         # Step 1: Collect 5x6x25 observation tensor
         O_25d = np.zeros((5, 6, 25))
         
-        # Process any pending voids first
+        # Process any pending voids first (membrane engine, or inline within the cycle budget)
         if hasattr(self, 'membrane_waiting') and self.membrane_waiting:
             if hasattr(self.axon_network, 'void_system'):
-                self.axon_network.void_system.process_voids()
+                self._request_void_processing()
+        
+        encode_jobs = []  # (dom_state, pattern_idx, pos_idx)
+        observed = {}     # coordinate -> dom_state or the exception - the DOM is read once per sweep
         
         # For each pattern
         for pattern_idx, pattern_name in enumerate(self.pattern_names):
@@ -2489,20 +3232,20 @@ class Neuron:
                     continue
                     
                 try:
-                    # Observe element using this pattern's expectations
-                    xpath = self._coord_to_xpath(coord_to_observe)
-                    element = self.dom_driver.find_element(By.XPATH, xpath)
-                    dom_state = self._observe_element(element)
+                    # Observe element (shared by every pattern), encoded with this pattern's expectations
+                    dom_state = observed.get(coord_to_observe)
+                    if dom_state is None:
+                        try:
+                            dom_state = observed[coord_to_observe] = self._read_dom_state(coord_to_observe)
+                        except Exception as e:
+                            observed[coord_to_observe] = e
+                            raise
+                    elif isinstance(dom_state, Exception):
+                        raise dom_state
                     
                     if dom_state.get('exists', False):
-                        # Convert DOM state using this pattern's expectations
-                        obs_vector = self._dom_state_to_observation_vector(
-                            dom_state, 
-                            position, 
-                            pattern_idx,
-                            expectation_row=None
-                        )
-                        O_25d[pattern_idx, pos_idx, :] = obs_vector
+                        # Converted with this pattern's expectations once the sweep is done
+                        encode_jobs.append((dom_state, pattern_idx, pos_idx))
                         
                         # If this was a reroute, log successful observation
                         if use_reroute and coord_to_observe != coord:
@@ -2538,6 +3281,10 @@ class Neuron:
                     
                     O_25d[pattern_idx, pos_idx, :] = np.zeros(25)
         
+        # Encode every observed (pattern, position) in one pass
+        for (_, pattern_idx, pos_idx), obs_vector in zip(encode_jobs, self._encode_observations(encode_jobs)):
+            O_25d[pattern_idx, pos_idx, :] = obs_vector
+        
         # Step 2: Transform to 5x6x87 relational tensor
         self.T_obs = np.zeros((5, 6, 87))
         
@@ -2571,8 +3318,8 @@ class Neuron:
             return
         
         if hasattr(self.axon_network, 'void_system'):
-            # Process voids in the system
-            self.axon_network.void_system.process_voids()
+            # Process voids in the system (membrane engine, or inline within the cycle budget)
+            self._request_void_processing()
             
             # Check for any completed reroutes
             for position, void_coord in list(self.membrane_waiting.items()):
@@ -2585,6 +3332,16 @@ class Neuron:
                     del self.membrane_waiting[position]
                     print(f"    🌀 Processed reroute for {position}: {reroute['reroute_to']}")
 
+    def _request_void_processing(self):
+        """Wake the membrane engine; without one running, search inline if the cycle budget allows"""
+        void_system = self.axon_network.void_system
+        if void_system.running:
+            void_system.wake()
+        elif self.cycle_budget.allows('reroute_search'):
+            started = time.perf_counter()
+            void_system.process_voids()
+            self.cycle_budget.record('reroute_search', started)
+
     def _try_observe_with_void_handling(self, position, coordinate, is_reroute=False):
         """Try to observe coordinate with void handling"""
         if not coordinate:
@@ -2596,9 +3353,7 @@ class Neuron:
             return np.zeros(25)
         
         try:
-            xpath = self._coord_to_xpath(coordinate)
-            element = self.dom_driver.find_element(By.XPATH, xpath)
-            dom_state = self._observe_element(element)
+            dom_state = self._read_dom_state(coordinate)
             
             if dom_state.get('exists', False):
                 # Successful observation
@@ -2610,6 +3365,9 @@ class Neuron:
                 # If this was a reroute and worked, log success
                 if is_reroute:
                     print(f"    ✅ Successful reroute observation at {position}")
+                else:
+                    # Live neighbour nobody owns yet - ask Nexus to grow into it
+                    self._signal_growth(coordinate, obs_vector, position)
                 
                 return obs_vector
             else:
@@ -2703,9 +3461,7 @@ class Neuron:
             
             try:
                 # Observe with lock
-                xpath = self._coord_to_xpath(coord)
-                element = self.dom_driver.find_element(By.XPATH, xpath)
-                dom_state = self._observe_element(element)
+                dom_state = self._read_dom_state(coord)
                 
                 if dom_state.get('exists', False):
                     obs_vector = self._dom_state_to_observation_vector(
@@ -2758,14 +3514,13 @@ class Neuron:
             'recycling_completion': self.recycling_iteration / self.max_recycling_iterations,
             'permutation_completion': self.permutation_count / self.max_permutations,
             
-            # Timing (if you want to add)
-            'phase_duration': {
-                'self_observation': 0.0,    # Can add timing
-                'competitive_assignment': 0.0,
-                'neighbor_observation': 0.0,
-                'matrix_updates': 0.0,
-                'confidence_decision': 0.0
-            }
+            # Neighbourhood fingerprint fast path
+            'fast_path_cycles': self.fast_path_cycles,
+            'full_path_cycles': self.full_path_cycles,
+            
+            # Timing (last cycle, ms per phase) and budget
+            'phase_duration': dict(self.cycle_budget.phase_ms),
+            'cycle_budget': self.cycle_budget.get_metrics()
         }
 
     def get_pattern_transition_history(self) -> List[Dict]:
@@ -2993,10 +3748,12 @@ class Neuron:
                 eigenvalue = np.abs(eigenvalues[dominant_idx])
                 eigenvector = eigenvectors[:, dominant_idx].real
                 
-                # Normalize eigenvector
+                # Normalize eigenvector (eig's sign is arbitrary - keep it summing positive)
                 norm = np.linalg.norm(eigenvector)
                 if norm > 0:
                     eigenvector = eigenvector / norm
+                if eigenvector.sum() < 0:
+                    eigenvector = -eigenvector
                 
                 return float(eigenvalue), eigenvector
             except:
@@ -3059,8 +3816,9 @@ class Neuron:
         else:
             self.B_matrix = self.B_matrices_dict[self.current_pattern].copy()
         
-        # b vector: pattern bias vector
+        # b vector: pattern bias vector (b_initial carries it into the next β update)
         self.b_vector = np.ones(5) / 5.0
+        self.b_initial = self.b_vector.copy()
         
         # V matrix: eigen uncertainty matrix
         self.V_matrix = np.eye(5)
@@ -3086,9 +3844,7 @@ class Neuron:
         """Get self observation in 25D space"""
         try:
             # Observe self element
-            xpath = self._coord_to_xpath(self.coordinate)
-            element = self.dom_driver.find_element(By.XPATH, xpath)
-            dom_state = self._observe_element(element)
+            dom_state = self._read_dom_state(self.coordinate)
             
             if dom_state.get('exists', False):
                 # Convert to observation vector
@@ -3119,14 +3875,22 @@ class Neuron:
         # Our own coordinate - we should always be able to lock it
         if self.axon_network.lock_coordinate(self.coordinate, self.id):
             try:
-                xpath = self._coord_to_xpath(self.coordinate)
-                element = self.dom_driver.find_element(By.XPATH, xpath)
-                dom_state = self._observe_element(element)
+                dom_state = self._read_dom_state(self.coordinate)
                 
                 if dom_state.get('exists', False):
                     self.self_vector = self._dom_state_to_observation_vector(
                         dom_state, "self", self.current_pattern_idx, None
                     )
+                    
+                    # Own element changed since last cycle?
+                    new_hash = self._dom_state_hash(dom_state)
+                    if self.checkpoint_dom_hash is not None:
+                        if new_hash != self.checkpoint_dom_hash:
+                            self._discard_checkpoint('dom_changed')
+                        self.checkpoint_dom_hash = None
+                    if self.last_dom_hash is not None and new_hash != self.last_dom_hash:
+                        self._handle_hash_change(dom_state, new_hash)
+                    self.last_dom_hash = new_hash
                 else:
                     # Our own element doesn't exist? This is catastrophic
                     print(f"  ⚠️  Our own coordinate {self.coordinate} doesn't exist!")
@@ -3195,9 +3959,7 @@ class Neuron:
             
             # ===== OBSERVE COORDINATE (WITH VOID HANDLING) =====
             try:
-                xpath = self._coord_to_xpath(coord_to_observe)
-                element = self.dom_driver.find_element(By.XPATH, xpath)
-                dom_state = self._observe_element(element)
+                dom_state = self._read_dom_state(coord_to_observe)
                 
                 if not dom_state.get('exists', False):
                     # Element doesn't exist at rerouted coordinate either
@@ -3410,18 +4172,18 @@ class Neuron:
     # ===== Phase 3 : Neighbor processing ====== 
 
 
-    def _observe_coordinate(self, coordinate: Tuple[int, ...]) -> np.ndarray:
-        """Observe a coordinate and return 25D vector"""
+    def _observe_coordinate(self, coordinate: Tuple[int, ...], position: str = "self",
+                            dom_state: Optional[Dict] = None) -> np.ndarray:
+        """Observe a coordinate (or encode an already read dom_state) at a position and return 25D vector"""
         try:
-            xpath = self._coord_to_xpath(coordinate)
-            element = self.dom_driver.find_element(By.XPATH, xpath)
-            dom_state = self._observe_element(element)
+            if dom_state is None:
+                dom_state = self._read_dom_state(coordinate)
             
             if dom_state.get('exists', False):
                 # Use current pattern's expectations
                 return self._dom_state_to_observation_vector(
                     dom_state,
-                    "neighbor",
+                    position,
                     self.current_pattern_idx,
                     expectation_row=None
                 )
@@ -3497,9 +4259,7 @@ class Neuron:
             return np.zeros(25)
         
         try:
-            xpath = self._coord_to_xpath(coord)
-            element = self.dom_driver.find_element(By.XPATH, xpath)
-            dom_state = self._observe_element(element)
+            dom_state = self._read_dom_state(coord)
             
             if dom_state.get('exists', False):
                 obs_vector = self._dom_state_to_observation_vector(
@@ -3591,27 +4351,13 @@ class Neuron:
         else:
             P_matrix = self.P_permuted.copy()
         
-        P_i_k_87d = self.T(P_matrix)  # 5×87
-        
-        # Get neighbor observations in 87D
-        W_p_87d = np.zeros((5, 87))
-        observed_rows = []
-        observed_indices = []
-        
-        for i in range(5):
-            if np.any(self.O_matrix[i] != 0):
-                observed_rows.append(self.O_matrix[i])
-                observed_indices.append(i)
-        
-        if observed_rows:
-            observed_array = np.array(observed_rows)
-            transformed_observed = self.T(observed_array)
-            for idx, row_idx in enumerate(observed_indices):
-                W_p_87d[row_idx] = transformed_observed[idx]
-        
-        # Compute D = P_i_k_87d @ W_p_87d^T
-        self.D_matrix_87d = P_i_k_87d @ W_p_87d.T  # 5×5
+        # D = T(P) @ T(W_p)^T
+        self.D_matrix_87d = compute_D_87d(P_matrix, self.O_matrix)  # 5×5
         
+        self._apply_D_update()
+    
+    def _apply_D_update(self):
+        """B and b update from the current D_matrix_87d (shared by full and fast path)"""
         # B^ = D(B) = D @ B
         B_hat = self.D_matrix_87d @ self.B_matrix
         
@@ -3629,8 +4375,17 @@ class Neuron:
         # b_final_update = Z(β * (β_v @ β_v.T) @ b_initial)
         if self.eigen_beta_v is not None:
             beta_component = self.eigen_beta * np.outer(self.eigen_beta_v, self.eigen_beta_v)
-            b_updated = beta_component @ self.b_initial
-            self.b_final = self._normalize_vector(b_updated)
+            b_updated = self._normalize_vector(beta_component @ self.b_initial)
+            if self.oscillation_detector.oscillating:
+                # Damped step while flip-flopping - stay close to the previous estimate
+                damping = self.oscillation_detector.damping
+                b_updated = self._normalize_vector((1 - damping) * self.b_final + damping * b_updated)
+            elif self.b_carry:
+                # The rank-one β step forgets b - keep part of the adopted estimate for one cycle
+                weight = self.B_CARRY_WEIGHT
+                b_updated = self._normalize_vector(weight * self.b_final + (1 - weight) * b_updated)
+            self.b_carry = False
+            self.b_final = b_updated
         else:
             self.b_final = self.b_initial.copy()
         
@@ -3660,8 +4415,15 @@ class Neuron:
         if dominant_pattern_idx == self.current_pattern_idx:
             self._enter_positional_recycling()
             return "RECYCLING"
-        else:
-            return "TENSOR_FALLBACK"
+        
+        # Oscillating - only run the fallback if the challenger clears the hysteresis margin
+        if self.oscillation_detector.oscillating:
+            lead = self.b_final[dominant_pattern_idx] - current_prob
+            if lead < self.oscillation_detector.hysteresis_margin:
+                print(f"     - Oscillating: holding {self.current_pattern} (lead {lead:.3f})")
+                self._enter_positional_recycling()
+                return "RECYCLING"
+        return "TENSOR_FALLBACK"
 
 
     def _phase5_tensor_fallback(self) -> bool:
@@ -3710,7 +4472,7 @@ class Neuron:
             
             # UNKNOWN decision: switch if another pattern is clearly better
             if dominant_pattern_idx != self.current_pattern_idx:
-                if dominant_prob > current_prob + 0.05:  # 5% better
+                if dominant_prob > current_prob + self._switch_margin():  # 5% better (more while oscillating)
                     print(f"  🔄 UNKNOWN switching to {self.pattern_names[dominant_pattern_idx]}")
                     self._switch_pattern(self.pattern_names[dominant_pattern_idx], dominant_prob)
                     return True  # Pattern changed, restart cycle
@@ -3729,7 +4491,7 @@ class Neuron:
         else:
             # Normal pattern decision logic
             if dominant_pattern_idx != self.current_pattern_idx:
-                if dominant_prob > current_prob + 0.05:
+                if dominant_prob > current_prob + self._switch_margin():
                     print(f"  🔄 Switching to {self.pattern_names[dominant_pattern_idx]}")
                     self._switch_pattern(self.pattern_names[dominant_pattern_idx], dominant_prob)
                     return True
@@ -3745,6 +4507,12 @@ class Neuron:
         return False
         
 
+    def _switch_margin(self) -> float:
+        """Probability lead a challenger needs to take over the pattern"""
+        if self.oscillation_detector.oscillating:
+            return 0.05 + self.oscillation_detector.hysteresis_margin
+        return 0.05
+
     # ===== PHASE 5: CONFIDENCE & DECISION =====
     def _build_enhanced_tensors(self):
         """Build enhanced expectation tensors once during initialization"""
@@ -3794,8 +4562,14 @@ class Neuron:
         # Update confidence score from b_final
         self.confidence_score = self.b_final[self.current_pattern_idx]
         
-        # Log circuitry update
-        self._log_circuitry_update()
+        # Optional pull toward the population prior for our pattern
+        self._blend_population_prior()
+        
+        # Log circuitry update (eigen certainty + full matrix payload) unless over budget
+        if self.cycle_budget.allows('circuitry_log'):
+            started = time.perf_counter()
+            self._log_circuitry_update()
+            self.cycle_budget.record('circuitry_log', started)
         
         self.fire_axon('HEARTBEAT', {
         'neuron_id': self.id,
@@ -3821,18 +4595,53 @@ class Neuron:
         else:
             print(f"  ⚠ D_matrix_87d not available for dot product reporting")
         
+        # Pattern / state flip tracking
+        self.oscillation_detector.record(self.current_pattern, self.confidence_score > 0.5)
+        
+        # Adaptive rate - settled neurons back off into MONITORING
+        self._update_cycle_rate()
+        
         # Update recycling
         self.recycling_iteration += 1
-        self.b_inital = self.b_final #ensure vector is updated 
-        self.process_cycle() #restart cycle -- neuron is destroyed when needed via nexus 
+        self.b_initial = self.b_final.copy()  # next cycle's β update starts from this estimate
+        # Next cycle is dispatched by the Nexus scheduler -- neuron is destroyed when needed via nexus 
         
         print(f"  ✅ Cycle {self.cycle_count} complete - Confidence: {self.confidence_score:.3f}")
         
 
     # ===== DOM OBSERVATION METHODS =====
     
-    def _observe_element(self, element) -> Dict[str, Any]:
-        """Extract DOM attributes via Selenium"""
+    def _read_dom_state(self, coordinate: Tuple[int, ...], record_hash: bool = True) -> Dict[str, Any]:
+        """
+        Look up and observe the element at a coordinate, keeping the network's CoordinateIndex
+        current. record_hash=False reads on someone else's behalf (VoidSystem) without touching
+        this neuron's fast-path fingerprint.
+        """
+        index = getattr(self.axon_network, 'coordinate_index', None)
+        try:
+            element = self.dom_driver.find_element(By.XPATH, self._coord_to_xpath(coordinate))
+        except Exception as e:
+            if index is not None and "no such element" in str(e).lower():
+                index.mark_missing(coordinate)
+            raise
+        dom_state = self._observe_element(element, record_hash)
+        if index is not None and dom_state.get('exists', False):
+            index.observed(coordinate, dom_state)
+        return dom_state
+    
+    def _confirm_coordinate(self, coordinate: Tuple[int, ...], record_hash: bool = True) -> bool:
+        """Live check that a coordinate still holds an element"""
+        try:
+            confirmed = self._read_dom_state(coordinate, record_hash).get('exists', False)
+        except Exception:
+            confirmed = False
+        index = getattr(self.axon_network, 'coordinate_index', None)
+        if index is not None:
+            index.stats['confirmed' if confirmed else 'confirm_failed'] += 1
+        return confirmed
+    
+    def _observe_element(self, element, record_hash: bool = True) -> Dict[str, Any]:
+        """Extract DOM attributes via Selenium (record_hash: count it in this cycle's fingerprint)"""
         try:
             dom_state = {
                 'tag': element.tag_name.lower(),
@@ -3844,8 +4653,12 @@ class Neuron:
                 'id': element.get_attribute('id') or '',
                 'exists': True
             }
+            if record_hash:
+                self._cycle_dom_hashes.append(self._dom_state_hash(dom_state))
             return dom_state
         except Exception as e:
+            if record_hash:
+                self._cycle_dom_hashes.append(None)
             return {'exists': False, 'error': str(e)}
     
     def _extract_attributes(self, element) -> Dict[str, str]:
@@ -3897,86 +4710,27 @@ class Neuron:
         """
         Convert DOM state to 25D observation vector using AttributeExpression.evaluate()
         """
-        vector = np.zeros(25)
-        
         if not dom_state.get('exists', False):
-            return vector
-        
-        # Get expectation dictionary for this position and pattern
-        if position == "self":
-            expectation_dict = self.expectation_dicts[pattern_idx, 0]  # 0 = "self"
-        else:
-            # Get position index (1=parent, 2=up, etc.)
-            pos_idx = self.position_names.index(position)
-            expectation_dict = self.expectation_dicts[pattern_idx, pos_idx]
+            return np.zeros(25)
         
-        # Convert DOM attributes to our vocabulary
-        our_attributes = self._dom_to_our_vocabulary(dom_state)
+        # Get expectation dictionary for this position and pattern (0 = "self", 1 = parent, ...)
+        pos_idx = 0 if position == "self" else self.position_names.index(position)
         
-        # Evaluate each dimension
-        all_dimensions = EnhancedGrandClass.get_all_dimensions()
-        for i, dimension in enumerate(all_dimensions):
-            if dimension in expectation_dict:
-                expr = expectation_dict[dimension]
-                observed_attrs = our_attributes.get(dimension, set())
-                # Use AttributeExpression.evaluate() - returns 0.0 or 1.0
-                vector[i] = expr.evaluate(observed_attrs)
-        
-        return vector
+        return encode_observation(dom_state, self.expectation_dicts[pattern_idx, pos_idx])
+    
+    def _encode_observations(self, jobs: List[Tuple[Dict, int, int]]) -> List[np.ndarray]:
+        """Encode (dom_state, pattern_idx, pos_idx) jobs together"""
+        return [encode_observation(dom_state, self.expectation_dicts[pattern_idx, pos_idx])
+                for dom_state, pattern_idx, pos_idx in jobs]
     
     def _dom_to_our_vocabulary(self, dom_state: Dict) -> Dict[EnhancedGrandClass, Set[str]]:
-        """
-        Map DOM observation to our attribute vocabulary.
-        Simplified version - in production would use full EnhancedGrandClass definitions.
-        """
-        element_vectors = defaultdict(set)
-        all_definitions = EnhancedGrandClass.get_base_attribute_definitions()
-        
-        # Extract from DOM
-        tag = dom_state.get('tag', '')
-        attrs = dom_state.get('attributes', {})
-        states = dom_state.get('states', [])
-        text = dom_state.get('text', '')
-        value = dom_state.get('value', '')
-        
-        # Check each grand class
-        for gc, definitions in all_definitions.items():
-            for definition in definitions:
-                if self._definition_matches_dom(definition, tag, attrs, states, text, value):
-                    element_vectors[gc].add(definition)
-        
-        return element_vectors
+        """Map DOM observation to our attribute vocabulary (see dom_to_vocabulary)"""
+        return dom_to_vocabulary(dom_state)
     
     def _definition_matches_dom(self, definition: str, tag: str, attrs: Dict, 
                             states: List[str], text: str, value: str) -> bool:
         """Check if a definition matches DOM state"""
-        # Tag matches
-        if definition == tag:
-            return True
-        
-        # State matches
-        if definition in states:
-            return True
-        
-        # Attribute value matches
-        if definition in attrs.values():
-            return True
-        
-        # Input type variations
-        if definition.startswith('input_') and tag == 'input':
-            expected_type = definition.replace('input_', '')
-            return attrs.get('type') == expected_type
-        
-        # Role matches
-        if definition.startswith('role_') and attrs.get('role'):
-            expected_role = definition.replace('role_', '')
-            return attrs.get('role') == expected_role
-        
-        # Data attribute matches
-        if definition.startswith('data_') and definition.replace('_', '-') in attrs:
-            return True
-        
-        return False
+        return definition_matches_dom(definition, tag, attrs, states, text, value)
     
     # ===== PATTERN SWITCHING =====
 
@@ -3998,10 +4752,12 @@ class Neuron:
         # Update matrices for new pattern
         self.P_matrix = self.neighbor_expectation_tensor[self.current_pattern_idx].copy()
         self.B_matrix = self.B_matrices_dict[new_pattern].copy()
+        self._seed_from_population_prior(b_too=False)
         
         # Reset recycling
         self.recycling_iteration = 0
         self.permutation_count = 0
+        self.last_activity = time.time()
         
         # Fire axon
         self.fire_axon('PATTERN_CHANGE', {
@@ -4076,15 +4832,50 @@ class Neuron:
             print(f"  🔄 Permuted position order: {self.neighbor_positions}")
     
 
+    @staticmethod
+    def _dom_state_hash(dom_state: Dict) -> str:
+        """Hash of the observable parts of an element"""
+        content = "|".join([dom_state.get('tag', ''), dom_state.get('classes', ''),
+                            dom_state.get('text', '')[:200], dom_state.get('value', ''),
+                            ",".join(dom_state.get('states', []))])
+        return hashlib.md5(content.encode()).hexdigest()[:10]
+    
+    def _update_cycle_rate(self):
+        """Feed convergence signals to the rate controller and enter/leave MONITORING"""
+        observations = np.concatenate([np.ravel(self.self_vector), np.ravel(self.O_matrix)])
+        self.rate_controller.observe_cycle(self.eigen_certainty, self.b_final, observations)
+        
+        if self.rate_controller.backed_off and self.processing_phase != "MONITORING":
+            self.processing_phase = "MONITORING"
+            self.monitoring_start_time = time.time()
+            if self.steady_after is None:
+                self.steady_after = self.monitoring_start_time - self.spawned_at
+                self.steady_cycles = self.cycle_count - self.spawn_cycle
+        elif not self.rate_controller.backed_off and self.processing_phase == "MONITORING":
+            self.processing_phase = "PROCESSING"
+    
+    def _snap_back(self, reason: str):
+        """Return to full cycle rate and ask the scheduler for an immediate cycle"""
+        if self.rate_controller.snap_back(reason):
+            self.monitoring_active = False
+            if self.wake_callback is not None:
+                self.wake_callback()
+    
+    def _on_neighbour_axon(self, axon):
+        """Subscription notify - runs on the delivering thread"""
+        self._snap_back('neighbour')
+    
     def _handle_hash_change(self, new_dom_state: Dict, new_hash: str):
         """Handle DOM hash change"""
+        self._snap_back('dom_change')
         self.fire_axon('DOM_EVENT', {
             'event_type': 'hash_change',
-            'old_hash': getattr(self, 'last_dom_hash', '')[:8],
+            'old_hash': (self.last_dom_hash or '')[:8],
             'new_hash': new_hash[:8],
             'action': 'return_to_processing'
         })
         self.processing_phase = "PROCESSING"
+        self.last_activity = time.time()
     
     def _handle_self_destruct(self, reason: str):
         """Handle neuron self-destruct"""
@@ -4111,10 +4902,10 @@ class Neuron:
             'coordinate': self.coordinate,
             'pattern': self.current_pattern,
             'cycle': self.cycle_count,
-            **{k: v for k, v in data.items() if not isinstance(v, (np.ndarray, list, dict)) or len(str(v)) < 100}
+            **data
         }
         
-        # Use axon network (logs to pattern queue based on current pattern)
+        # Use axon network (applies the payload schema, logs to pattern queue based on current pattern)
         self.axon_network.fire_axon(axon_type, axon_data, self)
     
     def _log_circuitry_update(self):
@@ -4129,6 +4920,7 @@ class Neuron:
         # Calculate eigen certainty
         eigen_certainty = self._calculate_eigen_certainty()
         eigen_category = self._get_eigen_category(eigen_certainty)
+        self.eigen_certainty = eigen_certainty
         
         # Fire circuitry axon with ALL matrix data
         self.fire_axon('CIRCUITRY_UPDATE', {
@@ -4141,7 +4933,8 @@ class Neuron:
             'b_vector': self.b_vector.tolist() if hasattr(self.b_vector, 'tolist') 
                     else list(self.b_vector),
             
-            # Position bias matrix (B matrix)
+            # Position bias matrix (B matrix) - full matrix by reference feeds the population prior
+            'B_matrix': self.B_matrix,
             'B_matrix_diag': np.diag(self.B_matrix).tolist(),
             'B_matrix_stats': {
                 'mean': float(self.B_matrix.mean()),
@@ -4215,48 +5008,33 @@ class Neuron:
         })
             
     def _mark_void(self, coordinate: Tuple[int, ...], reason: str):
-        """Mark coordinate as void - check for duplicate flags first"""
-        if not coordinate:
+        """Mark coordinate as void - only the first neuron to claim the flag fires it"""
+        if not coordinate or coordinate in self.void_coordinates:
             return
         
-        # Check if void flag already sent recently
-        if hasattr(self.axon_network, 'has_flag_been_sent'):
-            if self.axon_network.has_flag_been_sent(coordinate, 'VOID'):
-                # Flag already sent, just add to local void set
-                if coordinate not in self.void_coordinates:
-                    self.void_coordinates.add(coordinate)
+        self.void_coordinates.add(coordinate)
+        
+        # Atomic check-and-record so concurrent neurons can't both fire
+        if hasattr(self.axon_network, 'check_and_record_flag'):
+            if not self.axon_network.check_and_record_flag(coordinate, 'VOID'):
                 return
         
-        # First time marking this void
-        if coordinate and coordinate not in self.void_coordinates:
-            self.void_coordinates.add(coordinate)
-            
-            # Record that we're sending this flag
-            if hasattr(self.axon_network, 'record_flag_sent'):
-                self.axon_network.record_flag_sent(coordinate, 'VOID')
-            
-            # Send void signal
-            self.fire_axon('VOID_SIGNAL', {
-                'coordinate': coordinate,
-                'reason': reason[:100],
-                'source_neuron': self.id,
-                'total_voids': len(self.void_coordinates)
-            })
+        # Send void signal
+        self.fire_axon('VOID_SIGNAL', {
+            'coordinate': coordinate,
+            'reason': reason[:100],
+            'source_neuron': self.id,
+            'total_voids': len(self.void_coordinates)
+        })
 
     def _signal_growth(self, coordinate: Tuple[int, ...], vector: np.ndarray, position: str):
-        """Signal growth opportunity - check for duplicate flags first"""
+        """Signal growth opportunity - only the first neuron to claim the flag fires it"""
         if not coordinate:
             return
         
-        # Check if growth flag already sent recently
-        if hasattr(self.axon_network, 'has_flag_been_sent'):
-            if self.axon_network.has_flag_been_sent(coordinate, 'GROWTH'):
-                # Flag already sent
-                return
-        
         # Check if coordinate already has neuron
-        if hasattr(self.axon_network, 'has_neuron_at_coordinate'):
-            if self.axon_network.has_neuron_at_coordinate(coordinate):
+        if hasattr(self.axon_network, 'coordinate_has_neuron'):
+            if self.axon_network.coordinate_has_neuron(coordinate):
                 return
         
         # Check if coordinate is void
@@ -4264,9 +5042,10 @@ class Neuron:
             if self.axon_network.is_void_coordinate(coordinate):
                 return
         
-        # Record that we're sending this flag
-        if hasattr(self.axon_network, 'record_flag_sent'):
-            self.axon_network.record_flag_sent(coordinate, 'GROWTH')
+        # Atomic check-and-record so concurrent neurons can't both fire
+        if hasattr(self.axon_network, 'check_and_record_flag'):
+            if not self.axon_network.check_and_record_flag(coordinate, 'GROWTH', claimant=self.id):
+                return
         
         # Send growth signal
         self.fire_axon('GROWTH_SIGNAL', {
@@ -4287,13 +5066,32 @@ class Neuron:
             print(f"  ⏸️  Resuming from stall state")
             self.stalled = False
         
+        # Drain neighbourhood broadcasts
+        self._drain_neighbour_inbox()
+        self._cycle_dom_hashes = []
+        self.cycle_budget.start_cycle()
+        try:
+            return self._run_cycle_phases()
+        finally:
+            cycle_ms = self.cycle_budget.end_cycle()
+            if self.cycle_budget.budget_ms and cycle_ms > self.cycle_budget.budget_ms:
+                print(f"  ⏱️ Cycle {self.cycle_count} took {cycle_ms:.0f}ms "
+                      f"(budget {self.cycle_budget.budget_ms:.0f}ms)")
+    
+    def _run_cycle_phases(self) -> bool:
+        """Phases 1-6, each boundary reported to the cycle budget"""
+        budget = self.cycle_budget
+        
         # Phase 1: Self observation
+        budget.phase('self_observation')
         self._phase1_self_observation()
         
         # Phase 2: Competitive assignment
+        budget.phase('competitive_assignment')
         self._phase2_competitive_assignment()
         
         # Phase 3: Neighbor observation WITH void handling
+        budget.phase('neighbor_observation')
         try:
             if self.learning_mode == "TARGETED":
                 self._phase3_targeted_observation_with_locking()
@@ -4303,22 +5101,73 @@ class Neuron:
             print(f"  ⚠ Neighbor observation error: {e}")
             # Continue with zeros for failed observations
         
+        # Unchanged neighbourhood and no neighbour broadcasts - reuse last D, skip fallback
+        if self._neighbourhood_unchanged() and not budget.is_deferred('tensor_fallback'):
+            self.fast_path_cycles += 1
+            print("  ⚡ Neighbourhood unchanged - fast path")
+            budget.phase('matrix_updates')
+            self._apply_D_update()
+            self.confidence_score = self.b_final[self.current_pattern_idx]
+            budget.phase('completion')
+            self._phase6_cycle_completion()
+            return True
+        self.full_path_cycles += 1
+        
         # Phase 4: Matrix updates (use whatever observations we have)
+        budget.phase('matrix_updates')
         self._phase4_matrix_updates()
         
         # Phase 5: Confidence decision
+        budget.phase('confidence_decision')
         decision = self._phase5_confidence_decision()
         
         if decision == "TENSOR_FALLBACK":
-            pattern_changed = self._phase5_tensor_fallback()
-            if pattern_changed:
-                self._phase6_cycle_completion()
-                return True
+            # 30 observations vs phase 3's 6 - wait for a cycle with budget left (bounded by max_deferrals)
+            if budget.allows('tensor_fallback', estimate_ms=5 * budget.phase_ms['neighbor_observation']):
+                budget.phase('tensor_fallback')
+                pattern_changed = self._phase5_tensor_fallback()
+                if pattern_changed:
+                    budget.phase('completion')
+                    self._phase6_cycle_completion()
+                    return True
+            else:
+                print(f"  ⏱️ Tensor fallback deferred ({budget.elapsed_ms:.0f}ms spent)")
         
         # Always complete the cycle
+        budget.phase('completion')
         self._phase6_cycle_completion()
         return True
 
+    def _neighbourhood_unchanged(self) -> bool:
+        """
+        Fingerprint this cycle's observed neighbourhood (self + neighbour element
+        hashes, pattern, voids, reroutes) and compare with last cycle's.
+        """
+        fingerprint = hash((
+            self.current_pattern_idx,
+            tuple(self._cycle_dom_hashes),
+            len(self.void_coordinates),
+            tuple(sorted(getattr(self, 'membrane_reroutes', {}).items()))
+        ))
+        unchanged = (fingerprint == self.neighbourhood_fingerprint and 
+                     self.neighbour_activity == 0 and 
+                     self.D_matrix_87d is not None)
+        self.neighbourhood_fingerprint = fingerprint
+        return unchanged
+    
+    def _drain_neighbour_inbox(self) -> List[Dict]:
+        """Take broadcasts delivered since last cycle and record neighbour activity"""
+        if self.neighbour_subscription is None:
+            self.neighbour_activity = 0
+            return []
+        
+        axons = self.neighbour_subscription.drain()
+        self.neighbour_activity = len(axons)
+        for axon in axons:
+            if axon.source_pattern in self.pattern_names:
+                self.neighbour_patterns[axon.source_id] = axon.source_pattern
+        return axons
+
     def cleanup_locks(self):
         """Release any locks this neuron holds"""
         if hasattr(self.axon_network, 'coordinate_states'):
@@ -4339,6 +5188,11 @@ class Neuron:
         self.pending_coordinates.clear()
         self.stalled_positions.clear()
         
+        # Stop receiving neighbourhood broadcasts
+        if self.neighbour_subscription is not None and hasattr(self.axon_network, 'unsubscribe'):
+            self.axon_network.unsubscribe(self.neighbour_subscription.name)
+            self.neighbour_subscription = None
+        
         # Notify void system we're gone
         if hasattr(self.axon_network, 'void_system'):
             # Remove any membrane connections for this neuron
@@ -4375,10 +5229,138 @@ class Neuron:
             'last_activity': self.last_activity,
             'void_count': len(self.void_coordinates),
             'monitoring_active': self.monitoring_active,
+            'rate_multiplier': self.rate_controller.multiplier,
+            'fast_path_cycles': self.fast_path_cycles,
+            'full_path_cycles': self.full_path_cycles,
+            'flip_rate': self.oscillation_detector.flip_rate,
+            'oscillating': self.oscillation_detector.oscillating,
+            'warm_started': self.warm_started,
+            'steady_after': self.steady_after,
+            'cycle_ms': self.cycle_budget.last_cycle_ms,
+            'deferred': dict(self.cycle_budget.deferred),
             'recycling_iteration': self.recycling_iteration,
             'max_recycling_iterations': self.max_recycling_iterations
         }
     
+    # ===== POPULATION PRIOR =====
+    
+    def _population_prior(self) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        priors = getattr(self.axon_network, 'pattern_priors', None)
+        return priors.prior(self.current_pattern) if priors is not None else None
+    
+    def _seed_from_population_prior(self, b_too: bool = True) -> bool:
+        """Start from what neurons of our pattern converged to instead of the ROSE default"""
+        prior = self._population_prior()
+        if prior is None:
+            return False
+        self.B_matrix, b_prior = prior
+        if b_too:
+            self.b_vector = b_prior
+            self.b_final = b_prior.copy()
+            self.b_initial = b_prior.copy()  # first β update continues from the prior
+            self.b_carry = True
+        self.axon_network.pattern_priors.served += 1
+        return True
+    
+    def _blend_population_prior(self):
+        priors = getattr(self.axon_network, 'pattern_priors', None)
+        if priors is None or priors.blend_weight <= 0:
+            return
+        prior = priors.prior(self.current_pattern)
+        if prior is None:
+            return
+        weight = priors.blend_weight
+        B_prior, b_prior = prior
+        self.B_matrix = (1 - weight) * self.B_matrix + weight * B_prior
+        self.b_vector = (1 - weight) * np.asarray(self.b_vector) + weight * b_prior
+        priors.blended += 1
+    
+    # ===== CHECKPOINT / WARM START =====
+    
+    def export_state(self) -> Dict:
+        """Learned state worth carrying into the next session on the same site"""
+        return {
+            'pattern': self.current_pattern,
+            'B_matrix': np.asarray(self.B_matrix).tolist(),
+            'b_vector': np.asarray(self.b_vector).tolist(),
+            'b_final': np.asarray(self.b_final).tolist(),
+            'confidence': float(self.confidence_score),
+            'membrane_reroutes': {position: list(coord) 
+                                  for position, coord in self.membrane_reroutes.items() if coord},
+            'cycle_count': self.cycle_count,
+            'recycling_iteration': self.recycling_iteration,
+            'permutation_count': self.permutation_count,
+            'dom_hash': self.last_dom_hash,
+            'observations': (np.concatenate([np.ravel(self.self_vector), np.ravel(self.O_matrix)]).tolist()
+                             if self.self_vector is not None else None)
+        }
+    
+    def restore_state(self, state: Dict) -> bool:
+        """Adopt a checkpoint. Checked against the live element on the first self observation."""
+        try:
+            B_matrix = np.array(state['B_matrix'], dtype=float)
+            b_vector = np.array(state['b_vector'], dtype=float)
+            b_final = np.array(state.get('b_final', state['b_vector']), dtype=float)
+        except (KeyError, TypeError, ValueError):
+            return False
+        pattern = state.get('pattern')
+        if (pattern not in self.pattern_names or B_matrix.shape != (5, 5) 
+                or b_vector.shape != (5,) or b_final.shape != (5,)):
+            return False
+        
+        self.current_pattern = pattern
+        self.current_pattern_idx = self._get_pattern_idx(pattern)
+        self.P_matrix = self.neighbor_expectation_tensor[self.current_pattern_idx].copy()
+        self.B_matrix = B_matrix
+        self.b_vector = b_vector
+        self.b_final = b_final
+        self.b_initial = b_final.copy()  # first β update continues from the checkpoint
+        self.b_carry = True
+        self.confidence_score = float(state.get('confidence', 0.0))
+        self.membrane_reroutes = {position: tuple(coord) 
+                                  for position, coord in state.get('membrane_reroutes', {}).items()
+                                  if position in self.neighbor_positions}
+        self.cycle_count = int(state.get('cycle_count', 0))
+        self.recycling_iteration = int(state.get('recycling_iteration', 0))
+        self.permutation_count = int(state.get('permutation_count', 0))
+        
+        observations = state.get('observations')
+        self.rate_controller.prime(b_final, observations if observations and len(observations) == 150 else None)
+        
+        self.checkpoint_dom_hash = state.get('dom_hash')
+        self.spawn_cycle = self.cycle_count
+        self.warm_started = True
+        return True
+    
+    def _discard_checkpoint(self, reason: str):
+        """Element changed since the checkpoint was taken - back to priori defaults"""
+        print(f"  ♻️ Checkpoint discarded ({reason}) - cold start from {self.priori_pattern}")
+        self.current_pattern = self.priori_pattern
+        self.current_pattern_idx = self._get_pattern_idx(self.priori_pattern)
+        self._initialize_matrices_from_extracted_data()
+        self.b_final = self.b_initial.copy()
+        self.b_carry = False
+        self.confidence_score = 0.0
+        self.membrane_reroutes = {}
+        self.recycling_iteration = 0
+        self.permutation_count = 0
+        self.rate_controller.reset()
+        
+        self.warm_started = False
+        self.checkpoint_dom_hash = None
+        self.spawned_at = time.time()
+        self.spawn_cycle = self.cycle_count
+    
+    @property
+    def is_active(self) -> bool:
+        """Recent DOM / pattern change or neighbourhood broadcasts since last cycle"""
+        return self.neighbour_activity > 0 or time.time() - self.last_activity < self.ACTIVE_WINDOW
+    
+    @property
+    def has_sync_partner(self) -> bool:
+        """A sibling neuron currently shares our pattern"""
+        return any(pattern == self.current_pattern for pattern in self.neighbour_patterns.values())
+    
     def start_monitoring(self):
         """Start monitoring phase (called by Nexus if needed)"""
         if self.confidence_score >= 0.7:
@@ -4400,30 +5382,1190 @@ AXON NETWORK - Complete Implementation
 Simple 6-queue system with all axon types for visualization and tracking
 """
 
+class AxonType(str, Enum):
+    """Interned axon type names - compare equal to (and serialize as) their plain strings"""
+    NEURON_CREATED = 'NEURON_CREATED'
+    GROWTH_SIGNAL = 'GROWTH_SIGNAL'
+    VOID_SIGNAL = 'VOID_SIGNAL'
+    VOID_BROADCAST = 'VOID_BROADCAST'
+    CYCLE_COMPLETE = 'CYCLE_COMPLETE'
+    DOT_PRODUCT_REPORT = 'DOT_PRODUCT_REPORT'
+    PATTERN_CHANGE = 'PATTERN_CHANGE'
+    DOM_EVENT = 'DOM_EVENT'
+    SYSTEM_ALERT = 'SYSTEM_ALERT'
+    CIRCUITRY_UPDATE = 'CIRCUITRY_UPDATE'
+    COMPETITIVE_ASSIGNMENT = 'COMPETITIVE_ASSIGNMENT'
+    HIERARCHICAL_ASSIGNMENT = 'HIERARCHICAL_ASSIGNMENT'
+    UNKNOWN_UPDATE = 'UNKNOWN_UPDATE'
+    HEARTBEAT = 'HEARTBEAT'
+    NEXUS_CONTROL = 'NEXUS_CONTROL'
+    
+    def __str__(self):
+        return self.value
+    
+    def __format__(self, format_spec):
+        return self.value.__format__(format_spec)
+    
+    @classmethod
+    def resolve(cls, axon_type):
+        """Map a type name to its enum member; unknown names are interned strings"""
+        member = cls._value2member_map_.get(axon_type)
+        if member is not None:
+            return member
+        return sys.intern(str(axon_type))
+
+
+# Envelope fields Neuron.fire_axon adds to every payload
+AXON_ENVELOPE_FIELDS = frozenset({'neuron_id', 'coordinate', 'pattern', 'cycle'})
+
+# Per-type payload schemas: 'fields' are kept, 'refs' are large values stored by reference
+AXON_PAYLOAD_SCHEMAS = {
+    AxonType.NEURON_CREATED: {'fields': {'confidence', 'b_vector_shape'}, 'refs': set()},
+    AxonType.HEARTBEAT: {'fields': {'heartbeat_count'}, 'refs': set()},
+    AxonType.CYCLE_COMPLETE: {
+        'fields': {'confidence', 'phase', 'recycling_iteration', 'dominant_pattern',
+                   'dominant_probability', 'void_count', 'assignment_count'},
+        'refs': set()
+    },
+    AxonType.HIERARCHICAL_ASSIGNMENT: {
+        'fields': {'B_matrix_trace', 'B_matrix_γ_updated'},
+        'refs': {'indices', 'assignment'}
+    },
+    AxonType.UNKNOWN_UPDATE: {
+        'fields': {'update_type', 'eigen_gamma', 'B_matrix_trace'},
+        'refs': {'B_matrix_diag', 'history', 'membrane_status'}
+    },
+    AxonType.CIRCUITRY_UPDATE: {
+        'fields': {'pattern_idx', 'V_matrix_trace', 'eigen_certainty', 'eigen_category',
+                   'confidence', 'recycling_iteration', 'void_count'},
+        'refs': {'b_vector', 'B_matrix', 'B_matrix_diag', 'B_matrix_stats', 'dot_products',
+                 'positions_observed', 'assignment'}
+    },
+    AxonType.DOT_PRODUCT_REPORT: {
+        'fields': {'matrix_space', 'mean_relational_similarity', 'convergence_score'},
+        'refs': {'best_matches'}
+    },
+    AxonType.PATTERN_CHANGE: {
+        'fields': {'change_type', 'from_pattern', 'to_pattern', 'probability', 'confidence', 'source'},
+        'refs': set()
+    },
+    AxonType.DOM_EVENT: {'fields': {'event_type', 'old_hash', 'new_hash', 'action'}, 'refs': set()},
+    AxonType.SYSTEM_ALERT: {'fields': {'alert_type', 'reason'}, 'refs': set()},
+    AxonType.VOID_SIGNAL: {'fields': {'reason', 'source_neuron', 'total_voids'}, 'refs': set()},
+    AxonType.VOID_BROADCAST: {'fields': {'void_coordinate', 'source_neuron', 'total_voids'}, 'refs': set()},
+    AxonType.GROWTH_SIGNAL: {'fields': {'from_position', 'vector_norm', 'source_neuron'}, 'refs': set()},
+}
+
+# Allowed keys per type (envelope + fields + refs), precomputed for fire-time filtering
+AXON_ALLOWED_KEYS = {
+    axon_type: frozenset(AXON_ENVELOPE_FIELDS | schema['fields'] | schema['refs'])
+    for axon_type, schema in AXON_PAYLOAD_SCHEMAS.items()
+}
+
+
+def apply_axon_schema(axon_type, data: Dict) -> Dict:
+    """Keep only schema fields for this type; reuses the dict when nothing needs dropping"""
+    allowed = AXON_ALLOWED_KEYS.get(axon_type)
+    if allowed is None or allowed.issuperset(data):
+        return data
+    return {key: value for key, value in data.items() if key in allowed}
+
+
+class Axon:
+    """
+    Compact axon record.
+    Integer id, interned type, integer monotonic timestamp (ns since session start) and a
+    schema-filtered payload whose large values are held by reference.
+    Supports the dict-style reads (axon['data'], axon.get('source')) used across the code.
+    """
+    
+    __slots__ = ('id', 'axon_type', 't_ns', 'source_id', 'source_coordinate',
+                 'source_pattern', 'source_state', 'data', 'list_index')
+    
+    def __init__(self, axon_id: int, axon_type, t_ns: int, source_id: str,
+                 source_coordinate, source_pattern: str, source_state: str, data: Dict):
+        self.id = axon_id
+        self.axon_type = axon_type
+        self.t_ns = t_ns
+        self.source_id = source_id
+        self.source_coordinate = source_coordinate
+        self.source_pattern = source_pattern
+        self.source_state = source_state
+        self.data = data
+        self.list_index = None
+    
+    @property
+    def axon_id(self) -> str:
+        return f"axon_{self.id:06d}"
+    
+    @property
+    def session_time(self) -> float:
+        return self.t_ns / 1e9
+    
+    @property
+    def source(self) -> Dict:
+        return {
+            'id': self.source_id,
+            'coordinate': self.source_coordinate,
+            'pattern': self.source_pattern,
+            'state': self.source_state
+        }
+    
+    # ===== dict-style compatibility =====
+    
+    _KEYS = ('axon_id', 'axon_type', 'session_time', 'source', 'data', 'list_index')
+    
+    def __getitem__(self, key):
+        if key in self._KEYS:
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def __setitem__(self, key, value):
+        if key == 'list_index':
+            self.list_index = value
+        else:
+            raise KeyError(key)
+    
+    def __contains__(self, key) -> bool:
+        return key in self._KEYS
+    
+    def get(self, key, default=None):
+        if key in self._KEYS:
+            value = getattr(self, key)
+            return default if value is None else value
+        return default
+    
+    def to_dict(self) -> Dict:
+        axon = {
+            'axon_id': self.axon_id,
+            'axon_type': str(self.axon_type),
+            'session_time': self.session_time,
+            'source': self.source,
+            'data': self.data
+        }
+        if self.list_index is not None:
+            axon['list_index'] = self.list_index
+        return axon
+    
+    copy = to_dict
+    
+    def __repr__(self):
+        return f"Axon({self.axon_id}, {self.axon_type}, {self.source_id})"
+
+
+def axon_json_default(obj):
+    """json.dump default for frames holding axon records and by-reference matrices"""
+    if isinstance(obj, Axon):
+        return obj.to_dict()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def estimate_retained_bytes(value, depth: int = 2) -> int:
+    """Rough retained size of an axon payload or history entry (arrays by nbytes, a few levels deep)"""
+    if isinstance(value, Axon):
+        return sys.getsizeof(value) + estimate_retained_bytes(value.data, depth)
+    if isinstance(value, np.ndarray):
+        return value.nbytes + 112
+    if isinstance(value, dict):
+        size = sys.getsizeof(value)
+        if depth > 0:
+            size += sum(estimate_retained_bytes(v, depth - 1) for v in value.values())
+        return size
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size = sys.getsizeof(value)
+        if depth > 0 and value:
+            # Sample the first element instead of walking long vectors
+            size += len(value) * estimate_retained_bytes(next(iter(value)), depth - 1)
+        return size
+    return sys.getsizeof(value)
+
+
+class AxonSubscription:
+    """
+    Subscriber interest plus a bounded inbox.
+    Axons are delivered by reference; when the inbox is full the oldest entry is dropped.
+    """
+    
+    def __init__(self, name: str, axon_types: Optional[Set[str]] = None,
+                 source_ids: Optional[Set[str]] = None,
+                 coordinate_prefix: Optional[Tuple[int, ...]] = None,
+                 ignore_source: Optional[str] = None,
+                 maxlen: int = 256, notify=None):
+        self.name = name
+        self.axon_types = frozenset(axon_types) if axon_types else None
+        self.source_ids = frozenset(source_ids) if source_ids else None
+        self.coordinate_prefix = tuple(coordinate_prefix) if coordinate_prefix is not None else None
+        self.ignore_source = ignore_source
+        self.notify = notify              # optional callable(axon) run on delivery
+        self.since_ns = None              # axons fired before this (bus clock) are not delivered
+        self.inbox = deque(maxlen=maxlen)  # (delivered_at, axon)
+        
+        # Metrics
+        self.delivered = 0
+        self.consumed = 0
+        self.dropped = 0
+        self.last_lag = 0.0               # seconds between delivery and consumption
+        self.max_lag = 0.0
+    
+    def accepts(self, axon: Dict) -> bool:
+        """Source filters - type and prefix are resolved by the bus index"""
+        source_id = axon.source_id
+        if self.ignore_source is not None and source_id == self.ignore_source:
+            return False
+        if self.source_ids is not None and source_id not in self.source_ids:
+            return False
+        return True
+    
+    def deliver(self, axon: Dict, delivered_at: float):
+        if len(self.inbox) == self.inbox.maxlen:
+            self.dropped += 1
+        self.inbox.append((delivered_at, axon))
+        self.delivered += 1
+        if self.notify is not None:
+            self.notify(axon)
+    
+    def drain(self) -> List[Dict]:
+        """Take everything in the inbox, oldest first"""
+        if not self.inbox:
+            return []
+        now = time.time()
+        axons = []
+        while self.inbox:
+            delivered_at, axon = self.inbox.popleft()
+            lag = now - delivered_at
+            if lag > self.max_lag:
+                self.max_lag = lag
+            axons.append(axon)
+        self.last_lag = lag
+        self.consumed += len(axons)
+        return axons
+    
+    def get_metrics(self) -> Dict:
+        oldest_pending = self.inbox[0][0] if self.inbox else None
+        return {
+            'pending': len(self.inbox),
+            'delivered': self.delivered,
+            'consumed': self.consumed,
+            'dropped': self.dropped,
+            'last_lag': self.last_lag,
+            'max_lag': self.max_lag,
+            'oldest_pending_age': time.time() - oldest_pending if oldest_pending else 0.0
+        }
+
+
+class AxonBus:
+    """
+    Topic-based delivery for broadcast axons.
+    Subscriptions are indexed by (axon_type, coordinate_prefix) so a publish only
+    touches subscribers interested in that type and the source's coordinate ancestry.
+    """
+    
+    def __init__(self, clock=None):
+        self._index = {}          # (axon_type | None, prefix | None) -> [subscriptions], subscription order
+        self.subscriptions = {}   # name -> subscription
+        self.published = 0
+        self.clock = clock        # optional callable() -> ns on the axon t_ns clock
+    
+    def subscribe(self, name: str, axon_types: Optional[Set[str]] = None,
+                  source_ids: Optional[Set[str]] = None,
+                  coordinate_prefix: Optional[Tuple[int, ...]] = None,
+                  ignore_source: Optional[str] = None,
+                  maxlen: int = 256, notify=None) -> AxonSubscription:
+        """Register interest; returns the subscription whose inbox receives matching axons"""
+        if name in self.subscriptions:
+            self.unsubscribe(name)
+        
+        subscription = AxonSubscription(name, axon_types, source_ids, coordinate_prefix,
+                                        ignore_source, maxlen, notify)
+        if self.clock is not None:
+            subscription.since_ns = self.clock()
+        for key in self._keys_for(subscription):
+            # Copy-on-write so publishers can iterate without locking
+            self._index[key] = self._index.get(key, []) + [subscription]
+        self.subscriptions[name] = subscription
+        return subscription
+    
+    def unsubscribe(self, name: str):
+        subscription = self.subscriptions.pop(name, None)
+        if subscription is None:
+            return
+        for key in self._keys_for(subscription):
+            remaining = [s for s in self._index.get(key, []) if s is not subscription]
+            if remaining:
+                self._index[key] = remaining
+            else:
+                self._index.pop(key, None)
+    
+    def _keys_for(self, subscription: AxonSubscription) -> List[Tuple]:
+        types = subscription.axon_types or (None,)
+        return [(axon_type, subscription.coordinate_prefix) for axon_type in types]
+    
+    def publish(self, axon: Dict) -> int:
+        """Deliver axon by reference to every interested subscriber"""
+        self.published += 1
+        if not self._index:
+            return 0
+        
+        source_coordinate = axon.source_coordinate
+        prefixes = [None]
+        if source_coordinate:
+            source_coordinate = tuple(source_coordinate)
+            prefixes.extend(source_coordinate[:i] for i in range(len(source_coordinate) + 1))
+        
+        now = time.time()
+        fired_ns = axon.t_ns if self.clock is not None else None
+        delivered = 0
+        for axon_type in (axon.axon_type, None):
+            for prefix in prefixes:
+                for subscription in self._index.get((axon_type, prefix), ()):
+                    if fired_ns is not None and subscription.since_ns > fired_ns:
+                        break  # lists are in subscription order - the rest subscribed later too
+                    if subscription.accepts(axon):
+                        subscription.deliver(axon, now)
+                        delivered += 1
+        return delivered
+    
+    def get_metrics(self) -> Dict:
+        return {
+            'published': self.published,
+            'subscribers': len(self.subscriptions),
+            'subscriptions': {name: sub.get_metrics() for name, sub in self.subscriptions.items()}
+        }
+
+
+class NetworkAggregates:
+    """
+    Incrementally maintained network aggregates.
+    Updated on every fire, registration and circuitry update so summaries and
+    snapshots read counters instead of rescanning queues and histories.
+    """
+    
+    PATTERN_QUEUES = ['DATA_INPUT', 'ACTION_ELEMENT', 'CONTEXT_ELEMENT', 
+                      'STRUCTURAL', 'UNKNOWN']
+    
+    def __init__(self, recent_axons_per_type: int = 50):
+        # Neuron population
+        self.state_counts = Counter()            # processing phase -> neuron count
+        self.pattern_neuron_counts = Counter()   # current pattern -> neuron count
+        self._neuron_state = {}                  # neuron_id -> processing phase
+        self._neuron_pattern = {}                # neuron_id -> current pattern
+        
+        # Pattern queue depths
+        self.queue_depths = {pattern: {'neuron_count': 0, 'axon_count': 0} 
+                             for pattern in self.PATTERN_QUEUES}
+        
+        # Circuitry
+        self.total_cycles = 0
+        self.pattern_cycles = Counter()          # pattern -> circuitry cycles
+        self.eigen_distribution = Counter()      # latest eigen category -> neuron count
+        self.confidence_sum = 0.0                # sum of latest confidences
+        self.latest_confidence = {}              # neuron_id -> latest confidence
+        self.latest_matrices = {}                # neuron_id -> latest matrix snapshot
+        self.neuron_summaries = {}               # neuron_id -> summary (updated in place)
+        
+        # Recent axons by type, for visualization reads
+        self.recent_axons_per_type = recent_axons_per_type
+        self.recent_axons = {}                   # axon_type -> deque of axons
+        
+        # Per-consumer dirty sets
+        self._dirty = {}                         # consumer -> {neuron_id}
+    
+    # ===== Consumers =====
+    
+    def register_consumer(self, name: str):
+        """Register a snapshot consumer; everything known so far starts dirty"""
+        if name not in self._dirty:
+            self._dirty[name] = set(self._neuron_state) | set(self.neuron_summaries)
+    
+    def drain_dirty(self, name: str) -> Set[str]:
+        """Return and reset the neurons changed since this consumer last asked"""
+        if name not in self._dirty:
+            self.register_consumer(name)
+        dirty = self._dirty[name]
+        self._dirty[name] = set()
+        return dirty
+    
+    def _mark_dirty(self, neuron_id: str):
+        for dirty in self._dirty.values():
+            dirty.add(neuron_id)
+    
+    # ===== Updates =====
+    
+    def on_register(self, neuron_id: str, pattern: str, state: str):
+        """Neuron registered (or re-registered)"""
+        self.on_state(neuron_id, state)
+        self.on_pattern(neuron_id, pattern)
+    
+    def on_remove(self, neuron_id: str):
+        """Neuron removed from network"""
+        state = self._neuron_state.pop(neuron_id, None)
+        if state is not None:
+            self.state_counts[state] -= 1
+        pattern = self._neuron_pattern.pop(neuron_id, None)
+        if pattern is not None:
+            self.pattern_neuron_counts[pattern] -= 1
+
+        # Circuitry: drop the removed neuron's latest confidence, eigen category and summary
+        confidence = self.latest_confidence.pop(neuron_id, None)
+        if confidence is not None:
+            self.confidence_sum -= confidence
+        latest = self.latest_matrices.pop(neuron_id, None)
+        if latest is not None:
+            self.eigen_distribution[latest['eigen_category']] -= 1
+        self.neuron_summaries.pop(neuron_id, None)
+        self._mark_dirty(neuron_id)
+    
+    def on_state(self, neuron_id: str, state: str):
+        """Neuron processing phase observed"""
+        old_state = self._neuron_state.get(neuron_id)
+        if old_state != state:
+            if old_state is not None:
+                self.state_counts[old_state] -= 1
+            self.state_counts[state] += 1
+            self._neuron_state[neuron_id] = state
+    
+    def on_pattern(self, neuron_id: str, pattern: str):
+        """Neuron current pattern observed"""
+        old_pattern = self._neuron_pattern.get(neuron_id)
+        if old_pattern != pattern:
+            if old_pattern is not None:
+                self.pattern_neuron_counts[old_pattern] -= 1
+            self.pattern_neuron_counts[pattern] += 1
+            self._neuron_pattern[neuron_id] = pattern
+    
+    def on_queue_append(self, pattern: str, new_neuron_list: bool):
+        """Axon appended to a pattern queue"""
+        depth = self.queue_depths.get(pattern)
+        if depth is None:
+            return
+        depth['axon_count'] += 1
+        if new_neuron_list:
+            depth['neuron_count'] += 1
+    
+    def on_queue_trim(self, pattern: str, axons_removed: int, neuron_list_removed: bool = False):
+        """Axons dropped from a pattern queue (compaction or neuron removal)"""
+        depth = self.queue_depths.get(pattern)
+        if depth is None:
+            return
+        depth['axon_count'] = max(0, depth['axon_count'] - axons_removed)
+        if neuron_list_removed:
+            depth['neuron_count'] = max(0, depth['neuron_count'] - 1)
+    
+    def on_fire(self, axon: 'Axon', neuron_id: Optional[str]):
+        """Axon fired"""
+        axon_type = axon.axon_type
+        recent = self.recent_axons.get(axon_type)
+        if recent is None:
+            recent = self.recent_axons[axon_type] = deque(maxlen=self.recent_axons_per_type)
+        recent.append(axon)
+        
+        if neuron_id is not None:
+            self._mark_dirty(neuron_id)
+    
+    def on_circuitry(self, neuron_id: str, snapshot: Dict, circuitry_entry: Dict):
+        """Circuitry snapshot recorded for a neuron"""
+        pattern = snapshot['pattern']
+        self.total_cycles += 1
+        self.pattern_cycles[pattern] += 1
+        
+        # Latest confidence (running sum adjusted by delta)
+        confidence = snapshot['confidence']
+        self.confidence_sum += confidence - self.latest_confidence.get(neuron_id, 0.0)
+        self.latest_confidence[neuron_id] = confidence
+        
+        # Latest eigen category
+        previous = self.latest_matrices.get(neuron_id)
+        if previous is not None:
+            self.eigen_distribution[previous['eigen_category']] -= 1
+        self.eigen_distribution[snapshot['eigen_category']] += 1
+        self.latest_matrices[neuron_id] = snapshot
+        
+        # Neuron summary (updated in place)
+        summary = self.neuron_summaries.get(neuron_id)
+        if summary is None:
+            summary = self.neuron_summaries[neuron_id] = {}
+        summary['pattern'] = pattern
+        summary['total_cycles'] = circuitry_entry['stats']['total_cycles']
+        summary['pattern_switches'] = circuitry_entry['stats']['pattern_switches']
+        summary['latest_confidence'] = confidence
+        summary['eigen_category'] = snapshot['eigen_category']
+        
+        self._mark_dirty(neuron_id)
+    
+    # ===== Reads =====
+    
+    def mean_confidence(self) -> float:
+        if not self.latest_confidence:
+            return 0.0
+        return self.confidence_sum / len(self.latest_confidence)
+    
+    def get_recent_axons(self, axon_types) -> List[Dict]:
+        """Recent axons of the given types, oldest first"""
+        axons = []
+        for axon_type in axon_types:
+            recent = self.recent_axons.get(axon_type)
+            if recent:
+                axons.extend(recent)
+        axons.sort(key=lambda a: a.t_ns)
+        return axons
+    
+    def get_state_counts(self) -> Dict[str, int]:
+        return {state: count for state, count in self.state_counts.items() if count > 0}
+    
+    def get_pattern_counts(self) -> Dict[str, int]:
+        return {pattern: count for pattern, count in self.pattern_neuron_counts.items() if count > 0}
+
+
+class FlagRegistry:
+    """
+    Sent-flag registry keyed by (coordinate, flag_type).
+    check_and_record() is a single atomic test-and-set; expiry runs on a hashed
+    time wheel so stale flags are swept in amortized O(1) and memory stays bounded.
+    """
+    
+    def __init__(self, slot_seconds: float = 0.25, slot_count: int = 64, default_timeout: float = 5.0):
+        self.slot_seconds = slot_seconds
+        self.slot_count = slot_count
+        self.default_timeout = default_timeout
+        self._lock = threading.Lock()
+        self._entries = {}  # (coordinate, flag_type) -> (recorded_at, expires_at)
+        self._claimants = {}  # (coordinate, flag_type) -> ids that wanted the live flag
+        self._wheel = [set() for _ in range(slot_count)]
+        self._cursor_tick = int(time.monotonic() / slot_seconds)
+        
+        self.recorded = defaultdict(int)    # flag_type -> flags recorded
+        self.suppressed = defaultdict(int)  # flag_type -> duplicates suppressed
+        self.expired = 0
+    
+    def _schedule(self, key, expires_at: float):
+        """Place key in the slot for its expiry (capped at one wheel turn; re-armed on sweep)"""
+        tick = int(expires_at / self.slot_seconds)
+        tick = max(self._cursor_tick + 1, min(tick, self._cursor_tick + self.slot_count - 1))
+        self._wheel[tick % self.slot_count].add(key)
+    
+    def _advance(self, now: float):
+        """Sweep every slot the cursor passed since the last call"""
+        now_tick = int(now / self.slot_seconds)
+        if now_tick <= self._cursor_tick:
+            return
+        
+        # Never sweep more than one full turn
+        start_tick = max(self._cursor_tick + 1, now_tick - self.slot_count + 1)
+        self._cursor_tick = now_tick
+        
+        for tick in range(start_tick, now_tick + 1):
+            slot = self._wheel[tick % self.slot_count]
+            if not slot:
+                continue
+            due = list(slot)
+            slot.clear()
+            for key in due:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                if entry[1] <= now:
+                    del self._entries[key]
+                    self._claimants.pop(key, None)
+                    self.expired += 1
+                else:
+                    # Re-recorded or longer than one turn - re-arm
+                    self._schedule(key, entry[1])
+    
+    def check_and_record(self, coordinate: Tuple, flag_type: str, timeout: float = None,
+                         claimant: str = None) -> bool:
+        """
+        Record flag if not already live. Returns True if the caller should send it.
+        Suppressed callers are still remembered as claimants of the live flag.
+        """
+        key = (coordinate, flag_type)
+        now = time.monotonic()
+        with self._lock:
+            self._advance(now)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self.suppressed[flag_type] += 1
+                if claimant:
+                    self._claimants.setdefault(key, set()).add(claimant)
+                return False
+            
+            expires_at = now + (timeout if timeout is not None else self.default_timeout)
+            self._entries[key] = (now, expires_at)
+            self._claimants[key] = {claimant} if claimant else set()
+            self._schedule(key, expires_at)
+            self.recorded[flag_type] += 1
+            return True
+    
+    def record(self, coordinate: Tuple, flag_type: str, timeout: float = None):
+        """Unconditionally (re)record a flag"""
+        key = (coordinate, flag_type)
+        now = time.monotonic()
+        with self._lock:
+            self._advance(now)
+            expires_at = now + (timeout if timeout is not None else self.default_timeout)
+            self._entries[key] = (now, expires_at)
+            self._schedule(key, expires_at)
+            self.recorded[flag_type] += 1
+    
+    def is_live(self, coordinate: Tuple, flag_type: str, within: float = None) -> bool:
+        """Check if a flag is live (optionally only if recorded within the last `within` seconds)"""
+        now = time.monotonic()
+        with self._lock:
+            self._advance(now)
+            entry = self._entries.get((coordinate, flag_type))
+            if entry is None or entry[1] <= now:
+                return False
+            return within is None or now - entry[0] < within
+    
+    def claimants(self, coordinate: Tuple, flag_type: str) -> Set[str]:
+        """Everyone who asked for a flag while it was live (empty once expired)"""
+        now = time.monotonic()
+        with self._lock:
+            self._advance(now)
+            entry = self._entries.get((coordinate, flag_type))
+            if entry is None or entry[1] <= now:
+                return set()
+            return set(self._claimants.get((coordinate, flag_type), ()))
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def get_metrics(self) -> Dict:
+        with self._lock:
+            return {
+                'live_flags': len(self._entries),
+                'expired': self.expired,
+                'recorded': dict(self.recorded),
+                'suppressed': dict(self.suppressed)
+            }
+
+
+class NexusChannel:
+    """
+    Bounded NEXUS queue with priority lanes.
+    control - alerts / nexus control, never dropped
+    growth  - growth / void signals, coalesced by (axon_type, coordinate)
+    info    - everything else, oldest dropped when full
+    Producers can wait for capacity (backpressure); put() itself never blocks.
+    """
+    
+    LANES = ('control', 'growth', 'info')
+    LANE_BY_TYPE = {
+        'SYSTEM_ALERT': 'control',
+        'NEXUS_CONTROL': 'control',
+        'GROWTH_SIGNAL': 'growth',
+        'VOID_SIGNAL': 'growth',
+    }
+    
+    def __init__(self, capacities: Dict[str, int] = None, backpressure_timeout: float = 0.5):
+        self.capacities = {'control': 256, 'growth': 512, 'info': 500}
+        if capacities:
+            self.capacities.update(capacities)
+        self.backpressure_timeout = backpressure_timeout
+        
+        self._control = deque()
+        self._growth = OrderedDict()  # (axon_type, coordinate) -> first pending axon
+        self._info = deque()
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self._consumer_ident = None  # thread draining the channel never waits on itself
+        
+        self.stats = {lane: {'put': 0, 'taken': 0, 'dropped': 0, 'coalesced': 0, 'overflow': 0,
+                             'backpressure_waits': 0, 'backpressure_timeouts': 0}
+                      for lane in self.LANES}
+    
+    def lane_for(self, axon_type) -> str:
+        return self.LANE_BY_TYPE.get(str(axon_type), 'info')
+    
+    def _lane_len(self, lane: str) -> int:
+        if lane == 'control':
+            return len(self._control)
+        if lane == 'growth':
+            return len(self._growth)
+        return len(self._info)
+    
+    def wait_for_capacity(self, axon_type, timeout: float = None) -> bool:
+        """Producer backpressure for lossless lanes. Returns False if it gave up waiting."""
+        lane = self.lane_for(axon_type)
+        if lane == 'info' or threading.get_ident() == self._consumer_ident:
+            return True
+        
+        timeout = self.backpressure_timeout if timeout is None else timeout
+        with self._not_full:
+            if self._lane_len(lane) < self.capacities[lane]:
+                return True
+            self.stats[lane]['backpressure_waits'] += 1
+            has_room = self._not_full.wait_for(
+                lambda: self._lane_len(lane) < self.capacities[lane], timeout)
+            if not has_room:
+                self.stats[lane]['backpressure_timeouts'] += 1
+            return has_room
+    
+    def put(self, axon) -> bool:
+        """Enqueue axon. Returns False only if it was coalesced into a pending one."""
+        lane = self.lane_for(axon.axon_type)
+        with self._lock:
+            stats = self.stats[lane]
+            stats['put'] += 1
+            
+            if lane == 'growth':
+                coordinate = axon.data.get('coordinate')
+                key = (str(axon.axon_type), tuple(coordinate) if isinstance(coordinate, list) else coordinate)
+                pending = self._growth.get(key)
+                if pending is not None:
+                    # Keep the earliest so fire->handle latency stays honest, but keep its requesters
+                    stats['coalesced'] += 1
+                    requester = axon.data.get('source_neuron')
+                    if requester and requester != pending.data.get('source_neuron'):
+                        requesters = pending.data.setdefault('requesters', [])
+                        if requester not in requesters:
+                            requesters.append(requester)
+                    return False
+                self._growth[key] = axon
+            elif lane == 'control':
+                self._control.append(axon)
+            else:
+                if len(self._info) >= self.capacities['info']:
+                    self._info.popleft()
+                    stats['dropped'] += 1
+                self._info.append(axon)
+            
+            # Lossless lanes go over capacity rather than drop (e.g. producer timed out)
+            if self._lane_len(lane) > self.capacities[lane]:
+                stats['overflow'] += 1
+            return True
+    
+    def get(self):
+        """Highest-priority pending axon, or None"""
+        with self._lock:
+            self._consumer_ident = threading.get_ident()
+            if self._control:
+                lane, axon = 'control', self._control.popleft()
+            elif self._growth:
+                lane, axon = 'growth', self._growth.popitem(last=False)[1]
+            elif self._info:
+                lane, axon = 'info', self._info.popleft()
+            else:
+                return None
+            self.stats[lane]['taken'] += 1
+            self._not_full.notify_all()
+            return axon
+    
+    # deque compatibility for existing queue users
+    append = put
+    popleft = get
+    
+    def __len__(self):
+        return len(self._control) + len(self._growth) + len(self._info)
+    
+    def __iter__(self):
+        """Pending axons in priority order (snapshot)"""
+        with self._lock:
+            pending = list(self._control) + list(self._growth.values()) + list(self._info)
+        return iter(pending)
+    
+    def get_metrics(self) -> Dict:
+        with self._lock:
+            return {lane: dict(self.stats[lane], pending=self._lane_len(lane),
+                               capacity=self.capacities[lane])
+                    for lane in self.LANES}
+
+
+class NeuronAxonLog:
+    """
+    Append-ordered axon log for one neuron with a time index.
+    Answers "axons of types T since t" by binary search and keeps running
+    SUCCESS / FAILURE / DISCOVERY tallies per pattern over a sliding window.
+    """
+    
+    OUTCOME_WEIGHTS = {'SUCCESS': 3, 'FAILURE': -2, 'DISCOVERY': 1}
+    # Axon types that count as outcomes - every other type leaves the tallies alone
+    OUTCOME_BY_TYPE = {
+        AxonType.PATTERN_CHANGE: 'SUCCESS',
+        AxonType.COMPETITIVE_ASSIGNMENT: 'SUCCESS',
+        AxonType.VOID_SIGNAL: 'FAILURE',
+        AxonType.NEURON_CREATED: 'DISCOVERY',
+        AxonType.GROWTH_SIGNAL: 'DISCOVERY',
+    }
+    
+    def __init__(self, tally_window: float = 60.0):
+        self.times = []                       # t_ns, ascending
+        self.axons = []
+        self.type_times = defaultdict(list)   # axon_type -> t_ns, ascending
+        self.type_axons = defaultdict(list)
+        
+        self.tally_window_ns = int(tally_window * 1e9)
+        self._tally_events = deque()          # (t_ns, pattern, weight) inside the window
+        self.pattern_tallies = defaultdict(int)
+        self._tally_lock = threading.Lock()   # merge thread appends while Nexus reads tallies
+    
+    @classmethod
+    def _outcome_for(cls, axon_type) -> Optional[str]:
+        return cls.OUTCOME_BY_TYPE.get(axon_type)
+    
+    @staticmethod
+    def _outcome_pattern(outcome: str, axon: 'Axon') -> str:
+        """Pattern an outcome counts for - a pattern change credits the pattern switched to"""
+        if outcome == 'DISCOVERY':
+            return 'UNKNOWN'
+        pattern = axon.data.get('pattern') or axon.source_pattern or 'UNKNOWN'
+        if axon.axon_type is AxonType.PATTERN_CHANGE:
+            return axon.data.get('to_pattern') or pattern
+        return pattern
+    
+    @staticmethod
+    def _insert(times: List[int], items: List, t_ns: int, item):
+        """Append, falling back to insort for the rare out-of-order unstaged fire"""
+        if not times or t_ns >= times[-1]:
+            times.append(t_ns)
+            items.append(item)
+        else:
+            index = bisect.bisect_right(times, t_ns)
+            times.insert(index, t_ns)
+            items.insert(index, item)
+    
+    def append(self, axon: 'Axon'):
+        self._insert(self.times, self.axons, axon.t_ns, axon)
+        self._insert(self.type_times[axon.axon_type], self.type_axons[axon.axon_type], axon.t_ns, axon)
+        
+        outcome = self._outcome_for(axon.axon_type)
+        if outcome:
+            pattern = self._outcome_pattern(outcome, axon)
+            weight = self.OUTCOME_WEIGHTS[outcome]
+            with self._tally_lock:
+                self._tally_events.append((axon.t_ns, pattern, weight))
+                self.pattern_tallies[pattern] += weight
+    
+    def since(self, t_ns: int = 0, axon_types=None) -> List['Axon']:
+        """Axons at or after t_ns, optionally only the given types, in time order"""
+        if axon_types is None:
+            return self.axons[bisect.bisect_left(self.times, t_ns):]
+        
+        slices = []
+        for axon_type in axon_types:
+            axon_type = AxonType.resolve(axon_type)
+            times = self.type_times.get(axon_type)
+            if times:
+                slices.append(self.type_axons[axon_type][bisect.bisect_left(times, t_ns):])
+        if len(slices) == 1:
+            return slices[0]
+        return list(heapq.merge(*slices, key=lambda axon: axon.t_ns))
+    
+    def get_tallies(self, now_ns: int, window: float = None) -> Dict[str, int]:
+        """Weighted outcome tallies per pattern over the sliding window (or a shorter one)"""
+        cutoff = now_ns - self.tally_window_ns
+        events = self._tally_events
+        with self._tally_lock:
+            while events and events[0][0] < cutoff:
+                _, pattern, weight = events.popleft()
+                self.pattern_tallies[pattern] -= weight
+                if not self.pattern_tallies[pattern]:
+                    del self.pattern_tallies[pattern]
+            
+            if window is None or int(window * 1e9) >= self.tally_window_ns:
+                return {pattern: weight for pattern, weight in self.pattern_tallies.items() if weight}
+            
+            # Shorter window - walk back from the newest event
+            cutoff = now_ns - int(window * 1e9)
+            tallies = defaultdict(int)
+            for t_ns, pattern, weight in reversed(events):
+                if t_ns < cutoff:
+                    break
+                tallies[pattern] += weight
+            return dict(tallies)
+    
+    def trim_through(self, t_ns: int) -> int:
+        """Forget axons at or before t_ns (compaction). Returns entries removed."""
+        cut = bisect.bisect_right(self.times, t_ns)
+        del self.times[:cut]
+        del self.axons[:cut]
+        for axon_type, times in self.type_times.items():
+            type_cut = bisect.bisect_right(times, t_ns)
+            del times[:type_cut]
+            del self.type_axons[axon_type][:type_cut]
+        return cut
+    
+    def __len__(self):
+        return len(self.axons)
+
+
+class AxonSamplingPolicy:
+    """
+    Per-axon-type emission rules applied in AxonNetwork.fire_axon.
+    Rules: 'always', 'every:N' (every Nth cycle), 'on_change' (payload differs
+    from the last one this neuron fired of that type), 'off'.
+    State-change and growth axons are never sampled out. Sampled-out axons
+    are still counted so rates stay honest.
+    """
+    
+    PROTECTED_TYPES = frozenset({
+        'NEURON_CREATED', 'PATTERN_CHANGE', 'DOM_EVENT', 'GROWTH_SIGNAL',
+        'VOID_SIGNAL', 'VOID_BROADCAST', 'SYSTEM_ALERT', 'NEXUS_CONTROL',
+    })
+    
+    PRESETS = {
+        'debug': {},
+        'production': {
+            'HEARTBEAT': 'every:10',
+            'CYCLE_COMPLETE': 'every:5',
+            'CIRCUITRY_UPDATE': 'every:2',
+            'DOT_PRODUCT_REPORT': 'on_change',
+            'COMPETITIVE_ASSIGNMENT': 'on_change',
+            'HIERARCHICAL_ASSIGNMENT': 'on_change',
+            'UNKNOWN_UPDATE': 'on_change',
+        },
+    }
+    
+    # Envelope keys that change every cycle and say nothing about the payload
+    _VOLATILE_KEYS = frozenset({'cycle', 'timestamp', 'session_time'})
+    
+    def __init__(self, rules: Dict[str, str] = None, default: str = 'always'):
+        self.default = self._parse(default)
+        self.rules = {}
+        for axon_type, rule in (rules or {}).items():
+            self.set_rule(axon_type, rule)
+        
+        self._last_fingerprint = {}  # (source_id, axon_type) -> payload fingerprint
+        self._fallback_cycles = defaultdict(int)  # (source_id, axon_type) -> fires seen (no cycle in payload)
+        self.emitted = defaultdict(int)
+        self.sampled_out = defaultdict(int)
+    
+    @classmethod
+    def preset(cls, name: str) -> 'AxonSamplingPolicy':
+        if name not in cls.PRESETS:
+            raise ValueError(f"Unknown axon sampling preset: {name}")
+        return cls(cls.PRESETS[name])
+    
+    @staticmethod
+    def _parse(rule: str) -> Tuple[str, int]:
+        if rule in ('always', 'on_change', 'off'):
+            return (rule, 1)
+        if rule.startswith('every:'):
+            return ('every', max(1, int(rule.split(':', 1)[1])))
+        raise ValueError(f"Unknown axon sampling rule: {rule}")
+    
+    def set_rule(self, axon_type: str, rule: str):
+        if str(axon_type) in self.PROTECTED_TYPES:
+            return  # never sampled out
+        self.rules[AxonType.resolve(axon_type)] = self._parse(rule)
+    
+    @classmethod
+    def _fingerprint(cls, value):
+        if isinstance(value, np.ndarray):
+            return (value.shape, hash(np.round(value, 6).tobytes()))
+        if isinstance(value, dict):
+            return tuple(sorted((k, cls._fingerprint(v)) for k, v in value.items()
+                                if k not in cls._VOLATILE_KEYS))
+        if isinstance(value, (list, tuple)):
+            return tuple(cls._fingerprint(v) for v in value)
+        if isinstance(value, float):
+            return round(value, 6)
+        return value
+    
+    def admit(self, axon_type, data: Dict, source_id: str) -> bool:
+        """Decide whether this axon is written. Always counts the outcome."""
+        mode, every = self.rules.get(axon_type, self.default)
+        
+        if mode == 'always' or str(axon_type) in self.PROTECTED_TYPES:
+            admitted = True
+        elif mode == 'off':
+            admitted = False
+        elif mode == 'every':
+            cycle = data.get('cycle')
+            if cycle is None:
+                key = (source_id, axon_type)
+                cycle = self._fallback_cycles[key]
+                self._fallback_cycles[key] += 1
+            admitted = cycle % every == 0
+        else:
+            key = (source_id, axon_type)
+            fingerprint = self._fingerprint(data)
+            admitted = self._last_fingerprint.get(key) != fingerprint
+            self._last_fingerprint[key] = fingerprint
+        
+        if admitted:
+            self.emitted[axon_type] += 1
+        else:
+            self.sampled_out[axon_type] += 1
+        return admitted
+    
+    def forget(self, source_id: str):
+        """Drop per-neuron state when a neuron leaves the network"""
+        for store in (self._last_fingerprint, self._fallback_cycles):
+            for key in [k for k in store if k[0] == source_id]:
+                del store[key]
+    
+    def get_metrics(self) -> Dict:
+        return {
+            'rules': {str(t): (mode if mode != 'every' else f"every:{n}") 
+                      for t, (mode, n) in self.rules.items()},
+            'emitted': {str(t): c for t, c in self.emitted.items()},
+            'sampled_out': {str(t): c for t, c in self.sampled_out.items()}
+        }
+
+
+class MemoryBudget:
+    """
+    Global budget for retained per-neuron history (pattern-queue axons and
+    CIRCUITRY matrix history). Usage is charged on append and released on
+    compaction; when over budget the network compacts the heaviest neurons'
+    oldest entries into summaries, optionally spilling them to JSONL first.
+    """
+    
+    def __init__(self, budget_mb: float = 256.0, spill_dir: Optional[str] = None,
+                 compact_fraction: float = 0.5, min_keep: int = 20):
+        self.budget_bytes = int(budget_mb * 1024 * 1024)
+        self.spill_dir = spill_dir
+        self.compact_fraction = compact_fraction
+        self.min_keep = min_keep  # newest entries per list never compacted
+        
+        self.usage = defaultdict(int)  # neuron_id -> retained bytes
+        self.total_bytes = 0
+        
+        self.compactions = 0
+        self.compacted_entries = 0
+        self.spilled_entries = 0
+        self.released_bytes = 0
+    
+    def charge(self, neuron_id: str, nbytes: int):
+        self.usage[neuron_id] += nbytes
+        self.total_bytes += nbytes
+    
+    def release(self, neuron_id: str, nbytes: int):
+        nbytes = min(nbytes, self.usage.get(neuron_id, 0))
+        self.usage[neuron_id] -= nbytes
+        self.total_bytes -= nbytes
+        self.released_bytes += nbytes
+    
+    def forget(self, neuron_id: str) -> int:
+        """Release everything charged to a removed neuron. Returns bytes released."""
+        nbytes = self.usage.pop(neuron_id, 0)
+        self.total_bytes -= nbytes
+        self.released_bytes += nbytes
+        return nbytes
+    
+    def over_budget(self) -> bool:
+        return self.total_bytes > self.budget_bytes
+    
+    def heaviest_neurons(self) -> List[str]:
+        return sorted(self.usage, key=self.usage.get, reverse=True)
+    
+    def spill(self, neuron_id: str, kind: str, entries: List):
+        """Append evicted entries to the neuron's spill file (oldest first)"""
+        if not self.spill_dir or not entries:
+            return
+        os.makedirs(self.spill_dir, exist_ok=True)
+        path = os.path.join(self.spill_dir, f"{neuron_id}.jsonl")
+        with open(path, 'a') as f:
+            for entry in entries:
+                f.write(json.dumps({'kind': kind, 'entry': entry}, default=axon_json_default) + "\n")
+        self.spilled_entries += len(entries)
+    
+    def get_metrics(self) -> Dict:
+        return {
+            'budget_mb': self.budget_bytes / (1024 * 1024),
+            'used_mb': self.total_bytes / (1024 * 1024),
+            'neurons_tracked': len(self.usage),
+            'compactions': self.compactions,
+            'compacted_entries': self.compacted_entries,
+            'spilled_entries': self.spilled_entries,
+            'released_mb': self.released_bytes / (1024 * 1024),
+            'spill_dir': self.spill_dir
+        }
+
+
+class PatternPriorService:
+    """
+    Population prior per pattern: an exponentially decayed mean of the B matrix
+    and b vector that neurons report in CIRCUITRY updates, each contribution
+    weighted by the reporter's eigen certainty. New neurons start from it; with a
+    blend_weight above zero existing neurons are pulled toward it every cycle.
+    """
+    
+    def __init__(self, decay: float = 0.05, min_contributions: int = 10, blend_weight: float = 0.0):
+        self.decay = decay                          # weight of a fully certain contribution
+        self.min_contributions = min_contributions  # prior isn't served until this many
+        self.blend_weight = blend_weight            # 0 = only new neurons use the prior
+        
+        self._B = {}                    # pattern -> 5x5
+        self._b = {}                    # pattern -> 5
+        self.contributions = defaultdict(int)
+        self._lock = threading.Lock()
+        
+        self.served = 0
+        self.blended = 0
+    
+    def contribute(self, pattern: str, B_matrix, b_vector, certainty: float = 1.0):
+        if B_matrix is None or b_vector is None:
+            return
+        B_matrix = np.asarray(B_matrix, dtype=float)
+        b_vector = np.asarray(b_vector, dtype=float)
+        if B_matrix.shape != (5, 5) or b_vector.shape != (5,):
+            return
+        rate = self.decay * min(1.0, max(0.0, certainty))
+        with self._lock:
+            if pattern not in self._B:
+                self._B[pattern] = B_matrix.copy()
+                self._b[pattern] = b_vector.copy()
+            elif rate > 0:
+                self._B[pattern] = (1 - rate) * self._B[pattern] + rate * B_matrix
+                self._b[pattern] = (1 - rate) * self._b[pattern] + rate * b_vector
+            self.contributions[pattern] += 1
+    
+    def prior(self, pattern: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """(B, b) copies for a pattern, or None while the prior is still thin"""
+        with self._lock:
+            if self.contributions.get(pattern, 0) < self.min_contributions:
+                return None
+            return self._B[pattern].copy(), self._b[pattern].copy()
+    
+    def get_metrics(self) -> Dict:
+        with self._lock:
+            return {
+                'patterns': {pattern: {'contributions': self.contributions[pattern],
+                                       'ready': self.contributions[pattern] >= self.min_contributions,
+                                       'B_trace': float(np.trace(self._B[pattern])),
+                                       'b': self._b[pattern].round(3).tolist()}
+                             for pattern in self._B},
+                'served': self.served,
+                'blended': self.blended,
+                'blend_weight': self.blend_weight,
+                'decay': self.decay
+            }
+
+
 class AxonNetwork:
     """Axon network with compressed, continuous logging by neuron_id"""
     
     def __init__(self, nexus_coordinate_space, session_start_time=None):
         
         self.session_start_time = session_start_time or time.time()
+        # Monotonic origin so axon timestamps are integer ns since session start
+        self.session_origin_ns = time.monotonic_ns() - int((time.time() - self.session_start_time) * 1e9)
         self.neuron_registry = {}  # neuron_id -> weakref to neuron
         self.void_system = VoidSystem(self)
+        self.coordinate_index = CoordinateIndex(nexus_coordinate_space or ())  # known-existing coordinates
         self.coordinate_locks = {}  # coordinate -> {'locked_by': neuron_id, 'locked_at': timestamp}
         self.coordinate_lock_timeout = 1.0
         # Axon type definitions - UPDATE THIS
         self.axon_definitions = {
             'NEURON_CREATED': {'nexus': False, 'broadcast': True},
-            'GROWTH_SIGNAL': {'nexus': True, 'broadcast': True},
-            'VOID_SIGNAL': {'nexus': True, 'broadcast': True},
+            'GROWTH_SIGNAL': {'nexus': True, 'broadcast': True, 'wake': True},
+            'VOID_SIGNAL': {'nexus': True, 'broadcast': True, 'wake': True},
             'CYCLE_COMPLETE': {'nexus': False, 'broadcast': True},
             'DOT_PRODUCT_REPORT': {'nexus': False, 'broadcast': False},
             'PATTERN_CHANGE': {'nexus': False, 'broadcast': True},
             'DOM_EVENT': {'nexus': False, 'broadcast': True},
-            'SYSTEM_ALERT': {'nexus': True, 'broadcast': False},
+            'SYSTEM_ALERT': {'nexus': True, 'broadcast': False, 'wake': True},
             'CIRCUITRY_UPDATE': {'nexus': False, 'broadcast': False, 'circuitry': True},
             'COMPETITIVE_ASSIGNMENT': {'nexus': False, 'broadcast': False},
             'HEARTBEAT': {'nexus': True, 'broadcast': True},  # ADD THIS LINE
-            'NEXUS_CONTROL': {'nexus': True, 'broadcast': True},  # ADD THIS LINE
+            'NEXUS_CONTROL': {'nexus': True, 'broadcast': True, 'wake': True},  # ADD THIS LINE
         }
 
         # 7 QUEUES - ALL DICTIONARIES keyed by neuron_id (except NEXUS)
@@ -4433,7 +6575,7 @@ class AxonNetwork:
             'CONTEXT_ELEMENT': {}, # neuron_id -> list of axons
             'STRUCTURAL': {},      # neuron_id -> list of axons
             'UNKNOWN': {},         # neuron_id -> list of axons
-            'NEXUS': deque(maxlen=500),  # Still a queue for processing
+            'NEXUS': NexusChannel(),  # Priority lanes for processing (control / growth / info)
             'CIRCUITRY': {}        # neuron_id -> continuous matrix history
         }
         
@@ -4448,7 +6590,46 @@ class AxonNetwork:
         self.active_test_nodes = {}
         self.neuron_registry = {}
         self.neuron_objects = {} #id ref 
-        self.sent_flags = {}
+        self.flag_registry = FlagRegistry()  # (coordinate, flag_type) sent flags with wheel expiry
+        self.axon_type_counts = {}  # (pattern, neuron_id, axon_type) -> axons logged
+        self.neuron_logs = {}       # neuron_id -> NeuronAxonLog (all pattern queues, time indexed)
+        self.sampling_policy = AxonSamplingPolicy()  # everything 'always' unless configured
+        self.memory_budget = MemoryBudget()          # retained history cap, compaction / spill
+        self.pattern_priors = None                   # optional PatternPriorService (enable_pattern_priors)
+        self.remote_neurons = {}                     # coordinate -> owner info for neurons in other cluster partitions
+        self.compacted_axon_counts = defaultdict(lambda: defaultdict(int))  # neuron_id -> type -> compacted
+        
+        # Reverse indexes - maintained on register / move / remove so lookups stay O(1)
+        self.neuron_coordinates = {}                  # neuron_id -> coordinate
+        self.coordinate_neurons = defaultdict(set)    # coordinate -> {neuron_id}
+        self.coordinate_last_observed = {}            # coordinate -> absolute time of last axon touching it
+        self.observation_window = 0.5                 # seconds a coordinate counts as "currently observed"
+        self.cycle_budget_ms = 250.0                  # per-cycle budget handed to new neurons (CycleBudget)
+        
+        # Incremental aggregates for summaries / snapshots
+        self.aggregates = NetworkAggregates()
+        
+        # Topic-based delivery for broadcast axons
+        self.axon_bus = AxonBus(clock=self.now_ns)
+        
+        # Per-thread staging - neuron threads append locally, Nexus merges once per tick
+        self._axon_ids = itertools.count(1)
+        self.staging_enabled = False
+        self._staging_local = threading.local()
+        self._staging_buffers = []  # (thread, buffer) registered once per thread
+        self._staging_lock = threading.Lock()
+        self._staging_drained = threading.Condition(self._staging_lock)  # merges wake producers at capacity
+        self._merge_ident = None            # thread running merges never waits on itself
+        self._staged_since_merge = False    # first staged axon after a merge wakes Nexus
+        self.staging_high_water = 256       # buffer length that wakes Nexus for an early merge
+        self.staging_capacity = 1024        # buffer length producers wait at (backpressure)
+        self.staging_timeout = 0.5          # longest a producer waits for a merge
+        self.staging_stats = {'merges': 0, 'merged_axons': 0, 'max_batch': 0, 'last_merge_ms': 0.0,
+                              'high_water_wakes': 0, 'backpressure_waits': 0, 'backpressure_timeouts': 0}
+        
+        # Nexus wakeup - 'wake' axon types notify instead of Nexus polling
+        self.nexus_condition = threading.Condition()
+        self._nexus_wake_reason = None
     
     # ===== Public reporting access ===== 
 
@@ -4481,40 +6662,33 @@ class AxonNetwork:
         filepath = os.path.join(frames_dir, filename)
         
         with open(filepath, 'w') as f:
-            json.dump(frame_data, f, indent=2)
+            json.dump(frame_data, f, indent=2, default=axon_json_default)
         
         print(f"📊 Frame {frame_number}: {len(frame_data['neurons'])} neurons from CIRCUITRY queue")
         
         return frame_number + 1
     
     def _extract_neurons_from_circuitry(self):
-        """JUST extract neuron states from CIRCUITRY queue"""
+        """JUST extract latest neuron states recorded from the CIRCUITRY queue"""
         neurons = []
         
-        for neuron_id, circuitry in self.queues['CIRCUITRY'].items():
-            if circuitry['matrix_history']:
-                latest = circuitry['matrix_history'][-1]
-                
-                # Get coordinate from registry
-                coord = None
-                for c, info in self.neuron_registry.items():
-                    if info.get('id') == neuron_id:
-                        coord = c
-                        break
-                
-                if coord:
-                    neuron = {
-                        'neuron_id': neuron_id,
-                        'coordinate': list(coord) if isinstance(coord, tuple) else coord,
-                        'pattern': circuitry['pattern'],
-                        'confidence': latest['confidence'],
-                        'b_vector': latest['b_vector'],
-                        'B_matrix_diag': latest['B_matrix_diag'],
-                        'dot_products': latest['dot_products'],
-                        'assignment': latest['assignment'],
-                        'cycle': latest['cycle']
-                    }
-                    neurons.append(neuron)
+        for neuron_id, latest in self.aggregates.latest_matrices.items():
+            # Get coordinate from reverse index
+            coord = self.neuron_coordinates.get(neuron_id)
+            
+            if coord:
+                neuron = {
+                    'neuron_id': neuron_id,
+                    'coordinate': list(coord) if isinstance(coord, tuple) else coord,
+                    'pattern': latest['pattern'],
+                    'confidence': latest['confidence'],
+                    'b_vector': latest['b_vector'],
+                    'B_matrix_diag': latest['B_matrix_diag'],
+                    'dot_products': latest['dot_products'],
+                    'assignment': latest['assignment'],
+                    'cycle': latest['cycle']
+                }
+                neurons.append(neuron)
         
         return neurons
     
@@ -4546,15 +6720,16 @@ class AxonNetwork:
     
     def has_flag_been_sent(self, coordinate: Tuple, flag_type: str, timeout: float = 5.0) -> bool:
         """Check if a flag was recently sent for this coordinate"""
-        key = (coordinate, flag_type)
-        if key in self.sent_flags:
-            # Check if flag is still fresh (within timeout)
-            if time.time() - self.sent_flags[key] < timeout:
-                return True
-            else:
-                # Flag expired, remove it
-                del self.sent_flags[key]
-        return False
+        return self.flag_registry.is_live(coordinate, flag_type, within=timeout)
+    
+    def check_and_record_flag(self, coordinate: Tuple, flag_type: str, timeout: float = 5.0,
+                              claimant: str = None) -> bool:
+        """Atomic test-and-set - True means this caller owns the flag and should fire it"""
+        return self.flag_registry.check_and_record(coordinate, flag_type, timeout, claimant)
+    
+    def flag_claimants(self, coordinate: Tuple, flag_type: str) -> Set[str]:
+        """Neurons that asked for a live flag, including the suppressed ones"""
+        return self.flag_registry.claimants(coordinate, flag_type)
 
 
     def lock_coordinate(self, coordinate: Tuple, neuron_id: str) -> bool:
@@ -4598,69 +6773,104 @@ class AxonNetwork:
     # Add method to record flag
     def record_flag_sent(self, coordinate: Tuple, flag_type: str):
         """Record that a flag was sent for this coordinate"""
-        key = (coordinate, flag_type)
-        self.sent_flags[key] = time.time()
+        self.flag_registry.record(coordinate, flag_type)
 
     def fire_axon(self, axon_type: str, data: Dict, source_neuron) -> str:
         """
         Fire axon with continuous logging by neuron_id.
-        Returns axon_id for tracking.
+        With staging enabled the axon is only appended to the calling thread's
+        buffer and reaches the shared structures on the next merge.
+        Returns axon_id for tracking, None if the sampling policy dropped it.
         """
-        self.axon_counter += 1
-        session_time = time.time() - self.session_start_time
+        axon_type = AxonType.resolve(axon_type)
+        if not self.sampling_policy.admit(axon_type, data,
+                                          source_neuron.id if source_neuron is not None else 'SYSTEM'):
+            return None
         
-        # Handle None source (for system axons)
-        if source_neuron is None:
-            source_info = {
-                'id': 'SYSTEM',
-                'coordinate': (0, 0, 0),
-                'pattern': 'SYSTEM',
-                'state': 'SYSTEM'
-            }
+        axon = self._build_axon(axon_type, data, source_neuron)
+        
+        # Backpressure - wait for room if a lossless NEXUS lane is full
+        if self.axon_definitions.get(axon.axon_type, {}).get('nexus', False):
+            self.queues['NEXUS'].wait_for_capacity(axon.axon_type)
+        
+        if self.staging_enabled:
+            self._stage_axon(axon, source_neuron)
         else:
-            source_info = {
-                'id': source_neuron.id,
-                'coordinate': source_neuron.coordinate,
-                'pattern': source_neuron.current_pattern,
-                'state': getattr(source_neuron, 'state', 'DEFAULT').value 
-                        if hasattr(source_neuron, 'state') else 'UNKNOWN'
-            }
+            self._route_axon(axon, source_neuron)
+            
+            # Last-observation index (source coordinate and any coordinate the axon is about)
+            observed_at = self.session_start_time + axon.session_time
+            self._mark_coordinate_observed(axon.source_coordinate, observed_at)
+            self._mark_coordinate_observed(axon.data.get('coordinate'), observed_at)
+            if source_neuron:
+                self._update_neuron_registry(source_neuron, axon.session_time)
         
-        # Create axon
-        axon = {
-            'axon_id': f"axon_{self.axon_counter:06d}",
-            'axon_type': axon_type,
-            'session_time': session_time,
-            'source': source_info,
-            'data': data
-        }
+        return axon.axon_id
+    
+    def _next_axon_id(self) -> int:
+        """Allocate an axon id (itertools.count is safe to share across threads)"""
+        axon_id = next(self._axon_ids)
+        if axon_id > self.axon_counter:
+            self.axon_counter = axon_id
+        return axon_id
+    
+    def _build_axon(self, axon_type: str, data: Dict, source_neuron) -> 'Axon':
+        """Create compact axon record (payload filtered by its type schema, large values by reference)"""
+        axon_type = AxonType.resolve(axon_type)
+        t_ns = time.monotonic_ns() - self.session_origin_ns
+        
+        if source_neuron is None:
+            # System axons
+            return Axon(self._next_axon_id(), axon_type, t_ns, 'SYSTEM', (0, 0, 0), 
+                        'SYSTEM', 'SYSTEM', apply_axon_schema(axon_type, data))
+        return Axon(self._next_axon_id(), axon_type, t_ns, source_neuron.id, 
+                    source_neuron.coordinate, source_neuron.current_pattern,
+                    getattr(source_neuron, 'state', 'DEFAULT').value 
+                    if hasattr(source_neuron, 'state') else 'UNKNOWN',
+                    apply_axon_schema(axon_type, data))
+    
+    def _route_axon(self, axon: 'Axon', source_neuron):
+        """Write one axon into queues, bus, history and aggregates"""
+        axon_type = axon.axon_type
         
         # Get axon definition
         axon_def = self.axon_definitions.get(axon_type, 
                     {'nexus': False, 'broadcast': False, 'circuitry': False})
         
         # SPECIAL HANDLING FOR CIRCUITRY_UPDATE
-        if axon_type == 'CIRCUITRY_UPDATE':
+        if axon_type is AxonType.CIRCUITRY_UPDATE:
             self._handle_circuitry_update(axon, source_neuron)
-        else:
-            # STANDARD PATTERN QUEUE LOGGING
-            pattern = source_neuron.current_pattern
+        elif source_neuron is not None:
+            # STANDARD PATTERN QUEUE LOGGING (pattern as of firing, not as of merge)
+            pattern = axon.source_pattern
             if pattern in self.queues and pattern != 'CIRCUITRY':
                 # Get or create neuron's axon list
-                if source_neuron.id not in self.queues[pattern]:
+                new_list = source_neuron.id not in self.queues[pattern]
+                if new_list:
                     self.queues[pattern][source_neuron.id] = []
                 
-                # Calculate axon type count for this neuron
-                axon_list = self.queues[pattern][source_neuron.id]
-                axon_type_count = sum(1 for a in axon_list if a['axon_type'] == axon_type)
-                axon['list_index'] = axon_type_count  # For visualization tracking
+                # Axon type count for this neuron in this queue (kept as a running counter)
+                count_key = (pattern, source_neuron.id, axon_type)
+                axon.list_index = self.axon_type_counts.get(count_key, 0)  # For visualization tracking
+                self.axon_type_counts[count_key] = axon.list_index + 1
                 
                 # Add to neuron's continuous history
-                axon_list.append(axon)
+                self.queues[pattern][source_neuron.id].append(axon)
+                self.aggregates.on_queue_append(pattern, new_list)
+                
+                neuron_log = self.neuron_logs.get(source_neuron.id)
+                if neuron_log is None:
+                    neuron_log = self.neuron_logs[source_neuron.id] = NeuronAxonLog()
+                neuron_log.append(axon)
+                
+                self.memory_budget.charge(source_neuron.id, estimate_retained_bytes(axon))
         
         # NEXUS QUEUE (for processing)
         if axon_def.get('nexus', False):
             self.queues['NEXUS'].append(axon)
+            # Staged axons already woke Nexus when they were staged
+            if axon_def.get('wake', False) and not self.staging_enabled:
+                self.notify_nexus(str(axon_type))
         
         # BROADCAST HANDLING
         if axon_def.get('broadcast', False):
@@ -4669,40 +6879,243 @@ class AxonNetwork:
         # Historical record
         self.historical_axons.append(axon)
         
-        # Update neuron registry
-        if source_neuron:
+        self.aggregates.on_fire(axon, source_neuron.id if source_neuron else None)
+    
+    # ===== PER-THREAD STAGING =====
+    
+    def enable_staging(self, enabled: bool = True):
+        """Switch fire_axon to per-thread buffers; the owner must call merge_staged_axons()"""
+        if not enabled:
+            self.merge_staged_axons()
+        self.staging_enabled = enabled
+        if not enabled:
+            with self._staging_drained:
+                self._staging_drained.notify_all()
+    
+    def _stage_axon(self, axon: 'Axon', source_neuron):
+        """Append to this thread's buffer - no shared writes after the first call"""
+        buffer = getattr(self._staging_local, 'buffer', None)
+        if buffer is None:
+            buffer = self._staging_local.buffer = []
+            with self._staging_lock:
+                self._staging_buffers.append((threading.current_thread(), buffer))
+        buffer.append((axon, source_neuron))
+        
+        if self.axon_definitions.get(axon.axon_type, {}).get('wake', False):
+            self.notify_nexus(str(axon.axon_type))
+        elif not self._staged_since_merge:
+            # Broadcasts / circuitry must not sit until the frame deadline - one wake per merge
+            self._staged_since_merge = True
+            self.notify_nexus('staged')
+        
+        # Bounded buffer - ask for an early merge, then hold the producer until one drains it
+        if len(buffer) >= self.staging_high_water:
+            if len(buffer) == self.staging_high_water:
+                self.staging_stats['high_water_wakes'] += 1
+                self.notify_nexus('staging_high_water')
+            if len(buffer) >= self.staging_capacity and threading.get_ident() != self._merge_ident:
+                with self._staging_drained:
+                    self.staging_stats['backpressure_waits'] += 1
+                    if not self._staging_drained.wait_for(
+                            lambda: len(buffer) < self.staging_capacity or not self.staging_enabled,
+                            self.staging_timeout):
+                        self.staging_stats['backpressure_timeouts'] += 1
+    
+    def merge_staged_axons(self) -> int:
+        """
+        Move every staged axon into the network in timestamp order.
+        Observation and registry indexes are updated once per coordinate / neuron.
+        Returns number of axons merged.
+        """
+        merge_start = time.perf_counter()
+        self._merge_ident = threading.get_ident()
+        self._staged_since_merge = False
+        
+        with self._staging_lock:
+            buffers = list(self._staging_buffers)
+        
+        batch = []
+        for thread, buffer in buffers:
+            # Producers only append, so taking the first n entries is safe without their lock
+            n = len(buffer)
+            if n:
+                batch.extend(buffer[:n])
+                del buffer[:n]
+        
+        # Forget buffers of finished threads once they are empty; release producers held at capacity
+        with self._staging_lock:
+            if any(not thread.is_alive() and not buffer for thread, buffer in buffers):
+                self._staging_buffers = [(thread, buffer) for thread, buffer in self._staging_buffers
+                                         if thread.is_alive() or buffer]
+            self._staging_drained.notify_all()
+        
+        if not batch:
+            return 0
+        
+        batch.sort(key=lambda entry: entry[0].t_ns)
+        
+        last_observed = {}  # coordinate -> session_time of latest axon touching it
+        last_active = {}    # neuron_id -> (neuron, session_time)
+        for axon, source_neuron in batch:
+            self._route_axon(axon, source_neuron)
+            last_observed[axon.source_coordinate] = axon.session_time
+            coordinate = axon.data.get('coordinate')
+            if coordinate is not None:
+                last_observed[tuple(coordinate) if isinstance(coordinate, list) else coordinate] = axon.session_time
+            if source_neuron is not None:
+                last_active[source_neuron.id] = (source_neuron, axon.session_time)
+        
+        # Bulk index updates
+        for coordinate, session_time in last_observed.items():
+            self._mark_coordinate_observed(coordinate, self.session_start_time + session_time)
+        for source_neuron, session_time in last_active.values():
             self._update_neuron_registry(source_neuron, session_time)
         
-        return axon['axon_id']
+        stats = self.staging_stats
+        stats['merges'] += 1
+        stats['merged_axons'] += len(batch)
+        stats['max_batch'] = max(stats['max_batch'], len(batch))
+        stats['last_merge_ms'] = (time.perf_counter() - merge_start) * 1000
+        
+        return len(batch)
+    
+    # ===== MEMORY BUDGET =====
+    
+    def enforce_memory_budget(self) -> int:
+        """
+        Compact the heaviest neurons' oldest history until under budget.
+        Cheap no-op while under budget. Returns bytes released.
+        """
+        budget = self.memory_budget
+        if not budget.over_budget():
+            return 0
+        
+        released = 0
+        while budget.over_budget():
+            released_this_pass = 0
+            for neuron_id in budget.heaviest_neurons():
+                if not budget.over_budget():
+                    break
+                released_this_pass += self._compact_neuron_history(neuron_id)
+            if not released_this_pass:
+                break  # everything left is within min_keep
+            released += released_this_pass
+        
+        if released:
+            budget.compactions += 1
+            print(f"🧹 Memory budget: released {released / 1024:.0f}KB "
+                  f"({budget.total_bytes / (1024 * 1024):.1f}MB used)")
+        return released
+    
+    def _compact_neuron_history(self, neuron_id: str) -> int:
+        """Fold the oldest fraction of one neuron's retained history into summaries"""
+        budget = self.memory_budget
+        released = 0
+        
+        # CIRCUITRY matrix history -> one summary per compaction
+        circuitry_entry = self.queues['CIRCUITRY'].get(neuron_id)
+        if circuitry_entry:
+            history = circuitry_entry['matrix_history']
+            take = min(int(len(history) * budget.compact_fraction), len(history) - budget.min_keep)
+            if take > 0:
+                old = history[:take]
+                budget.spill(neuron_id, 'circuitry', old)
+                del history[:take]
+                del circuitry_entry['stats']['confidence_history'][:take]
+                circuitry_entry['history_offset'] += take
+                
+                confidences = [snapshot['confidence'] for snapshot in old]
+                circuitry_entry['compacted_history'].append({
+                    'from_cycle': old[0]['cycle'],
+                    'to_cycle': old[-1]['cycle'],
+                    'session_time': [old[0]['session_time'], old[-1]['session_time']],
+                    'samples': take,
+                    'mean_confidence': float(np.mean(confidences)),
+                    'min_confidence': float(np.min(confidences)),
+                    'max_confidence': float(np.max(confidences)),
+                    'pattern_counts': dict(Counter(snapshot['pattern'] for snapshot in old)),
+                    'spilled': bool(budget.spill_dir)
+                })
+                nbytes = sum(estimate_retained_bytes(snapshot) + 32 for snapshot in old)
+                budget.release(neuron_id, nbytes)
+                budget.compacted_entries += take
+                released += nbytes
+        
+        # Pattern-queue axons -> per-type counts
+        newest_dropped = None
+        oldest_kept = None  # the time log may only drop what every queue has dropped
+        for pattern in ['DATA_INPUT', 'ACTION_ELEMENT', 'CONTEXT_ELEMENT', 'STRUCTURAL', 'UNKNOWN']:
+            axons = self.queues[pattern].get(neuron_id)
+            if not axons:
+                continue
+            take = max(0, min(int(len(axons) * budget.compact_fraction), len(axons) - budget.min_keep))
+            if take < len(axons):
+                kept_t_ns = min(axon.t_ns for axon in axons[take:])
+                oldest_kept = kept_t_ns if oldest_kept is None else min(oldest_kept, kept_t_ns)
+            if not take:
+                continue
+            old = axons[:take]
+            budget.spill(neuron_id, 'axon', old)
+            del axons[:take]
+            self.aggregates.on_queue_trim(pattern, take)
+            
+            counts = self.compacted_axon_counts[neuron_id]
+            nbytes = 0
+            for axon in old:
+                counts[axon.axon_type] += 1
+                nbytes += estimate_retained_bytes(axon)
+            newest_dropped = max(newest_dropped or 0, old[-1].t_ns)
+            budget.release(neuron_id, nbytes)
+            budget.compacted_entries += take
+            released += nbytes
+        
+        # Time index follows the queues
+        if newest_dropped is not None and neuron_id in self.neuron_logs:
+            if oldest_kept is not None:
+                newest_dropped = min(newest_dropped, oldest_kept - 1)
+            self.neuron_logs[neuron_id].trim_through(newest_dropped)
+        
+        return released
+    
+    # ===== NEXUS WAKEUP =====
+    
+    def notify_nexus(self, reason: str):
+        """Wake a Nexus blocked in wait_for_nexus (first reason since last wait is kept)"""
+        with self.nexus_condition:
+            if self._nexus_wake_reason is None:
+                self._nexus_wake_reason = reason
+            self.nexus_condition.notify_all()
+    
+    def wait_for_nexus(self, timeout: float) -> Optional[str]:
+        """Block until notified or timeout. Returns wake reason, None on timeout."""
+        with self.nexus_condition:
+            if self._nexus_wake_reason is None and timeout > 0:
+                self.nexus_condition.wait(timeout)
+            reason, self._nexus_wake_reason = self._nexus_wake_reason, None
+            return reason
+    
+    def get_staged_count(self) -> int:
+        """Axons waiting in thread buffers"""
+        with self._staging_lock:
+            return sum(len(buffer) for _, buffer in self._staging_buffers)
     
     def is_coordinate_currently_observed(self, coordinate: Tuple) -> bool:
-        """Check if coordinate is being observed RIGHT NOW by checking pattern queues"""
+        """Check if coordinate is being observed RIGHT NOW via the last-observation index"""
         if not coordinate:
             return False
         
-        current_time = time.time()
-        
-        # Check all pattern queues for VERY recent activity
-        for pattern in ['DATA_INPUT', 'ACTION_ELEMENT', 'CONTEXT_ELEMENT', 
-                    'STRUCTURAL', 'UNKNOWN']:
-            for neuron_id, axons in self.queues[pattern].items():
-                if axons:  # Has axons
-                    last_axon = axons[-1]  # Most recent axon
-                    
-                    # Check if this axon is about this coordinate AND very recent
-                    axon_data = last_axon.get('data', {})
-                    axon_coord = axon_data.get('coordinate')
-                    
-                    # Also check source coordinate
-                    source_coord = last_axon.get('source', {}).get('coordinate')
-                    
-                    if (axon_coord == coordinate or source_coord == coordinate):
-                        # Check recency (within last 0.5 seconds)
-                        axon_time = self.session_start_time + last_axon['session_time']
-                        if current_time - axon_time < 0.5:
-                            return True
+        last_observed = self.coordinate_last_observed.get(tuple(coordinate))
+        if last_observed is None:
+            return False
         
-        return False
+        return time.time() - last_observed < self.observation_window
+    
+    def _mark_coordinate_observed(self, coordinate, observed_at: float):
+        """Record that an axon touched this coordinate"""
+        if isinstance(coordinate, list):
+            coordinate = tuple(coordinate)
+        if isinstance(coordinate, tuple) and coordinate:
+            self.coordinate_last_observed[coordinate] = observed_at
 
     def _handle_circuitry_update(self, axon: Dict, source_neuron):
         """Handle circuitry updates - continuous matrix history"""
@@ -4711,7 +7124,7 @@ class AxonNetwork:
         # First time? Log tensor structure once
         if not self.tensor_structure_logged and hasattr(source_neuron, 'expectation_tensor'):
             self.tensor_structure = {
-                'logged_at': axon['session_time'],
+                'logged_at': axon.session_time,
                 'tensor_shape': list(source_neuron.expectation_tensor.shape),
                 'pattern_names': source_neuron.pattern_names,
                 'position_names': source_neuron.position_names,
@@ -4724,7 +7137,9 @@ class AxonNetwork:
             self.queues['CIRCUITRY'][neuron_id] = {
                 'neuron_id': neuron_id,
                 'coordinate': source_neuron.coordinate,
-                'matrix_history': [],  # List index = cycle/sample number
+                'matrix_history': [],  # List index + history_offset = cycle/sample number
+                'history_offset': 0,   # samples compacted away from the front
+                'compacted_history': [],  # summaries of compacted samples, oldest first
                 'stats': {
                     'total_cycles': 0,
                     'pattern_cycles': defaultdict(int),
@@ -4737,38 +7152,40 @@ class AxonNetwork:
         circuitry_entry = self.queues['CIRCUITRY'][neuron_id]
         
         # Extract matrix data from axon
-        cycle = axon['data'].get('cycle', 0)
-        pattern = axon['data'].get('pattern', 'UNKNOWN')
+        data = axon.data
+        cycle = data.get('cycle', 0)
+        pattern = data.get('pattern', 'UNKNOWN')
         
         # Create matrix snapshot
         matrix_snapshot = {
             'cycle': cycle,
-            'session_time': axon['session_time'],
+            'session_time': axon.session_time,
             'pattern': pattern,
-            'pattern_idx': axon['data'].get('pattern_idx', -1),
+            'pattern_idx': data.get('pattern_idx', -1),
             
             # Matrix states (for visualization)
-            'b_vector': axon['data'].get('b_vector', []),
-            'B_matrix_diag': axon['data'].get('B_matrix_diag', []),
-            'V_matrix_trace': axon['data'].get('V_matrix_trace', 0.0),
+            'b_vector': data.get('b_vector', []),
+            'B_matrix_diag': data.get('B_matrix_diag', []),
+            'V_matrix_trace': data.get('V_matrix_trace', 0.0),
             
             # Confidence metrics
-            'confidence': axon['data'].get('confidence', 0.0),
-            'eigen_certainty': axon['data'].get('eigen_certainty', 0.0),
-            'eigen_category': axon['data'].get('eigen_category', 'UNKNOWN'),
+            'confidence': data.get('confidence', 0.0),
+            'eigen_certainty': data.get('eigen_certainty', 0.0),
+            'eigen_category': data.get('eigen_category', 'UNKNOWN'),
             
             # Dot products for neighbor accuracy visualization
-            'dot_products': axon['data'].get('dot_products', {}),
+            'dot_products': data.get('dot_products', {}),
             
             # Process state
-            'recycling_iteration': axon['data'].get('recycling_iteration', 0),
-            'void_count': axon['data'].get('void_count', 0),
-            'positions_observed': axon['data'].get('positions_observed', []),
-            'assignment': axon['data'].get('assignment', {})
+            'recycling_iteration': data.get('recycling_iteration', 0),
+            'void_count': data.get('void_count', 0),
+            'positions_observed': data.get('positions_observed', []),
+            'assignment': data.get('assignment', {})
         }
         
-        # Add to history (list index = sample/frame number)
+        # Add to history (list index + history_offset = sample/frame number)
         circuitry_entry['matrix_history'].append(matrix_snapshot)
+        self.memory_budget.charge(neuron_id, estimate_retained_bytes(matrix_snapshot) + 32)
         
         # Update stats
         circuitry_entry['stats']['total_cycles'] += 1
@@ -4783,23 +7200,77 @@ class AxonNetwork:
         
         # Update current pattern in circuitry entry
         circuitry_entry['pattern'] = pattern
+        
+        self.aggregates.on_circuitry(neuron_id, matrix_snapshot, circuitry_entry)
+        
+        # Feed the population prior (full B held by reference on the axon, not retained)
+        if self.pattern_priors is not None:
+            self.pattern_priors.contribute(pattern, data.get('B_matrix'), data.get('b_vector'),
+                                           certainty=data.get('eigen_certainty', 0.0))
+    
+    def enable_pattern_priors(self, decay: float = 0.05, min_contributions: int = 10,
+                              blend_weight: float = 0.0) -> 'PatternPriorService':
+        """Share per-pattern B / b priors across neurons (off by default)"""
+        self.pattern_priors = PatternPriorService(decay, min_contributions, blend_weight)
+        return self.pattern_priors
     
     def _handle_broadcast(self, axon: Dict):
-        """Handle broadcast axon types"""
-        broadcast_log = axon.copy()
-        original_type = axon['axon_type']
-        broadcast_log['axon_type'] = f'BROADCAST_{original_type}_INTENT'
-        
-        pattern = axon['source']['pattern']
-        if pattern in self.queues:
-            if axon['source']['id'] not in self.queues[pattern]:
-                self.queues[pattern][axon['source']['id']] = []
-            self.queues[pattern][axon['source']['id']].append(broadcast_log)
+        """Handle broadcast axon types - delivered by reference to interested subscribers"""
+        if axon.axon_type is AxonType.DOM_EVENT and axon.source_coordinate:
+            # Siblings may have shifted too - expire cached states under the parent
+            self.coordinate_index.invalidate(tuple(axon.source_coordinate)[:-1])
+        self.axon_bus.publish(axon)
+    
+    def subscribe(self, name: str, axon_types: Optional[Set[str]] = None,
+                  source_ids: Optional[Set[str]] = None,
+                  coordinate_prefix: Optional[Tuple[int, ...]] = None,
+                  ignore_source: Optional[str] = None,
+                  maxlen: int = 256, notify=None) -> AxonSubscription:
+        """Subscribe to broadcasts by axon type, source neuron and/or coordinate prefix"""
+        return self.axon_bus.subscribe(name, axon_types, source_ids, coordinate_prefix,
+                                       ignore_source, maxlen, notify)
+    
+    def unsubscribe(self, name: str):
+        self.axon_bus.unsubscribe(name)
     
     # ===== EXISTING METHODS (updated for new structure) =====
     
     def coordinate_has_neuron(self, coordinate: Tuple[int, ...]) -> bool:
-        return coordinate in self.neuron_registry
+        return coordinate in self.neuron_registry or coordinate in self.remote_neurons
+    
+    # ===== CLUSTER PARTITIONS =====
+    
+    def register_remote_neuron(self, coordinate: Tuple[int, ...], neuron_id: str,
+                               pattern: str, partition: int):
+        """Record a neuron owned by another cluster partition (so nobody grows a duplicate)"""
+        self.remote_neurons[coordinate] = {'id': neuron_id, 'pattern': pattern, 'partition': partition}
+    
+    def inject_remote_axon(self, axon_type: str, source_id: str, source_coordinate,
+                           source_pattern: str, data: Dict) -> 'Axon':
+        """
+        Publish a broadcast fired in another cluster partition to local subscribers.
+        Marked source_state 'REMOTE' so partition forwarders never send it back.
+        """
+        axon_type = AxonType.resolve(axon_type)
+        source_coordinate = tuple(source_coordinate) if source_coordinate else None
+        axon = Axon(self._next_axon_id(), axon_type, self.now_ns(), source_id,
+                    source_coordinate, source_pattern, 'REMOTE', data)
+        
+        if axon_type is AxonType.VOID_BROADCAST and data.get('void_coordinate'):
+            # Known void here too - without re-broadcasting it
+            self.get_void_coordinates()
+            self._void_coordinates.add(tuple(data['void_coordinate']))
+            self.coordinate_index.mark_missing(tuple(data['void_coordinate']))
+        elif axon_type is AxonType.DOM_EVENT and source_coordinate:
+            self.coordinate_index.invalidate(source_coordinate[:-1])
+        elif source_coordinate and source_coordinate in self.remote_neurons:
+            self.remote_neurons[source_coordinate]['pattern'] = source_pattern
+        
+        self.axon_bus.publish(axon)
+        return axon
+    
+    def is_void_coordinate(self, coordinate: Tuple[int, ...]) -> bool:
+        return coordinate in getattr(self, '_void_coordinates', ())
     
     def get_void_coordinates(self) -> Set[Tuple[int, ...]]:
         if not hasattr(self, '_void_coordinates'):
@@ -4812,48 +7283,87 @@ class AxonNetwork:
         
         if coordinate not in self._void_coordinates:
             self._void_coordinates.add(coordinate)
+            self.coordinate_index.mark_missing(coordinate)
             
             # Fire void broadcast to all pattern queues
-            void_axon = {
-                'axon_id': f"void_{self.axon_counter}",
-                'axon_type': 'VOID_BROADCAST',
-                'session_time': time.time() - self.session_start_time,
-                'source': {'id': source_neuron_id, 'coordinate': None, 'pattern': 'SYSTEM'},
-                'data': {
+            void_axon = Axon(
+                self._next_axon_id(), AxonType.VOID_BROADCAST,
+                time.monotonic_ns() - self.session_origin_ns,
+                source_neuron_id, self.neuron_coordinates.get(source_neuron_id), 'SYSTEM', 'SYSTEM',
+                {
                     'void_coordinate': coordinate,
                     'source_neuron': source_neuron_id,
                     'total_voids': len(self._void_coordinates)
                 }
-            }
+            )
             
-            # Add to all pattern queues for affected neurons
-            for pattern in ['DATA_INPUT', 'ACTION_ELEMENT', 'CONTEXT_ELEMENT', 
-                          'STRUCTURAL', 'UNKNOWN']:
-                if pattern in self.queues:
-                    # This will be picked up by neurons when they check their queues
-                    pass
+            # Deliver to subscribers (picked up by neurons when they drain their inboxes)
+            self.axon_bus.publish(void_axon)
 
 
-    def get_axon_log_for_neuron(self, neuron_id: str, pattern_filter: str = None) -> List[Dict]:
-        """Get axon history for specific neuron (compatible with existing calls)"""
-        neuron_axons = []
+    def now_ns(self) -> int:
+        """Current time on the axon clock (monotonic ns since session start)"""
+        return time.monotonic_ns() - self.session_origin_ns
+    
+    def get_axon_log_for_neuron(self, neuron_id: str, pattern_filter: str = None,
+                                since: float = None, axon_types=None) -> List[Dict]:
+        """
+        Get axon history for specific neuron (compatible with existing calls).
+        since is session seconds; axon_types limits to those types.
+        """
+        since_ns = int(since * 1e9) if since is not None else 0
         
         if pattern_filter and pattern_filter in self.queues:
-            if neuron_id in self.queues[pattern_filter]:
-                neuron_axons.extend(self.queues[pattern_filter][neuron_id])
-        else:
-            # Check all pattern queues
-            for pattern_name in ['DATA_INPUT', 'ACTION_ELEMENT', 'CONTEXT_ELEMENT', 
-                               'STRUCTURAL', 'UNKNOWN']:
-                if neuron_id in self.queues[pattern_name]:
-                    neuron_axons.extend(self.queues[pattern_name][neuron_id])
-        
-        return sorted(neuron_axons, key=lambda x: x['session_time'])
+            axons = self.queues[pattern_filter].get(neuron_id, [])
+            if axon_types is not None:
+                wanted = {AxonType.resolve(t) for t in axon_types}
+                axons = [a for a in axons if a.axon_type in wanted]
+            return [a for a in axons if a.t_ns >= since_ns]
+        
+        neuron_log = self.neuron_logs.get(neuron_id)
+        if neuron_log is None:
+            return []
+        return neuron_log.since(since_ns, axon_types)
+    
+    def get_outcome_tallies(self, neuron_id: str, window: float = None) -> Dict[str, int]:
+        """Running SUCCESS / FAILURE / DISCOVERY weights per pattern for this neuron"""
+        neuron_log = self.neuron_logs.get(neuron_id)
+        if neuron_log is None:
+            return {}
+        return neuron_log.get_tallies(self.now_ns(), window)
     
     def get_neuron(self, neuron_id: str):
             """Get neuron object by ID"""
             return self.neuron_objects.get(neuron_id)
         
+    def get_neuron_coordinate(self, neuron_id: str) -> Optional[Tuple[int, ...]]:
+        """Get coordinate for a neuron ID (reverse index)"""
+        return self.neuron_coordinates.get(neuron_id)
+    
+    def get_neurons_at_coordinate(self, coordinate: Tuple[int, ...]) -> Set[str]:
+        """Get IDs of all neurons indexed at a coordinate"""
+        return set(self.coordinate_neurons.get(coordinate, ()))
+    
+    def _index_neuron(self, neuron_id: str, coordinate: Tuple[int, ...]):
+        """Add neuron to the reverse indexes, dropping any stale coordinate"""
+        old_coordinate = self.neuron_coordinates.get(neuron_id)
+        if old_coordinate is not None and old_coordinate != coordinate:
+            self._unindex_neuron(neuron_id)
+        
+        self.neuron_coordinates[neuron_id] = coordinate
+        self.coordinate_neurons[coordinate].add(neuron_id)
+    
+    def _unindex_neuron(self, neuron_id: str) -> Optional[Tuple[int, ...]]:
+        """Remove neuron from the reverse indexes, returns its last coordinate"""
+        coordinate = self.neuron_coordinates.pop(neuron_id, None)
+        if coordinate is not None:
+            ids = self.coordinate_neurons.get(coordinate)
+            if ids is not None:
+                ids.discard(neuron_id)
+                if not ids:
+                    del self.coordinate_neurons[coordinate]
+        return coordinate
+    
     # Also add cleanup when neuron is removed
     def remove_neuron(self, neuron_id: str):
         """Remove neuron from network"""
@@ -4861,17 +7371,34 @@ class AxonNetwork:
         if neuron_id in self.neuron_objects:
             del self.neuron_objects[neuron_id]
         
-        # Remove from registry
-        for coord, data in list(self.neuron_registry.items()):
-            if data.get('id') == neuron_id:
-                del self.neuron_registry[coord]
-                break
-
+        # Remove from registry via the reverse index
+        coord = self._unindex_neuron(neuron_id)
+        if coord is not None and self.neuron_registry.get(coord, {}).get('id') == neuron_id:
+            del self.neuron_registry[coord]
+        
+        # Retained history goes with the neuron
+        for pattern in ['DATA_INPUT', 'ACTION_ELEMENT', 'CONTEXT_ELEMENT', 'STRUCTURAL', 'UNKNOWN']:
+            axons = self.queues[pattern].pop(neuron_id, None)
+            if axons is not None:
+                self.aggregates.on_queue_trim(pattern, len(axons), neuron_list_removed=True)
+        self.queues['CIRCUITRY'].pop(neuron_id, None)
+        self.neuron_logs.pop(neuron_id, None)
+        self.compacted_axon_counts.pop(neuron_id, None)
+        self.memory_budget.forget(neuron_id)
+        
+        self.aggregates.on_remove(neuron_id)
+        self.sampling_policy.forget(neuron_id)
+    
     def register_neuron(self, neuron, neighbor_info: Dict = None):
             """Register neuron in network"""
-            session_time = time.time() - self.session_start_time
-            
-            self.neuron_registry[neuron.coordinate] = {
+            self.register_neurons([neuron], neighbor_info)
+    
+    def register_neurons(self, neurons: List, neighbor_info: Dict = None):
+        """Register a batch of neurons in one pass (one timestamp, one registry update)"""
+        session_time = time.time() - self.session_start_time
+        
+        self.neuron_registry.update({
+            neuron.coordinate: {
                 'id': neuron.id,
                 'pattern': neuron.current_pattern,
                 'state': getattr(neuron, 'state', 'DEFAULT').value if hasattr(neuron, 'state') else 'UNKNOWN',
@@ -4879,8 +7406,14 @@ class AxonNetwork:
                 'registered_at': session_time,
                 'last_axon_at': session_time
             }
-            
-            self.neuron_objects[neuron.id] = neuron
+            for neuron in neurons
+        })
+        self.neuron_objects.update((neuron.id, neuron) for neuron in neurons)
+        
+        for neuron in neurons:
+            self._index_neuron(neuron.id, neuron.coordinate)
+            self.aggregates.on_register(neuron.id, neuron.current_pattern, 
+                                        getattr(neuron, 'processing_phase', 'UNKNOWN'))
         
 
     def _update_neuron_registry(self, neuron, session_time: float):
@@ -4891,25 +7424,20 @@ class AxonNetwork:
                 getattr(neuron, 'state', 'DEFAULT').value 
                 if hasattr(neuron, 'state') else 'UNKNOWN'
             )
+            self.aggregates.on_state(neuron.id, getattr(neuron, 'processing_phase', 'UNKNOWN'))
+            self.aggregates.on_pattern(neuron.id, neuron.current_pattern)
     
     def get_next_nexus_axon(self) -> Optional[Dict]:
-        if not self.queues['NEXUS']:
-            return None
-        return self.queues['NEXUS'].popleft()
+        """Next NEXUS axon by lane priority (control, growth, info)"""
+        return self.queues['NEXUS'].get()
     
     def get_queue_snapshots(self) -> Dict:
         """Get complete queue snapshots for visualization"""
         current_session_time = time.time() - self.session_start_time
         
-        # Count axons in pattern queues
-        pattern_counts = {}
-        for pattern_name in ['DATA_INPUT', 'ACTION_ELEMENT', 'CONTEXT_ELEMENT', 
-                           'STRUCTURAL', 'UNKNOWN']:
-            total_axons = sum(len(axon_list) for axon_list in self.queues[pattern_name].values())
-            pattern_counts[pattern_name] = {
-                'neuron_count': len(self.queues[pattern_name]),
-                'axon_count': total_axons
-            }
+        # Pattern queue depths (maintained incrementally)
+        pattern_counts = {pattern_name: dict(depth) 
+                          for pattern_name, depth in self.aggregates.queue_depths.items()}
         
         return {
             'session': {
@@ -4922,10 +7450,24 @@ class AxonNetwork:
                 'neuron_count': len(self.queues['CIRCUITRY']),
                 'tensor_logged': self.tensor_structure_logged
             },
+            'subscriptions': self.axon_bus.get_metrics(),
+            'flags': self.flag_registry.get_metrics(),
+            'sampling': self.sampling_policy.get_metrics(),
+            'memory': self.memory_budget.get_metrics(),
+            'pattern_priors': self.pattern_priors.get_metrics() if self.pattern_priors else {},
+            'remote_neurons': len(self.remote_neurons),
+            'coordinate_index': self.coordinate_index.get_metrics(),
+            'membranes': self.void_system.get_metrics(),
+            'staging': dict(self.staging_stats, enabled=self.staging_enabled,
+                            pending=self.get_staged_count()),
             'statistics': {
                 'total_axons_fired': self.axon_counter,
                 'neurons_registered': len(self.neuron_registry),
-                'nexus_queue_size': len(self.queues['NEXUS'])
+                'nexus_queue_size': len(self.queues['NEXUS']),
+                'nexus_lanes': self.queues['NEXUS'].get_metrics(),
+                'neuron_states': self.aggregates.get_state_counts(),
+                'neuron_patterns': self.aggregates.get_pattern_counts(),
+                'mean_certainty': self.aggregates.mean_confidence()
             }
         }
     
@@ -4975,45 +7517,19 @@ class AxonNetwork:
         return []
     
     def get_all_circuitry_summary(self) -> Dict:
-        """Get summary of all neurons' circuitry for dashboard"""
-        summary = {
-            'neurons': {},
+        """Get summary of all neurons' circuitry for dashboard (read from aggregates)"""
+        aggregates = self.aggregates
+        return {
+            'neurons': dict(aggregates.neuron_summaries),
             'aggregate': {
                 'total_neurons': len(self.queues['CIRCUITRY']),
-                'total_cycles': 0,
-                'average_confidence': 0.0,
-                'pattern_distribution': defaultdict(int),
-                'eigen_distribution': defaultdict(int)
+                'total_cycles': aggregates.total_cycles,
+                'average_confidence': aggregates.mean_confidence(),
+                'pattern_distribution': dict(aggregates.pattern_cycles),
+                'eigen_distribution': {category: count for category, count 
+                                       in aggregates.eigen_distribution.items() if count > 0}
             }
         }
-        
-        all_confidences = []
-        for neuron_id, circuitry in self.queues['CIRCUITRY'].items():
-            # Neuron summary
-            summary['neurons'][neuron_id] = {
-                'pattern': circuitry['pattern'],
-                'total_cycles': circuitry['stats']['total_cycles'],
-                'pattern_switches': circuitry['stats']['pattern_switches'],
-                'latest_confidence': circuitry['matrix_history'][-1]['confidence'] 
-                    if circuitry['matrix_history'] else 0.0,
-                'eigen_category': circuitry['matrix_history'][-1]['eigen_category'] 
-                    if circuitry['matrix_history'] else 'UNKNOWN'
-            }
-            
-            # Update aggregate stats
-            summary['aggregate']['total_cycles'] += circuitry['stats']['total_cycles']
-            for pattern, count in circuitry['stats']['pattern_cycles'].items():
-                summary['aggregate']['pattern_distribution'][pattern] += count
-            
-            if circuitry['matrix_history']:
-                latest = circuitry['matrix_history'][-1]
-                all_confidences.append(latest['confidence'])
-                summary['aggregate']['eigen_distribution'][latest['eigen_category']] += 1
-        
-        if all_confidences:
-            summary['aggregate']['average_confidence'] = sum(all_confidences) / len(all_confidences)
-        
-        return summary
 
 
 
@@ -7,8 +7,10 @@ Complete fusion of PeterBot's intelligence with DOMinator's proven coordinate sy
 
 import threading 
 import subprocess
+import heapq
+import itertools
+import functools
 import random
-import pygame
 from selenium.webdriver.chrome.options import Options
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -294,10 +296,441 @@ class TimingController:
             'CONTEXT_ELEMENT': 0.5,      # 500ms - context updates
             'DYNAMIC_CONTAINER': 0.05,   # 50ms - rapid content generation
             'STRUCTURAL': 2.0,           # 2s - static elements
+            'UNKNOWN': 0.5,              # 500ms - still being classified
         }
-        return intervals.get(pattern, 2.0)
+        interval = intervals.get(pattern, 2.0)
+        if is_active:
+            interval *= 0.5   # recently changed - look again sooner
+        if has_sync_partner:
+            interval *= 0.75  # siblings in the same pattern evolve together
+        return interval
+
+
+class NeuronScheduler:
+    """
+    Deadline-ordered neuron cycle dispatch over a fixed worker pool.
+    Each neuron is due again one pattern interval after its last cycle finished.
+    """
+    
+    def __init__(self, workers: int = 4, timing=TimingController):
+        self.worker_count = workers
+        self.timing = timing
+        
+        self._heap = []       # (due, seq, neuron_id)
+        self._due = {}        # neuron_id -> due time of its live heap entry
+        self._neurons = {}    # neuron_id -> neuron
+        self._running = set()
+        self._wake_pending = set()  # woken while running - reschedule immediately
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._threads = []
+        
+        self.stats = {'dispatched': 0, 'errors': 0, 'wakes': 0,
+                      'lateness_ms_total': 0.0, 'lateness_ms_max': 0.0}
+        self.cycles_by_pattern = defaultdict(int)
+    
+    # ===== NEURON MEMBERSHIP =====
+    
+    def add(self, neuron, delay: float = 0.0):
+        self.add_batch([neuron], delay=delay)
+    
+    def add_batch(self, neurons: List, delay: float = 0.0, spread: float = 0.0):
+        """Enqueue a spawn batch under one lock; first cycles staggered across `spread` seconds"""
+        start = time.monotonic() + delay
+        step = spread / len(neurons) if neurons else 0.0
+        with self._cond:
+            for i, neuron in enumerate(neurons):
+                self._neurons[neuron.id] = neuron
+                self._push(neuron.id, start + step * i, notify=False)
+            self._cond.notify_all()
+        for neuron in neurons:
+            if hasattr(neuron, 'wake_callback'):
+                neuron.wake_callback = functools.partial(self.wake, neuron.id)
+    
+    def remove(self, neuron_id: str):
+        with self._cond:
+            neuron = self._neurons.pop(neuron_id, None)
+            if neuron is not None and hasattr(neuron, 'wake_callback'):
+                neuron.wake_callback = None
+            self._due.pop(neuron_id, None)
+            self._wake_pending.discard(neuron_id)
+    
+    def has(self, neuron_id: str) -> bool:
+        return neuron_id in self._neurons
+    
+    def wake(self, neuron_id: str):
+        """Make a neuron due now (e.g. DOM change / neighbour activity)"""
+        with self._cond:
+            if neuron_id not in self._neurons:
+                return
+            self.stats['wakes'] += 1
+            if neuron_id in self._running:
+                self._wake_pending.add(neuron_id)
+            else:
+                self._push(neuron_id, time.monotonic())
+    
+    def _push(self, neuron_id: str, due: float, notify: bool = True):
+        """Caller holds the condition. Older heap entries for the neuron become stale."""
+        current = self._due.get(neuron_id)
+        if current is not None and current <= due:
+            return
+        self._due[neuron_id] = due
+        heapq.heappush(self._heap, (due, next(self._seq), neuron_id))
+        if notify:
+            self._cond.notify()
+    
+    def interval_for(self, neuron) -> float:
+        interval = self.timing.get_interval_for_pattern(
+            neuron.current_pattern,
+            is_active=getattr(neuron, 'is_active', False),
+            has_sync_partner=getattr(neuron, 'has_sync_partner', False)
+        )
+        # Settled neurons are backed off by their adaptive rate controller
+        rate_controller = getattr(neuron, 'rate_controller', None)
+        if rate_controller is not None:
+            interval = rate_controller.scale(interval)
+        return interval
+    
+    # ===== WORKERS =====
+    
+    def start(self):
+        if self._threads:
+            return
+        self._stopping = False
+        for i in range(self.worker_count):
+            thread = threading.Thread(target=self._worker, name=f"neuron-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+    
+    def stop(self, timeout: float = 5.0):
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+    
+    def _next_due(self):
+        """Pop the next due neuron (caller holds the condition). Returns (neuron_id, due) or wait time."""
+        while self._heap:
+            due, _, neuron_id = self._heap[0]
+            if self._due.get(neuron_id) != due:
+                heapq.heappop(self._heap)  # stale entry
+                continue
+            now = time.monotonic()
+            if due > now:
+                return None, due - now
+            heapq.heappop(self._heap)
+            del self._due[neuron_id]
+            return neuron_id, due
+        return None, None
+    
+    def _worker(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._stopping:
+                        return
+                    neuron_id, due_or_wait = self._next_due()
+                    if neuron_id is not None:
+                        break
+                    self._cond.wait(due_or_wait)
+                neuron = self._neurons.get(neuron_id)
+                if neuron is None:
+                    continue
+                self._running.add(neuron_id)
+            
+            lateness_ms = (time.monotonic() - due_or_wait) * 1000
+            self.stats['lateness_ms_total'] += lateness_ms
+            self.stats['lateness_ms_max'] = max(self.stats['lateness_ms_max'], lateness_ms)
+            
+            try:
+                neuron.process_cycle()
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"⚠️ Neuron {neuron_id} cycle error: {e}")
+            
+            with self._cond:
+                self._running.discard(neuron_id)
+                self.stats['dispatched'] += 1
+                self.cycles_by_pattern[neuron.current_pattern] += 1
+                if neuron_id not in self._neurons or neuron.processing_phase == "DESTROYED":
+                    self._neurons.pop(neuron_id, None)
+                    continue
+                if neuron_id in self._wake_pending:
+                    self._wake_pending.discard(neuron_id)
+                    self._push(neuron_id, time.monotonic())
+                else:
+                    self._push(neuron_id, time.monotonic() + self.interval_for(neuron))
+    
+    def get_metrics(self) -> Dict:
+        with self._cond:
+            dispatched = self.stats['dispatched']
+            return {
+                'workers': len(self._threads),
+                'neurons': len(self._neurons),
+                'running': len(self._running),
+                'dispatched': dispatched,
+                'errors': self.stats['errors'],
+                'wakes': self.stats['wakes'],
+                'mean_lateness_ms': self.stats['lateness_ms_total'] / dispatched if dispatched else 0.0,
+                'max_lateness_ms': self.stats['lateness_ms_max'],
+                'backed_off': sum(1 for n in self._neurons.values() 
+                                  if getattr(getattr(n, 'rate_controller', None), 'backed_off', False)),
+                'cycles_by_pattern': dict(self.cycles_by_pattern)
+            }
+
+
+def parse_coordinate(coordinate) -> Optional[Tuple[int, ...]]:
+    """Collapse tuple / list / numpy / "0,1,2" / "(0, 1, 2)" spellings of a coordinate"""
+    if coordinate is None:
+        return None
+    try:
+        if isinstance(coordinate, str):
+            coordinate = [c for c in coordinate.strip('()[] ').split(',') if c.strip()]
+        return tuple(int(c) for c in coordinate)
+    except (TypeError, ValueError):
+        return None
+
+
+class GrowthAdmissionController:
+    """
+    Sits between the NEXUS growth lane and neuron creation.
+    Signals for the same coordinate coalesce into one candidate; candidates are
+    admitted strongest first (vector_norm x distinct requesters) against a
+    population cap and a token-bucket spawn rate. The rest wait, then expire.
+    """
+
+    def __init__(self, max_population: int = 500, spawn_rate: float = 20.0,
+                 burst: int = None, max_pending: int = 2000, candidate_ttl: float = 30.0):
+        self.max_population = max_population
+        self.spawn_rate = spawn_rate              # spawns per second
+        self.burst = burst if burst is not None else max(1, int(spawn_rate))
+        self.max_pending = max_pending
+        self.candidate_ttl = candidate_ttl        # seconds a deferred candidate may wait
+
+        self.pending = {}                          # canonical coordinate -> candidate
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+
+        self.counts = {'received': 0, 'coalesced': 0, 'admitted': 0,
+                       'deferred': 0, 'rejected': 0}
+        self.reject_reasons = defaultdict(int)
+
+    @staticmethod
+    def canonical(coordinate) -> Optional[Tuple[int, ...]]:
+        return parse_coordinate(coordinate)
+
+    @staticmethod
+    def score(candidate: Dict) -> float:
+        return candidate['vector_norm'] * len(candidate['requesters'])
+
+    def offer(self, axon, now: float = None) -> bool:
+        """Fold one GROWTH_SIGNAL into the candidate set; False if rejected outright"""
+        now = now if now is not None else time.monotonic()
+        data = axon.get('data', {}) or {}
+        self.counts['received'] += 1
+
+        coord = self.canonical(data.get('coordinate'))
+        if coord is None:
+            self._reject('bad_coordinate')
+            return False
+
+        vector_norm = float(data.get('vector_norm', 0.0) or 0.0)
+        requester = data.get('source_neuron') or axon.get('source_neuron')
+
+        candidate = self.pending.get(coord)
+        requesters = set(data.get('requesters') or ())
+        if requester:
+            requesters.add(requester)
+
+        if candidate is not None:
+            self.counts['coalesced'] += 1
+            candidate['requesters'] |= requesters
+            if data.get('from_position'):
+                candidate['positions'].add(data['from_position'])
+            candidate['vector_norm'] = max(candidate['vector_norm'], vector_norm)
+            return True
+
+        candidate = {
+            'coordinate': coord,
+            'vector_norm': vector_norm,
+            'requesters': requesters,
+            'positions': {data['from_position']} if data.get('from_position') else set(),
+            'first_seen': now,
+            'deferred': False,
+            'axon': axon
+        }
+
+        if len(self.pending) >= self.max_pending:
+            weakest = min(self.pending.values(), key=self.score)
+            if self.score(weakest) >= self.score(candidate):
+                self._reject('backlog_full')
+                return False
+            del self.pending[weakest['coordinate']]
+            self._reject('backlog_full')
+
+        self.pending[coord] = candidate
+        return True
+
+    def add_requesters(self, requesters_for):
+        """Fold requesters suppressed upstream (e.g. by the flag registry) into pending candidates"""
+        for coord, candidate in self.pending.items():
+            candidate['requesters'] |= requesters_for(coord)
+
+    def admit(self, population: int, exists=None, now: float = None) -> List[Dict]:
+        """Candidates allowed to spawn this tick, strongest first"""
+        now = now if now is not None else time.monotonic()
+        self._refill(now)
+
+        for coord, candidate in list(self.pending.items()):
+            if exists is not None and exists(coord):
+                del self.pending[coord]
+                self._reject('already_exists')
+            elif now - candidate['first_seen'] > self.candidate_ttl:
+                del self.pending[coord]
+                self._reject('expired')
+
+        if not self.pending:
+            return []
+
+        room = self.max_population - population
+        n = max(0, min(room, int(self._tokens), len(self.pending)))
+        admitted = heapq.nlargest(n, self.pending.values(), key=self.score) if n else []
+        for candidate in admitted:
+            del self.pending[candidate['coordinate']]
+
+        self._tokens -= len(admitted)
+        self.counts['admitted'] += len(admitted)
+        for candidate in self.pending.values():
+            if not candidate['deferred']:
+                candidate['deferred'] = True
+                self.counts['deferred'] += 1
+        return admitted
+
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.spawn_rate)
+
+    def _reject(self, reason: str):
+        self.counts['rejected'] += 1
+        self.reject_reasons[reason] += 1
+
+    def get_metrics(self) -> Dict:
+        return {
+            **self.counts,
+            'pending': len(self.pending),
+            'max_population': self.max_population,
+            'spawn_rate': self.spawn_rate,
+            'tokens': round(self._tokens, 2),
+            'reject_reasons': dict(self.reject_reasons)
+        }
+
+class CheckpointStore:
+    """
+    Per-site neuron checkpoints: one versioned JSON file per site, keyed by
+    coordinate ("0,1,2" as in the priori). Each entry remembers the priori
+    element hash it was learned against; a changed hash or a format version
+    bump means that coordinate starts cold.
+    """
+    
+    VERSION = 1
+    MAX_SESSIONS = 20  # cold / warm steady-state history kept in the file
+    
+    def __init__(self, site: str, directory: str = "Checkpoints"):
+        self.site = site
+        self.directory = directory
+        safe_name = ''.join(c if c.isalnum() or c in '-_.' else '_' for c in site) or 'default'
+        self.path = os.path.join(directory, f"{safe_name}.json")
+        self.stats = {'loaded': 0, 'stale': 0, 'saved': 0, 'saves': 0, 'version_mismatch': False}
+    
+    @staticmethod
+    def _key(coordinate: Tuple[int, ...]) -> str:
+        return ",".join(str(c) for c in coordinate)
+    
+    def _read(self) -> Dict:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Unreadable checkpoint {self.path}: {e}")
+            return {}
+        if data.get('version') != self.VERSION:
+            self.stats['version_mismatch'] = True
+            print(f"⚠️ Checkpoint version {data.get('version')} != {self.VERSION} - cold start")
+            return {}
+        return data
+    
+    def load(self, coordinate_space: Dict[Tuple, Dict]) -> Dict[Tuple, Dict]:
+        """coordinate -> neuron state for entries still valid against the priori"""
+        states = {}
+        for key, entry in self._read().get('neurons', {}).items():
+            coord = parse_coordinate(key)
+            if coord is None or 'state' not in entry:
+                continue
+            priori_hash = coordinate_space.get(coord, {}).get('hash')
+            if entry.get('priori_hash') and priori_hash and entry['priori_hash'] != priori_hash:
+                self.stats['stale'] += 1
+                continue
+            states[coord] = entry['state']
+        self.stats['loaded'] = len(states)
+        return states
+    
+    def save(self, neurons: Dict[Tuple, Any], coordinate_space: Dict[Tuple, Dict], 
+             session: Dict = None) -> int:
+        """Merge this session's neurons into the site file (atomic replace)"""
+        data = self._read()
+        entries = data.get('neurons', {})
+        sessions = data.get('sessions', [])
+        
+        saved = 0
+        for coord, neuron in neurons.items():
+            if neuron.cycle_count == 0:
+                continue
+            entries[self._key(coord)] = {
+                'priori_hash': coordinate_space.get(coord, {}).get('hash'),
+                'saved_at': time.time(),
+                'state': neuron.export_state()
+            }
+            saved += 1
+        
+        if session:
+            sessions = [s for s in sessions if s.get('session_id') != session.get('session_id')]
+            sessions = (sessions + [session])[-self.MAX_SESSIONS:]
+        
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': self.VERSION, 'site': self.site, 'saved_at': time.time(),
+                       'sessions': sessions, 'neurons': entries}, 
+                      f, default=axon_json_default)
+        os.replace(tmp_path, self.path)
+        
+        self.stats['saved'] = saved
+        self.stats['saves'] += 1
+        return saved
+    
+    def get_metrics(self) -> Dict:
+        return {'path': self.path, **self.stats}
 
 # ===== UPDATED COSMIC BACKGROUND =====
+# ===== PYGAME (selector UI only - headless runs never load it) =====
+pygame = None
+
+
+def _load_pygame():
+    """Import pygame on first use by the selector UI"""
+    global pygame
+    if pygame is None:
+        import pygame as _pygame
+        pygame = _pygame
+    return pygame
+
+
 class CosmicBackground:
     """DEEP SPACE BACKGROUND WITH SPIDERBOT THEME"""
     
@@ -674,6 +1107,7 @@ class SpideyCoordinateSelector:
         self.coord_positions = {}  # Will be calculated when in confirmation mode
         
         # Initialize PyGame
+        _load_pygame()
         pygame.init()
         self.screen = pygame.display.set_mode((screen_width, screen_height))
         pygame.display.set_caption("🕸️ SPIDERBOT - Unified Coordinate Interface")
@@ -2057,7 +2491,12 @@ Nexus only coordinates creation and exports rich data.
 
 class Nexus:
     
-    def __init__(self, port="9223"):
+    def __init__(self, port="9223", axon_sampling: str = "debug", memory_budget_mb: float = 256.0,
+                 max_neurons: int = 500, spawn_rate: float = 20.0,
+                 site: str = None, warm_start: bool = True,
+                 pattern_priors: bool = False, prior_blend: float = 0.0,
+                 cycle_budget_ms: float = 250.0,
+                 membrane_interval: float = 0.25, driver=None):
         # ===== SESSION TIMING =====
         import uuid
         self.session_id = f"nexus_{uuid.uuid4().hex[:8]}"
@@ -2079,13 +2518,21 @@ class Nexus:
         os.makedirs(self.matrix_dir, exist_ok=True)
         
         # ===== CORE SYSTEMS (UNCHANGED) =====
-        self.driver = None
+        self.port = port  # Chrome debug port this Nexus attaches to
+        self.driver = driver  # injected WebDriver is used as-is instead of attaching
+        self.setup_failure = None  # setup step run_monitoring gave up at, if any
         self.coordinate_space = {}
         self.selected_coordinates = []
         self.axon_network = None
         self.neurons: Dict[Tuple, Neuron] = {}
         self.growth_signals_processed = 0
         self.void_coordinates = set()
+        self.axon_sampling = axon_sampling  # AxonSamplingPolicy preset ('debug' logs everything)
+        self.memory_budget_mb = memory_budget_mb  # retained neuron history before compaction
+        self.pattern_priors = pattern_priors      # share per-pattern B / b priors across neurons
+        self.prior_blend = prior_blend            # weight existing neurons give the prior each cycle
+        self.cycle_budget_ms = cycle_budget_ms    # per-cycle deadline before optional phase work defers
+        self.membrane_interval = membrane_interval  # seconds between batched membrane (void reroute) passes
         
         # ===== MONITORING STATE (UNCHANGED) =====
         self.monitoring_active = False
@@ -2094,6 +2541,8 @@ class Nexus:
         self.frame_counter = 0
         self.last_dump_time = 0
         self.dump_interval = 1.0  # Dump every 1 second
+        self.staged_merge_interval = 0.02  # staged axons wait at most about this long for a merge
+        self.last_merge_time = 0.0
         
         # ===== ENTER KEY LISTENER (UNCHANGED) =====
         self._enter_key_thread = None
@@ -2102,10 +2551,42 @@ class Nexus:
         # ===== NEURON THREADS (UNCHANGED) =====
         self.neuron_threads = {}
         
+        # ===== NEURON SCHEDULER (pattern intervals over a fixed worker pool) =====
+        self.scheduler_workers = 4
+        self.scheduler = None
+        
+        # ===== GROWTH ADMISSION (coalesce GROWTH_SIGNALs, cap population and spawn rate) =====
+        self.growth_admission = GrowthAdmissionController(max_population=max_neurons,
+                                                          spawn_rate=spawn_rate)
+        
+        # ===== CHECKPOINTS (per-site learned state, warm start) =====
+        self.checkpoint_store = CheckpointStore(site) if site else None
+        self.warm_start = warm_start
+        self.checkpoints = {}             # coordinate -> restorable neuron state
+        self.checkpoint_interval = 60.0   # seconds between periodic saves
+        self.last_checkpoint_time = 0
+        
+        # ===== ROSE PRIORITIES (pattern priorities from neuron outcome tallies) =====
+        self.rose_update_interval = 1.0   # seconds between priority passes
+        self.last_rose_update_time = 0
+        
+        # ===== BULK SPAWN (shared construction template, batch timings) =====
+        self.neuron_template = None
+        self.spawn_stats = {'batches': 0, 'neurons': 0, 'total_ms': 0.0, 
+                            'template_ms': 0.0, 'last_batch': {}}
+        
         # ===== STATISTICS (SIMPLIFIED) =====
         self.B_matrix_history = []
         self.assignment_history = []
         
+        # ===== FRAME CACHE (rebuilt only for neurons the network marks dirty) =====
+        self._neuron_state_cache = {}  # neuron_id -> visualization state
+        
+        # ===== EVENT LOOP STATS =====
+        self.wakeup_reasons = defaultdict(int)         # axon type / 'frame_deadline' / 'stop' -> count
+        self.growth_latencies_ms = deque(maxlen=1000)  # GROWTH_SIGNAL fire -> handled
+        self.growth_latency_max_ms = 0.0
+        
         print(f"🌀 NEXUS 25D initialized: {self.session_id}")
         print(f"📁 Session directory: {self.session_dir}")
         print(f"📁 Frames will be saved to: {self.frames_dir}")
@@ -2125,33 +2606,8 @@ class Nexus:
             frame_number = self.frame_counter
             self.frame_counter += 1
             
-            # Create visualizer-friendly data structure
-            frame_data = {
-                'frame': frame_number,
-                'session_time': current_time - self.session_start_time,
-                'timestamp': current_time,
-                'session_id': self.session_id,
-                
-                # Get neurons from axon network
-                'neurons': self._get_neuron_states(),
-                
-                # Get axons from axon network
-                'axons': self._get_active_axons(),
-                
-                # System stats
-                'system_stats': {
-                    'total_neurons': len(self.neurons),
-                    'monitoring_active': self.monitoring_active,
-                    'session_duration': current_time - self.session_start_time
-                }
-            }
-            
-            # Save to file (SAME DIRECTORY STRUCTURE)
-            filename = f"frame_{frame_number:06d}.json"
-            filepath = os.path.join(self.frames_dir, filename)
-            
-            with open(filepath, 'w') as f:
-                json.dump(frame_data, f, indent=2)
+            frame_data = self._build_visualization_frame(frame_number, current_time)
+            self._write_frame(frame_data)
             
             print(f"📊 Frame {frame_number} dumped: {len(frame_data['neurons'])} neurons")
             self.last_dump_time = current_time
@@ -2159,106 +2615,143 @@ class Nexus:
         except Exception as e:
             print(f"⚠️ Frame dump error: {e}")
     
+    def _build_visualization_frame(self, frame_number: int, current_time: float) -> Dict:
+        """Visualizer-friendly frame: neuron states, active axons, system stats"""
+        frame_data = {
+            'frame': frame_number,
+            'session_time': current_time - self.session_start_time,
+            'timestamp': current_time,
+            'session_id': self.session_id,
+            
+            # Get neurons from axon network
+            'neurons': self._get_neuron_states(),
+            
+            # Get axons from axon network
+            'axons': self._get_active_axons(),
+            
+            # System stats
+            'system_stats': {
+                'total_neurons': len(self.neurons),
+                'monitoring_active': self.monitoring_active,
+                'session_duration': current_time - self.session_start_time,
+                'wakeup_reasons': dict(self.wakeup_reasons),
+                'scheduler': self.scheduler.get_metrics() if self.scheduler else {},
+                'memory': self.axon_network.memory_budget.get_metrics() if self.axon_network else {},
+                'growth_admission': self.growth_admission.get_metrics(),
+                'spawn': self.spawn_stats,
+                'steady_state': self.get_steady_state_stats(),
+                'checkpoints': self.checkpoint_store.get_metrics() if self.checkpoint_store else {},
+                'growth_latency_ms': self.get_growth_latency_stats(),
+                'cycle_budget': self.get_cycle_budget_stats(),
+                'membranes': self.axon_network.void_system.get_metrics() if self.axon_network else {}
+            }
+        }
+        return frame_data
+    
+    def _write_frame(self, frame_data: Dict):
+        """Save to file (SAME DIRECTORY STRUCTURE)"""
+        filename = f"frame_{frame_data['frame']:06d}.json"
+        filepath = os.path.join(self.frames_dir, filename)
+        
+        with open(filepath, 'w') as f:
+            json.dump(frame_data, f, indent=2, default=axon_json_default)
+    
     def _get_neuron_states(self):
-        """Get current state of all neurons for visualization"""
+        """Get current state of all neurons for visualization - rebuilds only changed neurons"""
+        if self.axon_network is not None:
+            for neuron_id in self.axon_network.aggregates.drain_dirty('nexus_frames'):
+                neuron = self.axon_network.get_neuron(neuron_id)
+                coord = self.axon_network.get_neuron_coordinate(neuron_id)
+                if neuron is None or coord is None:
+                    self._neuron_state_cache.pop(neuron_id, None)
+                    continue
+                self._neuron_state_cache[neuron_id] = self._build_neuron_state(coord, neuron)
+        
+        # Any neuron never seen by the network (or not yet cached) is built on demand
         neuron_states = []
-        
         for coord, neuron in self.neurons.items():
             if neuron.processing_phase == "DESTROYED":
                 continue
             
-            # Get neuron's current state
-            neuron_state = {
-                'neuron_id': neuron.id,
-                'coordinate': list(coord) if isinstance(coord, tuple) else coord,
-                'pattern': neuron.current_pattern,
-                'confidence': neuron.confidence_score,
-                'current_state': 'ACTIVE' if neuron.confidence_score > 0.5 else 'LEARNING',
-                'processing_phase': neuron.processing_phase,
-                'cycle': neuron.cycle_count,
-                'recycling_iteration': neuron.recycling_iteration,
-                
-                # Matrix data (if available)
-                'b_vector': neuron.b_vector.tolist() if hasattr(neuron, 'b_vector') else [0.2]*5,
-                'B_matrix_trace': float(np.trace(neuron.B_matrix)) if hasattr(neuron, 'B_matrix') else 0.0,
-                
-                # Eigen values (if available)
-                'eigen_system': {
-                    'alpha': float(getattr(neuron, 'eigen_alpha', 0.0)),
-                    'beta': float(getattr(neuron, 'eigen_beta', 0.0)),
-                    'gamma': float(getattr(neuron, 'eigen_gamma', 0.0)),
-                    'zeta': float(getattr(neuron, 'eigen_zeta', 0.0)),
-                },
-                
-                # Void/membrane status
-                'void_count': len(getattr(neuron, 'void_coordinates', set())),
-                'has_growth_signals': getattr(neuron, 'has_growth_signals', False),
-                
-                # Health/connection info
-                'health_status': 'UNKNOWN',
-                'health_score': 0.0,
-                'assignment_count': len(getattr(neuron, 'assignment', {})),
-                'pattern_probabilities': neuron.b_vector.tolist() if hasattr(neuron, 'b_vector') else [0.2]*5
-            }
-            
-            # Add UNKNOWN-specific data
-            if neuron.current_pattern == "UNKNOWN":
-                neuron_state['unknown_specific'] = {
-                    'is_unknown_pattern': True,
-                    'has_gamma_update': getattr(neuron.unknown_perm_cache, 'b_matrix_updated', False),
-                    'cycle_history': getattr(neuron.unknown_perm_cache, 'cycle_history', []),
-                }
-            
+            neuron_state = self._neuron_state_cache.get(neuron.id)
+            if neuron_state is None:
+                neuron_state = self._neuron_state_cache[neuron.id] = self._build_neuron_state(coord, neuron)
             neuron_states.append(neuron_state)
         
         return neuron_states
     
-    def _get_active_axons(self):
-        """Get active axons for visualization"""
-        active_axons = []
-        
-        if not hasattr(self, 'axon_network'):
-            return active_axons
+    def _build_neuron_state(self, coord, neuron) -> Dict:
+        """Build visualization state for one neuron"""
+        # Get neuron's current state
+        neuron_state = {
+            'neuron_id': neuron.id,
+            'coordinate': list(coord) if isinstance(coord, tuple) else coord,
+            'pattern': neuron.current_pattern,
+            'confidence': neuron.confidence_score,
+            'current_state': 'ACTIVE' if neuron.confidence_score > 0.5 else 'LEARNING',
+            'processing_phase': neuron.processing_phase,
+            'cycle': neuron.cycle_count,
+            'memory_bytes': self.axon_network.memory_budget.usage.get(neuron.id, 0),
+            'flip_rate': neuron.oscillation_detector.flip_rate if hasattr(neuron, 'oscillation_detector') else 0.0,
+            'oscillating': getattr(getattr(neuron, 'oscillation_detector', None), 'oscillating', False),
+            'warm_started': getattr(neuron, 'warm_started', False),
+            'recycling_iteration': neuron.recycling_iteration,
+            
+            # Matrix data (if available)
+            'b_vector': neuron.b_vector.tolist() if hasattr(neuron, 'b_vector') else [0.2]*5,
+            'B_matrix_trace': float(np.trace(neuron.B_matrix)) if hasattr(neuron, 'B_matrix') else 0.0,
+            
+            # Eigen values (if available)
+            'eigen_system': {
+                'alpha': float(getattr(neuron, 'eigen_alpha', 0.0) or 0.0),
+                'beta': float(getattr(neuron, 'eigen_beta', 0.0) or 0.0),
+                'gamma': float(getattr(neuron, 'eigen_gamma', 0.0) or 0.0),
+                'zeta': float(getattr(neuron, 'eigen_zeta', 0.0) or 0.0),
+            },
+            
+            # Void/membrane status
+            'void_count': len(getattr(neuron, 'void_coordinates', set())),
+            'has_growth_signals': getattr(neuron, 'has_growth_signals', False),
+            
+            # Health/connection info
+            'health_status': 'UNKNOWN',
+            'health_score': 0.0,
+            'assignment_count': len(getattr(neuron, 'assignment', {})),
+            'pattern_probabilities': neuron.b_vector.tolist() if hasattr(neuron, 'b_vector') else [0.2]*5
+        }
         
-        # Get recent axons from all pattern queues
-        recent_time = time.time() - 2.0  # Last 2 seconds
+        # Add UNKNOWN-specific data
+        if neuron.current_pattern == "UNKNOWN":
+            neuron_state['unknown_specific'] = {
+                'is_unknown_pattern': True,
+                'has_gamma_update': getattr(neuron.unknown_perm_cache, 'b_matrix_updated', False),
+                'cycle_history': getattr(neuron.unknown_perm_cache, 'cycle_history', []),
+            }
         
-        for pattern in ['DATA_INPUT', 'ACTION_ELEMENT', 'CONTEXT_ELEMENT', 
-                       'STRUCTURAL', 'UNKNOWN', 'NEXUS']:
-            if pattern in self.axon_network.queues:
-                queue = self.axon_network.queues[pattern]
-                
-                if pattern == 'NEXUS':
-                    # NEXUS queue is a deque
-                    for axon in list(queue)[-20:]:  # Last 20 axons
-                        if self._is_visualizable_axon(axon):
-                            active_axons.append(self._format_axon_for_viz(axon))
-                else:
-                    # Pattern queues are dicts
-                    for neuron_id, axons in queue.items():
-                        if axons:
-                            for axon in axons[-5:]:  # Last 5 axons per neuron
-                                if self._is_visualizable_axon(axon):
-                                    active_axons.append(self._format_axon_for_viz(axon))
+        return neuron_state
+    
+    # Axon types shown by the visualizer
+    VISUALIZABLE_AXON_TYPES = (
+        'GROWTH_SIGNAL',
+        'VOID_SIGNAL', 
+        'CIRCUITRY_UPDATE',
+        'DOT_PRODUCT_REPORT',
+        'PATTERN_CHANGE',
+        'UNKNOWN_UPDATE',
+        'HIERARCHICAL_ASSIGNMENT'
+    )
+    
+    def _get_active_axons(self):
+        """Get active axons for visualization from the network's recent-axon aggregates"""
+        if self.axon_network is None:
+            return []
         
-        return active_axons
+        recent = self.axon_network.aggregates.get_recent_axons(self.VISUALIZABLE_AXON_TYPES)
+        return [self._format_axon_for_viz(axon) for axon in recent]
     
     def _is_visualizable_axon(self, axon):
         """Check if axon should be visualized"""
-        axon_type = axon.get('axon_type', '')
-        
-        # Visualize these axon types
-        visualizable_types = [
-            'GROWTH_SIGNAL',
-            'VOID_SIGNAL', 
-            'CIRCUITRY_UPDATE',
-            'DOT_PRODUCT_REPORT',
-            'PATTERN_CHANGE',
-            'UNKNOWN_UPDATE',
-            'HIERARCHICAL_ASSIGNMENT'
-        ]
-        
-        return axon_type in visualizable_types
+        return axon.get('axon_type', '') in self.VISUALIZABLE_AXON_TYPES
     
     def _format_axon_for_viz(self, axon):
         """Format axon for visualizer"""
@@ -2298,24 +2791,21 @@ class Nexus:
         self.coordinate_space = self._load_coordinate_space(priori_data)
         if not self.coordinate_space:
             print("❌ No coordinate space loaded")
+            self.setup_failure = 'coordinate_space'
             return
         
-        selector = SpideyCoordinateSelector(
-            coordinate_space=self.coordinate_space,
-            selected_coords=None,
-            screen_width=1200,
-            screen_height=800
-        )
-        self.selected_coordinates = selector.run_selection()
+        self.selected_coordinates = self._select_coordinates()
         
         if not self.selected_coordinates:
             print("❌ No coordinates selected")
+            self.setup_failure = 'selection'
             return
         
         print(f"\n🎯 {len(self.selected_coordinates)} coordinates selected")
         
-        if not self.attach_to_browser():
+        if not self.attach_to_browser(self.port):
             print("❌ Failed to attach to browser")
+            self.setup_failure = 'attach'
             return
         
         self.session_start_time = time.time()
@@ -2325,16 +2815,33 @@ class Nexus:
                                     for coord in self.selected_coordinates},
             session_start_time=self.session_start_time
         )
+        # Neuron threads stage axons locally; merged once per loop tick below
+        self.axon_network.enable_staging()
+        self.axon_network.sampling_policy = AxonSamplingPolicy.preset(self.axon_sampling)
+        self.axon_network.memory_budget = MemoryBudget(
+            budget_mb=self.memory_budget_mb,
+            spill_dir=os.path.join(self.session_dir, "spill")
+        )
+        self.axon_network.cycle_budget_ms = self.cycle_budget_ms
+        # Void candidate search looks up the whole scanned page, not just the selection
+        self.axon_network.coordinate_index.seed(self.coordinate_space)
+        if self.pattern_priors:
+            self.axon_network.enable_pattern_priors(blend_weight=self.prior_blend)
+        
+        if self.checkpoint_store and self.warm_start:
+            self.checkpoints = self.checkpoint_store.load(self.coordinate_space)
+            print(f"💾 Warm start: {len(self.checkpoints)} checkpointed neurons "
+                  f"({self.checkpoint_store.stats['stale']} stale) from {self.checkpoint_store.path}")
         
         print("\n🧠 CREATING INITIAL NEURONS...")
         self._initialize_from_priori(priori_data, use_unknown_for_all=use_unknown_for_all)
         
         if not self.neurons:
             print("❌ No neurons created")
+            self.setup_failure = 'neurons'
             return
         
         for coord, neuron in self.neurons.items():
-            self.axon_network.register_neuron(neuron, {})
             print(f"✅ {neuron.id} at {coord}")
         
         print(f"🎯 {len(self.neurons)} neurons ready")
@@ -2358,11 +2865,29 @@ class Nexus:
         
         try:
             while self.monitoring_active:
+                # === WAIT FOR A NEXUS AXON, THE NEXT FRAME DEADLINE OR A STOP ===
+                frame_deadline = self.last_dump_time + self.dump_interval
+                reason = self.axon_network.wait_for_nexus(frame_deadline - time.time())
+                if reason == 'staged':
+                    # Let a cycle's burst of axons land together - merges at most every staged_merge_interval
+                    remaining = self.last_merge_time + self.staged_merge_interval - time.time()
+                    if remaining > 0:
+                        reason = self.axon_network.wait_for_nexus(remaining) or reason
+                self.wakeup_reasons[reason or 'frame_deadline'] += 1
+                
+                # === 0. MERGE STAGED AXONS (single writer for shared network state) ===
+                self.axon_network.merge_staged_axons()
+                self.last_merge_time = time.time()
+                self.axon_network.enforce_memory_budget()
+                
                 # === 1. PROCESS NEXUS AXONS ===
+                self._on_loop_tick()
                 self._process_nexus_axons_simple()
+                self._update_rose_priorities()
                 
                 # === 2. DUMP VISUALIZATION FRAME ===
                 self._dump_visualization_frame()
+                self._maybe_checkpoint()
                 
                 # === 3. CHECK FOR ENTER KEY ===
                 if self._check_for_enter_key():
@@ -2370,9 +2895,6 @@ class Nexus:
                     self.monitoring_active = False
                     break
                 
-                # Small delay
-                time.sleep(0.05)
-                
         except KeyboardInterrupt:
             print("\n\n🛑 Ctrl+C - Emergency shutdown!")
         except Exception as e:
@@ -2384,6 +2906,20 @@ class Nexus:
             self._stop_enter_key_listener()
             self._perform_graceful_shutdown()
     
+    def _select_coordinates(self) -> List[Tuple]:
+        """Coordinates to seed neurons at - interactive selection over the priori"""
+        selector = SpideyCoordinateSelector(
+            coordinate_space=self.coordinate_space,
+            selected_coords=None,
+            screen_width=1200,
+            screen_height=800
+        )
+        return selector.run_selection()
+    
+    def _on_loop_tick(self):
+        """Per-tick hook before NEXUS axons are processed (cluster workers exchange here)"""
+        pass
+    
     def _process_nexus_axons_simple(self):
         """Simple axon processing without heartbeat tracking"""
         axon_counts = {'growth': 0, 'void': 0, 'total': 0}
@@ -2398,56 +2934,268 @@ class Nexus:
             axon_counts['total'] += 1
             
             if axon_type == 'GROWTH_SIGNAL':
-                self._handle_growth_signal(axon)
+                self.growth_admission.offer(axon)
                 axon_counts['growth'] += 1
+                self._record_growth_latency(axon)
             elif axon_type == 'SYSTEM_ALERT':
                 data = axon.get('data', {})
                 alert_type = data.get('alert_type', 'UNKNOWN')
                 print(f"🚨 System alert: {alert_type}")
         
+        # Neurons whose growth flag was suppressed still count as requesters
+        if self.growth_admission.pending and self.axon_network is not None:
+            self.growth_admission.add_requesters(
+                lambda coord: self.axon_network.flag_claimants(coord, 'GROWTH'))
+        
+        # Spawn whatever the admission controller lets through this tick
+        spawned = self._admit_growth()
+        
         # Simple status update
         if axon_counts['total'] > 0:
             status = f"📨 Axons: {axon_counts['total']}"
             if axon_counts['growth'] > 0:
                 status += f" 🌱{axon_counts['growth']}"
+                status += f" (spawned {spawned}, pending {len(self.growth_admission.pending)})"
             print(f"  {status}")
     
+    def _admit_growth(self) -> int:
+        """Spawn this tick's admitted candidates as one batch"""
+        if not self.growth_admission.pending:
+            return 0
+        admitted = self.growth_admission.admit(
+            population=len(self.neurons),
+            exists=lambda coord: coord in self.neurons or (
+                self.axon_network is not None and self.axon_network.coordinate_has_neuron(coord))
+        )
+        return self._spawn_admitted(admitted) if admitted else 0
+    
+    def request_stop(self):
+        """Stop the monitoring loop from any thread (wakes it immediately)"""
+        self.monitoring_active = False
+        if self.axon_network:
+            self.axon_network.notify_nexus('stop')
+    
+    def _record_growth_latency(self, axon):
+        """End-to-end latency from GROWTH_SIGNAL fire to handling"""
+        t_ns = getattr(axon, 't_ns', None)
+        if t_ns is None:
+            return
+        now_ns = time.monotonic_ns() - self.axon_network.session_origin_ns
+        latency_ms = (now_ns - t_ns) / 1e6
+        self.growth_latencies_ms.append(latency_ms)
+        self.growth_latency_max_ms = max(self.growth_latency_max_ms, latency_ms)
+    
+    def get_growth_latency_stats(self) -> Dict:
+        """count / mean / p95 over the recent window, max over the session"""
+        latencies = sorted(self.growth_latencies_ms)
+        if not latencies:
+            return {'count': 0, 'mean': 0.0, 'p95': 0.0, 'max': 0.0}
+        return {
+            'count': len(latencies),
+            'mean': sum(latencies) / len(latencies),
+            'p95': latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+            'max': self.growth_latency_max_ms
+        }
+    
     # ===== KEEP ALL EXISTING UTILITY METHODS =====
     
     def _load_coordinate_space(self, priori_data: Dict) -> Dict[Tuple, Dict]:
-        """UNCHANGED - Load coordinate space from priori data"""
-        # ... keep existing implementation ...
-        pass
+        """Load coordinate space from priori data (string keys -> coordinate tuples)"""
+        coordinate_space = {}
+        for key, node_data in priori_data.get('coordinate_space', {}).items():
+            coord = parse_coordinate(key)
+            if coord is None:
+                continue
+            coordinate_space[coord] = node_data or {}
+        print(f"🗺️ Coordinate space: {len(coordinate_space)} coordinates")
+        return coordinate_space
     
     def attach_to_browser(self, port="9223") -> bool:
-        """UNCHANGED - Attach to Chrome debug port"""
-        # ... keep existing implementation ...
-        pass
+        """Attach to Chrome's debug port (an injected driver is used as-is)"""
+        if self.driver is not None:
+            print("🔗 Using injected browser driver")
+            return True
+        
+        print(f"🔗 Attaching to browser on port {port}...")
+        try:
+            options = Options()
+            options.add_experimental_option("debuggerAddress", f"127.0.0.1:{port}")
+            self.driver = webdriver.Chrome(service=Service(), options=options)
+            print(f"✅ Attached to browser: {self.driver.current_url}")
+            return True
+        except Exception as e:
+            print(f"❌ Could not attach to browser: {e}")
+            self.driver = None
+            return False
     
     def _determine_priori_pattern(self, coord_data: Dict) -> str:
-        """UNCHANGED - Determine initial ROSE pattern"""
-        # ... keep existing implementation ...
-        pass
+        """Initial ROSE pattern from the priori's pattern roles, then structural role"""
+        for pattern in coord_data.get('pattern_roles', []) or []:
+            if pattern in Neuron.pattern_names:
+                return pattern
+        if coord_data.get('structural_role') == 'STRUCTURAL':
+            return 'STRUCTURAL'
+        return 'UNKNOWN'
     
     def _initialize_from_priori(self, priori_data: Dict, use_unknown_for_all: bool = False):
-        """UNCHANGED - Initialize neurons from priori data"""
-        # ... keep existing implementation ...
-        pass
+        """Create neurons for the selected coordinates as one spawn batch"""
+        specs = []
+        for coord in self.selected_coordinates:
+            if use_unknown_for_all:
+                pattern = 'UNKNOWN'
+            else:
+                pattern = self._determine_priori_pattern(self.coordinate_space.get(coord, {}))
+            specs.append((coord, pattern))
+        self._spawn_neurons(specs, source='priori')
+    
+    def _spawn_neurons(self, specs: List[Tuple[Tuple, str]], source: str = 'growth') -> List[Neuron]:
+        """Bulk spawn [(coordinate, pattern)]: shared template, one registration, one enqueue"""
+        specs = [(coord, pattern) for coord, pattern in specs if coord not in self.neurons]
+        if not specs:
+            return []
+        
+        start = time.perf_counter()
+        if self.neuron_template is None:
+            self.neuron_template = NeuronTemplate.shared()
+            self.spawn_stats['template_ms'] = (time.perf_counter() - start) * 1000
+            start = time.perf_counter()
+        
+        neurons = Neuron.spawn_batch(specs, self.driver, self.axon_network, 
+                                     template=self.neuron_template, checkpoints=self.checkpoints)
+        for neuron in neurons:
+            self.neurons[neuron.coordinate] = neuron
+        if self.scheduler is not None:
+            self.scheduler.add_batch(neurons)
+        
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self.spawn_stats['batches'] += 1
+        self.spawn_stats['neurons'] += len(neurons)
+        self.spawn_stats['total_ms'] += elapsed_ms
+        self.spawn_stats['last_batch'] = {
+            'source': source,
+            'neurons': len(neurons),
+            'ms': elapsed_ms,
+            'ms_per_neuron': elapsed_ms / len(neurons) if neurons else 0.0
+        }
+        warm = sum(1 for neuron in neurons if neuron.warm_started)
+        print(f"🧬 Spawned {len(neurons)} neurons ({source}, {warm} warm) in {elapsed_ms:.1f}ms")
+        return neurons
+    
+    # ===== CHECKPOINTS =====
+    
+    def _update_rose_priorities(self):
+        """Apply ROSE.update_from_axon_queue deltas - averaged per ROSE, since neurons share one"""
+        now = time.time()
+        if not self.neurons or now - self.last_rose_update_time < self.rose_update_interval:
+            return
+        self.last_rose_update_time = now
+        
+        deltas = {}  # id(rose) -> (rose, pattern -> [delta, ...])
+        for coord, neuron in list(self.neurons.items()):
+            rose = getattr(neuron, 'rose', None)
+            if rose is None:
+                continue
+            updates = rose.update_from_axon_queue(self.axon_network, coord)
+            if updates:
+                per_pattern = deltas.setdefault(id(rose), (rose, defaultdict(list)))[1]
+                for pattern, delta in updates.items():
+                    per_pattern[pattern].append(delta)
+        
+        for rose, per_pattern in deltas.values():
+            for pattern, values in per_pattern.items():
+                priority = rose.pattern_priority.get(pattern, 0.0) + sum(values) / len(values)
+                rose.update_priority(pattern, max(priority, 0.01))
+    
+    def _maybe_checkpoint(self, force: bool = False):
+        """Persist learned neuron state every checkpoint_interval (and at shutdown)"""
+        if self.checkpoint_store is None or not self.neurons:
+            return
+        now = time.time()
+        if not force and now - self.last_checkpoint_time < self.checkpoint_interval:
+            return
+        self.last_checkpoint_time = now
+        try:
+            saved = self.checkpoint_store.save(self.neurons, self.coordinate_space, session={
+                'session_id': self.session_id,
+                'warm_start': bool(self.checkpoints),
+                'steady_state': self.get_steady_state_stats()
+            })
+            print(f"💾 Checkpointed {saved} neurons to {self.checkpoint_store.path}")
+        except OSError as e:
+            print(f"⚠️ Checkpoint save failed: {e}")
+    
+    def get_steady_state_stats(self) -> Dict:
+        """Time from spawn to first settle, cold vs warm-started neurons"""
+        stats = {}
+        for label, warm in (('cold', False), ('warm', True)):
+            group = [n for n in self.neurons.values() if getattr(n, 'warm_started', False) == warm]
+            steady = [n for n in group if getattr(n, 'steady_after', None) is not None]
+            stats[label] = {
+                'neurons': len(group),
+                'steady': len(steady),
+                'mean_seconds': sum(n.steady_after for n in steady) / len(steady) if steady else None,
+                'mean_cycles': sum(n.steady_cycles for n in steady) / len(steady) if steady else None
+            }
+        return stats
+    
+    def get_cycle_budget_stats(self) -> Dict:
+        """Cycle time percentiles and deferred / forced / overrun phase work across neurons"""
+        budgets = [n.cycle_budget for n in list(self.neurons.values()) if hasattr(n, 'cycle_budget')]
+        cycle_times = sorted(t for b in budgets for t in list(b.recent_cycle_ms))
+        stats = {'budget_ms': self.cycle_budget_ms, 'cycles': len(cycle_times),
+                 'p50': None, 'p95': None, 'max': None,
+                 'deferred': defaultdict(int), 'forced': defaultdict(int), 'overruns': defaultdict(int)}
+        if cycle_times:
+            stats['p50'] = cycle_times[len(cycle_times) // 2]
+            stats['p95'] = cycle_times[min(len(cycle_times) - 1, int(len(cycle_times) * 0.95))]
+            stats['max'] = cycle_times[-1]
+        for budget in budgets:
+            for key in ('deferred', 'forced', 'overruns'):
+                for name, count in getattr(budget, key).items():
+                    stats[key][name] += count
+        for key in ('deferred', 'forced', 'overruns'):
+            stats[key] = dict(stats[key])
+        return stats
     
     def _start_all_neuron_threads(self):
-        """UNCHANGED - Start all neurons in their own threads"""
-        # ... keep existing implementation ...
-        pass
+        """Hand all neurons to the deadline scheduler and start its worker pool"""
+        if self.scheduler is None:
+            self.scheduler = NeuronScheduler(workers=self.scheduler_workers)
+        # One enqueue for the initial population, first cycles spread so they don't all land at once
+        self.scheduler.add_batch([neuron for neuron in self.neurons.values()
+                                  if not self.scheduler.has(neuron.id)], spread=0.5)
+        self.scheduler.start()
+        print(f"🧵 Scheduler: {len(self.neurons)} neurons on {self.scheduler_workers} workers")
+        # Void reroutes are searched off the neuron threads, in batched passes
+        self.axon_network.void_system.start(interval=self.membrane_interval)
     
     def _check_and_start_new_neurons(self):
-        """UNCHANGED - Start threads for new neurons"""
-        # ... keep existing implementation ...
-        pass
-    
-    def _handle_growth_signal(self, axon: Dict):
-        """UNCHANGED - Create neuron at requested coordinate"""
-        # ... keep existing implementation ...
-        pass
+        """Schedule neurons created since the last check"""
+        if self.scheduler is None:
+            return
+        self.scheduler.add_batch([neuron for neuron in self.neurons.values()
+                                  if not self.scheduler.has(neuron.id)])
+    
+    def _spawn_admitted(self, candidates: List[Dict]) -> int:
+        """Create neurons for admitted growth candidates as one spawn batch"""
+        specs = []
+        for candidate in candidates:
+            coord = candidate['coordinate']
+            if coord in self.neurons or coord in self.void_coordinates:
+                continue
+            coord_data = self.coordinate_space.get(coord)
+            specs.append((coord, self._determine_priori_pattern(coord_data) if coord_data else "UNKNOWN"))
+        
+        try:
+            neurons = self._spawn_neurons(specs, source='growth')
+        except Exception as e:
+            print(f"⚠️ Growth batch of {len(specs)} failed: {e}")
+            return 0
+        
+        self.growth_signals_processed += len(neurons)
+        for neuron in neurons:
+            print(f"🌱 Grew neuron {neuron.id} at {neuron.coordinate} as {neuron.current_pattern}")
+        return len(neurons)
     
     def _start_enter_key_listener(self):
         """UNCHANGED - Start background thread to listen for ENTER"""
@@ -2473,6 +3221,15 @@ class Nexus:
         # Stop monitoring
         self.monitoring_active = False
         
+        # Stop dispatching cycles
+        if self.scheduler:
+            self.scheduler.stop()
+        if self.axon_network:
+            self.axon_network.void_system.stop()
+        
+        # Persist learned state for the next session on this site
+        self._maybe_checkpoint(force=True)
+        
         # Destroy neurons
         print("💀 Destroying neurons...")
         neurons_destroyed = 0
@@ -2485,6 +3242,10 @@ class Nexus:
         
         print(f"  Destroyed {neurons_destroyed} neurons")
         
+        # Flush anything still staged in neuron threads
+        if self.axon_network:
+            self.axon_network.enable_staging(False)
+        
         # Final frame dump
         print("📤 Final frame dump...")
         self._dump_visualization_frame()
@@ -2500,6 +3261,27 @@ class Nexus:
         # Summary
         print(f"\n✅ Shutdown complete")
         print(f"   Frames: {self.frame_counter}")
+        print(f"   Wakeups: {dict(self.wakeup_reasons)}")
+        latency = self.get_growth_latency_stats()
+        if latency['count']:
+            print(f"   Growth latency: mean {latency['mean']:.1f}ms, p95 {latency['p95']:.1f}ms, max {latency['max']:.1f}ms")
+        for label, group in self.get_steady_state_stats().items():
+            if group['steady']:
+                print(f"   Steady state ({label}): {group['steady']}/{group['neurons']} neurons, "
+                      f"mean {group['mean_seconds']:.1f}s / {group['mean_cycles']:.1f} cycles")
+        budget = self.get_cycle_budget_stats()
+        if budget['cycles']:
+            print(f"   Cycle time: p50 {budget['p50']:.1f}ms, p95 {budget['p95']:.1f}ms, max {budget['max']:.1f}ms "
+                  f"(budget {budget['budget_ms']:.0f}ms), deferred {budget['deferred']}, forced {budget['forced']}")
+        if self.axon_network:
+            membranes = self.axon_network.void_system.get_metrics()
+            if membranes['passes']:
+                print(f"   Membranes: {membranes['resolved']} reroutes in {membranes['passes']} passes, "
+                      f"{membranes['pending_voids']} pending, latency p95 "
+                      f"{membranes['reroute_latency_ms']['p95']:.1f}ms")
+        growth = self.growth_admission.get_metrics()
+        print(f"   Growth: admitted {growth['admitted']}, deferred {growth['deferred']}, "
+              f"rejected {growth['rejected']} {growth['reject_reasons']}")
         print(f"   Directory: {self.session_dir}")
         print("="*60)
     
@@ -2535,6 +3317,27 @@ def main_enhanced():
                        help='Chrome debug port (default: 9223)')
     parser.add_argument('--test-unknown', action='store_true',
                        help='Test mode: all neurons as UNKNOWN pattern')
+    parser.add_argument('--axon-sampling', type=str, default='debug',
+                       choices=sorted(AxonSamplingPolicy.PRESETS),
+                       help='Axon verbosity preset (default: debug, logs every axon)')
+    parser.add_argument('--memory-budget-mb', type=float, default=256.0,
+                       help='Retained neuron history before compaction/spill (default: 256)')
+    parser.add_argument('--max-neurons', type=int, default=500,
+                       help='Population cap for growth admission (default: 500)')
+    parser.add_argument('--spawn-rate', type=float, default=20.0,
+                       help='Neurons admitted per second from growth signals (default: 20)')
+    parser.add_argument('--site', type=str, default=None,
+                       help='Checkpoint key (default: priori filename without extension)')
+    parser.add_argument('--no-warm-start', action='store_true',
+                       help='Ignore saved checkpoints (they are still written at shutdown)')
+    parser.add_argument('--pattern-priors', action='store_true',
+                       help='Grow new neurons from population B/b priors per pattern')
+    parser.add_argument('--prior-blend', type=float, default=0.0,
+                       help='Per-cycle weight existing neurons give the prior (default: 0, off)')
+    parser.add_argument('--cycle-budget-ms', type=float, default=250.0,
+                       help='Per-cycle deadline; optional phase work defers past it (default: 250)')
+    parser.add_argument('--membrane-interval', type=float, default=0.25,
+                       help='Seconds between batched void reroute passes (default: 0.25)')
     
     args = parser.parse_args()
     
@@ -2564,7 +3367,14 @@ def main_enhanced():
         return
     
     # Create Nexus instance
-    nexus = Nexus()
+    nexus = Nexus(port=args.port, axon_sampling=args.axon_sampling,
+                  memory_budget_mb=args.memory_budget_mb,
+                  max_neurons=args.max_neurons, spawn_rate=args.spawn_rate,
+                  site=args.site or os.path.splitext(args.priori)[0],
+                  warm_start=not args.no_warm_start,
+                  pattern_priors=args.pattern_priors, prior_blend=args.prior_blend,
+                  cycle_budget_ms=args.cycle_budget_ms,
+                  membrane_interval=args.membrane_interval)
     
     try:
         print(f"\n{'='*60}")
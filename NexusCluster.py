@@ -0,0 +1,769 @@
+#!/usr/bin/env python3
+"""
+🌌 NEXUS CLUSTER - one page's coordinate space across several local Nexus workers
+The coordinator partitions the selected coordinates by subtree; every worker is a
+full Nexus (own neurons, own browser session) over its partition. Boundary
+broadcasts, growth for coordinates another partition owns and frames travel over a
+compact length-prefixed protocol on local sockets. The coordinator merges worker
+frames into one frame stream the visualizer replays as usual.
+
+    python NexusCluster.py --priori page.json --workers 4 --all
+"""
+
+import argparse
+import json
+import os
+import queue
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import time
+import uuid
+import zlib
+from collections import Counter, defaultdict, deque
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Tuple
+
+from Nexus import Nexus, SpideyCoordinateSelector, parse_coordinate
+from Neurons import AxonSamplingPolicy, axon_json_default
+
+
+# ===== WIRE PROTOCOL =====
+
+class MessageType(IntEnum):
+    HELLO = 1    # worker -> coordinator: {'worker', 'pid'}
+    ASSIGN = 2   # coordinator -> worker: partition, ownership map, priori path
+    AXONS = 3    # boundary broadcasts, batched per worker tick
+    GROWTH = 4   # growth candidates for coordinates another partition owns
+    FRAME = 5    # worker frame for the coordinator to merge
+    STOP = 6     # coordinator -> worker: shut down
+    BYE = 7      # worker -> coordinator: final stats, closing
+
+
+HEADER = struct.Struct('!IB')  # payload length, message type
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+def encode_payload(body: Any) -> bytes:
+    """Compact JSON (numpy / axons via axon_json_default)"""
+    return json.dumps(body, separators=(',', ':'), default=axon_json_default).encode('utf-8')
+
+
+def encode_message(msg_type: MessageType, payload: bytes) -> bytes:
+    return HEADER.pack(len(payload), int(msg_type)) + payload
+
+
+def _recv_exact(sock: socket.socket, n: int) -> Optional[bytes]:
+    buffer = bytearray()
+    while len(buffer) < n:
+        chunk = sock.recv(n - len(buffer))
+        if not chunk:
+            return None
+        buffer += chunk
+    return bytes(buffer)
+
+
+def read_message(sock: socket.socket) -> Optional[Tuple[MessageType, bytes]]:
+    """(type, raw payload), None once the peer has closed"""
+    header = _recv_exact(sock, HEADER.size)
+    if header is None:
+        return None
+    length, msg_type = HEADER.unpack(header)
+    if length > MAX_MESSAGE_BYTES:
+        raise ValueError(f"message of {length} bytes exceeds {MAX_MESSAGE_BYTES}")
+    payload = _recv_exact(sock, length) if length else b''
+    if payload is None:
+        return None
+    return MessageType(msg_type), payload
+
+
+def encode_axon(axon) -> List:
+    """Wire form of a broadcast: [type, source_id, source_coordinate, source_pattern, data]"""
+    return [str(axon.axon_type), axon.source_id, axon.source_coordinate, axon.source_pattern, axon.data]
+
+
+class ClusterLink:
+    """
+    One framed socket connection. Sends are serialised by a lock; a reader thread
+    hands each message to on_message(link, msg_type, payload) and reports the
+    peer closing once as on_message(link, None, None).
+    """
+
+    def __init__(self, sock: socket.socket, name: str, on_message):
+        self.sock = sock
+        self.name = name
+        self.on_message = on_message
+        self.peer = None                  # worker index once known
+        self.closed = False
+        self._send_lock = threading.Lock()
+        self._reader = None
+        self.stats = {'sent': 0, 'sent_bytes': 0, 'received': 0, 'received_bytes': 0}
+
+    def start(self):
+        self._reader = threading.Thread(target=self._read_loop, name=f"link_{self.name}", daemon=True)
+        self._reader.start()
+
+    def send(self, msg_type: MessageType, body: Any) -> bool:
+        return self.send_raw(msg_type, encode_payload(body))
+
+    def send_raw(self, msg_type: MessageType, payload: bytes) -> bool:
+        """Send an already encoded payload (relays forward without re-encoding)"""
+        if self.closed:
+            return False
+        message = encode_message(msg_type, payload)
+        try:
+            with self._send_lock:
+                self.sock.sendall(message)
+        except OSError:
+            self.close()
+            return False
+        self.stats['sent'] += 1
+        self.stats['sent_bytes'] += len(message)
+        return True
+
+    def _read_loop(self):
+        while not self.closed:
+            try:
+                message = read_message(self.sock)
+            except (OSError, ValueError):
+                message = None
+            if message is None:
+                break
+            msg_type, payload = message
+            self.stats['received'] += 1
+            self.stats['received_bytes'] += HEADER.size + len(payload)
+            self.on_message(self, msg_type, payload)
+        self.close()
+        self.on_message(self, None, None)
+
+    def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+
+# ===== SUBTREE PARTITIONING =====
+
+class SubtreePartitioner:
+    """
+    A coordinate belongs to the partition owning its prefix of length `depth`.
+    Prefixes present at selection time are packed onto workers largest first; a
+    prefix that only shows up later (growth into a new subtree) falls to a stable
+    hash, so every process resolves ownership the same way without asking.
+    """
+
+    def __init__(self, workers: int, depth: int, owners: Dict[Tuple[int, ...], int] = None):
+        self.workers = max(1, workers)
+        self.depth = depth
+        self.owners = owners or {}        # prefix -> worker index
+
+    @classmethod
+    def build(cls, coordinates: List[Tuple[int, ...]], workers: int,
+              subtrees_per_worker: int = 4) -> 'SubtreePartitioner':
+        """Shallowest prefix depth giving enough subtrees to balance, then greedy packing"""
+        max_depth = max((len(coord) for coord in coordinates), default=1)
+        depth = max_depth
+        for candidate in range(1, max_depth + 1):
+            if len({coord[:candidate] for coord in coordinates}) >= workers * subtrees_per_worker:
+                depth = candidate
+                break
+
+        counts = Counter(tuple(coord[:depth]) for coord in coordinates)
+        loads = [0] * max(1, workers)
+        owners = {}
+        for prefix, count in sorted(counts.items(), key=lambda item: (-item[1], item[0])):
+            worker = min(range(len(loads)), key=lambda w: (loads[w], w))
+            owners[prefix] = worker
+            loads[worker] += count
+        return cls(workers, depth, owners)
+
+    def prefix(self, coordinate) -> Tuple[int, ...]:
+        return tuple(coordinate[:self.depth])
+
+    def owner(self, coordinate) -> int:
+        prefix = self.prefix(coordinate)
+        owner = self.owners.get(prefix)
+        if owner is None:
+            owner = zlib.crc32(','.join(map(str, prefix)).encode()) % self.workers
+        return owner
+
+    def split(self, coordinates: List[Tuple[int, ...]]) -> Dict[int, List[Tuple[int, ...]]]:
+        parts = {worker: [] for worker in range(self.workers)}
+        for coord in coordinates:
+            parts[self.owner(coord)].append(coord)
+        return parts
+
+    def to_wire(self) -> Dict:
+        return {'workers': self.workers, 'depth': self.depth,
+                'owners': [[list(prefix), worker] for prefix, worker in self.owners.items()]}
+
+    @classmethod
+    def from_wire(cls, data: Dict) -> 'SubtreePartitioner':
+        return cls(data['workers'], data['depth'],
+                   {tuple(prefix): worker for prefix, worker in data.get('owners', [])})
+
+
+# ===== WORKER =====
+
+class NexusWorker(Nexus):
+    """
+    A Nexus over one partition. Seeds only the coordinates it was assigned,
+    forwards growth for other partitions' coordinates and its boundary broadcasts
+    to the coordinator, takes theirs in, and hands frames over instead of writing them.
+    """
+
+    # Broadcasts neighbours in another partition care about (low rate, no per-cycle traffic)
+    BOUNDARY_AXON_TYPES = {'NEURON_CREATED', 'PATTERN_CHANGE', 'DOM_EVENT',
+                           'VOID_SIGNAL', 'VOID_BROADCAST'}
+
+    def __init__(self, coordinator_address: Tuple[str, int], worker_index: int, **nexus_kwargs):
+        super().__init__(**nexus_kwargs)
+        self.coordinator_address = coordinator_address
+        self.worker_index = worker_index
+        self.link = None
+        self.partition = {}               # ASSIGN payload
+        self.partitioner = None
+        self.cluster_inbox = deque()      # (msg_type, payload) from the reader thread
+        self.boundary_subscription = None
+        self.cluster_stats = defaultdict(int)
+        self.bye_sent = False
+
+    def connect(self, timeout: float = 30.0) -> Dict:
+        """Register with the coordinator and wait for this worker's partition"""
+        sock = socket.create_connection(self.coordinator_address, timeout=timeout)
+        sock.settimeout(None)
+        assigned = threading.Event()
+
+        def on_message(link, msg_type, payload):
+            if msg_type is MessageType.ASSIGN:
+                self.partition = json.loads(payload)
+                assigned.set()
+                return
+            self.cluster_inbox.append((msg_type, payload))
+            if self.axon_network is not None:
+                self.axon_network.notify_nexus('cluster')
+
+        self.link = ClusterLink(sock, f"worker_{self.worker_index}", on_message)
+        self.link.start()
+        self.link.send(MessageType.HELLO, {'worker': self.worker_index, 'pid': os.getpid()})
+        if not assigned.wait(timeout):
+            raise TimeoutError(f"no partition from coordinator at {self.coordinator_address}")
+
+        self.partitioner = SubtreePartitioner.from_wire(self.partition['partitioner'])
+        print(f"🌌 Worker {self.worker_index}: {len(self.partition['coordinates'])} coordinates "
+              f"(subtree depth {self.partitioner.depth}, {self.partitioner.workers} workers)")
+        return self.partition
+
+    def owns(self, coordinate) -> bool:
+        return self.partitioner.owner(coordinate) == self.worker_index
+
+    # ===== NEXUS HOOKS =====
+
+    def _select_coordinates(self) -> List[Tuple]:
+        """This worker's share of the coordinator's selection"""
+        return [coord for coord in (parse_coordinate(c) for c in self.partition.get('coordinates', []))
+                if coord is not None]
+
+    def _initialize_from_priori(self, priori_data: Dict, use_unknown_for_all: bool = False):
+        # Subscribe before the first spawn so our own NEURON_CREATED axons cross over too
+        self.boundary_subscription = self.axon_network.subscribe(
+            'cluster_boundary', axon_types=self.BOUNDARY_AXON_TYPES, maxlen=4096)
+        super()._initialize_from_priori(priori_data, use_unknown_for_all)
+
+    def _on_loop_tick(self):
+        """Apply what other partitions sent, then send this tick's boundary broadcasts"""
+        while self.cluster_inbox:
+            msg_type, payload = self.cluster_inbox.popleft()
+            if msg_type is MessageType.AXONS:
+                self._apply_remote_axons(json.loads(payload))
+            elif msg_type is MessageType.GROWTH:
+                self._offer_remote_growth(json.loads(payload))
+            elif msg_type is MessageType.STOP or msg_type is None:
+                print(f"⏹️ Worker {self.worker_index}: "
+                      f"{'stop from coordinator' if msg_type else 'coordinator link closed'}")
+                self.monitoring_active = False
+
+        if self.boundary_subscription is None:
+            return
+        outgoing = [encode_axon(axon) for axon in self.boundary_subscription.drain()
+                    if axon.source_state != 'REMOTE']
+        if outgoing and self.link.send(MessageType.AXONS, {'worker': self.worker_index, 'axons': outgoing}):
+            self.cluster_stats['axons_sent'] += len(outgoing)
+
+    def _apply_remote_axons(self, body: Dict):
+        partition = body.get('worker')
+        for axon_type, source_id, source_coordinate, source_pattern, data in body.get('axons', []):
+            coordinate = tuple(source_coordinate) if source_coordinate else None
+            if axon_type == 'NEURON_CREATED' and coordinate:
+                self.axon_network.register_remote_neuron(coordinate, source_id, source_pattern, partition)
+            self.axon_network.inject_remote_axon(axon_type, source_id, coordinate, source_pattern, data or {})
+            self.cluster_stats['axons_received'] += 1
+
+    def _offer_remote_growth(self, body: Dict):
+        """Growth candidates other partitions saw at coordinates we own"""
+        for candidate in body.get('candidates', []):
+            positions = candidate.get('positions') or [None]
+            self.growth_admission.offer({'data': {
+                'coordinate': candidate['coordinate'],
+                'vector_norm': candidate.get('vector_norm', 0.0),
+                'requesters': candidate.get('requesters') or [],
+                'from_position': positions[0]
+            }})
+            self.cluster_stats['growth_received'] += 1
+
+    def _admit_growth(self) -> int:
+        """Hand candidates another partition owns to the coordinator, admit the rest"""
+        foreign = [coord for coord in self.growth_admission.pending if not self.owns(coord)]
+        if foreign:
+            candidates = []
+            for coord in foreign:
+                candidate = self.growth_admission.pending.pop(coord)
+                candidates.append({
+                    'coordinate': list(coord),
+                    'vector_norm': candidate['vector_norm'],
+                    'requesters': sorted(candidate['requesters']),
+                    'positions': sorted(candidate['positions'])
+                })
+            if self.link.send(MessageType.GROWTH, {'worker': self.worker_index, 'candidates': candidates}):
+                self.cluster_stats['growth_forwarded'] += len(candidates)
+        return super()._admit_growth()
+
+    def _build_visualization_frame(self, frame_number: int, current_time: float) -> Dict:
+        frame_data = super()._build_visualization_frame(frame_number, current_time)
+        frame_data['partition'] = self.worker_index
+        frame_data['system_stats']['cluster'] = self.get_cluster_metrics()
+        return frame_data
+
+    def _write_frame(self, frame_data: Dict):
+        """Frames go to the coordinator, which merges partitions and writes them"""
+        if self.link.send(MessageType.FRAME, frame_data):
+            self.cluster_stats['frames_sent'] += 1
+
+    def _perform_graceful_shutdown(self):
+        super()._perform_graceful_shutdown()
+        self.send_bye()
+        self.link.close()
+
+    def send_bye(self):
+        """Final stats to the coordinator, once - also when setup never reached the loop"""
+        if self.bye_sent or self.link is None:
+            return
+        self.bye_sent = True
+        self.link.send(MessageType.BYE, {
+            'worker': self.worker_index,
+            'neurons': len(self.neurons),
+            'frames': self.frame_counter,
+            'setup_failed': self.setup_failure,
+            'growth_admission': self.growth_admission.get_metrics(),
+            'cluster': self.get_cluster_metrics()
+        })
+
+    def get_cluster_metrics(self) -> Dict:
+        return {
+            **self.cluster_stats,
+            'remote_neurons': len(self.axon_network.remote_neurons) if self.axon_network else 0,
+            'link': dict(self.link.stats) if self.link else {}
+        }
+
+
+# ===== COORDINATOR =====
+
+class NexusCoordinator:
+    """
+    Partitions the selection, accepts one connection per worker, relays boundary
+    broadcasts and foreign growth between partitions, and merges the latest frame
+    of every worker into one frame per dump interval.
+    """
+
+    def __init__(self, workers: int = 2, host: str = '127.0.0.1', listen_port: int = 0,
+                 dump_interval: float = 1.0):
+        self.workers = workers
+        self.dump_interval = dump_interval
+
+        self.session_id = f"cluster_{uuid.uuid4().hex[:8]}"
+        self.session_dir = os.path.join("Cognition", self.session_id)
+        self.frames_dir = os.path.join(self.session_dir, "frames")
+        os.makedirs(self.frames_dir, exist_ok=True)
+
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind((host, listen_port))
+        self.server.listen(workers)
+        self.address = self.server.getsockname()
+
+        self.partitioner = None
+        self.links = {}                       # worker index -> ClusterLink
+        self.messages = queue.Queue()         # (link, msg_type, payload) from every reader
+        self.processes = []                   # locally launched workers
+        self.latest_frames = {}               # worker index -> last frame
+        self.final_stats = {}                 # worker index -> BYE payload
+        self.frame_counter = 0
+        self.frames_since_merge = 0
+        self.relay_stats = defaultdict(int)
+        self.start_time = time.time()
+
+        print(f"🌌 NEXUS CLUSTER {self.session_id}: {workers} workers, listening on "
+              f"{self.address[0]}:{self.address[1]}")
+
+    # ===== SETUP =====
+
+    def select_coordinates(self, coordinate_space: Dict[Tuple, Dict], select_all: bool = False) -> List[Tuple]:
+        if select_all:
+            return sorted(coordinate_space)
+        selector = SpideyCoordinateSelector(
+            coordinate_space=coordinate_space,
+            selected_coords=None,
+            screen_width=1200,
+            screen_height=800
+        )
+        return selector.run_selection() or []
+
+    def launch_local_workers(self, chrome_base_port: int, worker_args: List[str]) -> List[subprocess.Popen]:
+        """One worker process per partition on this machine, each on its own Chrome debug port"""
+        host, port = self.address
+        for index in range(self.workers):
+            command = [sys.executable, os.path.abspath(__file__),
+                       '--worker', str(index), '--connect', f"{host}:{port}",
+                       '--port', str(chrome_base_port + index)] + worker_args
+            self.processes.append(subprocess.Popen(command))
+        print(f"🚀 Launched {len(self.processes)} local workers "
+              f"(Chrome ports {chrome_base_port}-{chrome_base_port + self.workers - 1})")
+        return self.processes
+
+    def _on_message(self, link: ClusterLink, msg_type, payload):
+        self.messages.put((link, msg_type, payload))
+
+    def accept_workers(self, timeout: float = 120.0):
+        """Accept connections until every worker index has said HELLO"""
+        deadline = time.time() + timeout
+        pending = []
+        while len(self.links) < self.workers:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                raise TimeoutError(f"{len(self.links)}/{self.workers} workers connected")
+            self.server.settimeout(min(0.5, remaining))
+            try:
+                sock, _ = self.server.accept()
+                sock.settimeout(None)
+                link = ClusterLink(sock, f"peer_{len(pending)}", self._on_message)
+                link.start()
+                pending.append(link)
+            except socket.timeout:
+                pass
+
+            while True:
+                try:
+                    link, msg_type, payload = self.messages.get_nowait()
+                except queue.Empty:
+                    break
+                if msg_type is MessageType.HELLO:
+                    index = json.loads(payload)['worker']
+                    if index in self.links or not 0 <= index < self.workers:
+                        print(f"⚠️ Rejecting worker index {index}")
+                        link.close()
+                        continue
+                    link.peer = index
+                    link.name = f"worker_{index}"
+                    self.links[index] = link
+                    print(f"🔗 Worker {index} connected")
+
+    def assign(self, coordinates: List[Tuple], priori_path: str, use_unknown_for_all: bool = False):
+        """Partition the selection by subtree and send every worker its share"""
+        self.partitioner = SubtreePartitioner.build(coordinates, self.workers)
+        parts = self.partitioner.split(coordinates)
+        for index, link in self.links.items():
+            link.send(MessageType.ASSIGN, {
+                'worker': index,
+                'partitioner': self.partitioner.to_wire(),
+                'coordinates': [list(coord) for coord in parts[index]],
+                'priori': os.path.abspath(priori_path),
+                'use_unknown_for_all': use_unknown_for_all
+            })
+        sizes = {index: len(part) for index, part in parts.items()}
+        print(f"🧩 Partitioned {len(coordinates)} coordinates at subtree depth "
+              f"{self.partitioner.depth}: {sizes}")
+
+    # ===== RELAY LOOP =====
+
+    def run(self, duration: float = None):
+        """Relay until every worker has left, the duration is up or Ctrl+C"""
+        last_merge = time.time()
+        stop_at = time.time() + duration if duration else None
+        stopping = False
+        try:
+            while self._live_links():
+                if stop_at and not stopping and time.time() >= stop_at:
+                    print("\n⏱️ Duration reached - stopping workers")
+                    self.stop_workers()
+                    stopping = True
+
+                timeout = max(0.0, last_merge + self.dump_interval - time.time())
+                try:
+                    self._route(*self.messages.get(timeout=timeout))
+                except queue.Empty:
+                    pass
+
+                if time.time() - last_merge >= self.dump_interval:
+                    self._merge_frames()
+                    last_merge = time.time()
+        except KeyboardInterrupt:
+            print("\n🛑 Ctrl+C - stopping workers")
+            self.stop_workers()
+            self._drain_until_closed(timeout=30.0)
+        finally:
+            self.shutdown()
+
+    def _live_links(self) -> List[ClusterLink]:
+        return [link for link in self.links.values() if not link.closed]
+
+    def _route(self, link: ClusterLink, msg_type, payload):
+        sender = link.peer
+        if msg_type is None:
+            print(f"🔌 Worker {sender} disconnected")
+        elif msg_type is MessageType.AXONS:
+            # Boundary broadcasts go to every other partition as-is
+            for index, other in self.links.items():
+                if index != sender and other.send_raw(MessageType.AXONS, payload):
+                    self.relay_stats['axon_bytes'] += len(payload)
+            self.relay_stats['axon_batches'] += 1
+        elif msg_type is MessageType.GROWTH:
+            by_owner = defaultdict(list)
+            for candidate in json.loads(payload).get('candidates', []):
+                by_owner[self.partitioner.owner(candidate['coordinate'])].append(candidate)
+            for owner, candidates in by_owner.items():
+                target = self.links.get(owner)
+                if target is not None and target.send(MessageType.GROWTH, {'worker': sender, 'candidates': candidates}):
+                    self.relay_stats['growth_routed'] += len(candidates)
+                else:
+                    self.relay_stats['growth_dropped'] += len(candidates)
+        elif msg_type is MessageType.FRAME:
+            self.latest_frames[sender] = json.loads(payload)
+            self.frames_since_merge += 1
+        elif msg_type is MessageType.BYE:
+            self.final_stats[sender] = json.loads(payload)
+            if self.final_stats[sender].get('setup_failed'):
+                print(f"❌ Worker {sender}: setup failed at {self.final_stats[sender]['setup_failed']}")
+            else:
+                print(f"👋 Worker {sender}: {self.final_stats[sender].get('neurons', 0)} neurons")
+
+    def _drain_until_closed(self, timeout: float):
+        deadline = time.time() + timeout
+        while self._live_links() and time.time() < deadline:
+            try:
+                self._route(*self.messages.get(timeout=0.2))
+            except queue.Empty:
+                pass
+        while True:
+            try:
+                self._route(*self.messages.get_nowait())
+            except queue.Empty:
+                break
+
+    # ===== FRAME MERGE =====
+
+    def _merge_frames(self):
+        """One visualizer frame from the latest frame of every partition"""
+        if not self.frames_since_merge or not self.latest_frames:
+            return
+        self.frames_since_merge = 0
+        now = time.time()
+        frames = sorted(self.latest_frames.items())
+
+        neurons, axons = [], []
+        for index, frame in frames:
+            neurons.extend(dict(state, partition=index) for state in frame.get('neurons', []))
+            axons.extend(frame.get('axons', []))
+
+        frame_data = {
+            'frame': self.frame_counter,
+            'session_time': now - self.start_time,
+            'timestamp': now,
+            'session_id': self.session_id,
+            'neurons': neurons,
+            'axons': axons,
+            'system_stats': {
+                'total_neurons': len(neurons),
+                'monitoring_active': any(f.get('system_stats', {}).get('monitoring_active') for _, f in frames),
+                'session_duration': now - self.start_time,
+                'partitions': {index: frame.get('system_stats', {}) for index, frame in frames},
+                'cluster': self.get_metrics()
+            }
+        }
+        filepath = os.path.join(self.frames_dir, f"frame_{self.frame_counter:06d}.json")
+        with open(filepath, 'w') as f:
+            json.dump(frame_data, f, indent=2, default=axon_json_default)
+        self.frame_counter += 1
+
+    # ===== SHUTDOWN =====
+
+    def stop_workers(self):
+        for link in self._live_links():
+            link.send(MessageType.STOP, {})
+
+    def shutdown(self, timeout: float = 10.0):
+        self.stop_workers()
+        self._drain_until_closed(timeout)
+        self._merge_frames()
+        for link in self.links.values():
+            link.close()
+        for process in self.processes:
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.terminate()
+        try:
+            self.server.close()
+        except OSError:
+            pass
+
+        print("\n✅ Cluster shutdown complete")
+        print(f"   Frames: {self.frame_counter} merged into {self.frames_dir}")
+        print(f"   Neurons: {sum(s.get('neurons', 0) for s in self.final_stats.values())} "
+              f"across {len(self.final_stats)} workers")
+        print(f"   Relay: {dict(self.relay_stats)}")
+
+    def get_metrics(self) -> Dict:
+        return {
+            'workers': self.workers,
+            'connected': len(self._live_links()),
+            'depth': self.partitioner.depth if self.partitioner else None,
+            'relay': dict(self.relay_stats),
+            'links': {index: dict(link.stats) for index, link in self.links.items()}
+        }
+
+
+# ===== MAIN EXECUTION =====
+
+def _load_priori(priori: str) -> Tuple[str, Optional[Dict]]:
+    """Resolve a priori name like Nexus.py does (TheDevengers/), or take a path as-is"""
+    priori_path = priori if os.path.exists(priori) else os.path.join("TheDevengers", priori)
+    if not os.path.exists(priori_path):
+        print(f"❌ Priori file not found: {priori_path}")
+        return priori_path, None
+    with open(priori_path, 'r') as f:
+        return priori_path, json.load(f)
+
+
+def run_worker(args, driver=None):
+    """Worker process: connect, receive a partition, run a Nexus over it (on driver, if given)"""
+    host, port = args.connect.rsplit(':', 1)
+    nexus = NexusWorker(
+        (host, int(port)), args.worker, driver=driver,
+        port=args.port, axon_sampling=args.axon_sampling,
+        memory_budget_mb=args.memory_budget_mb,
+        max_neurons=args.max_neurons, spawn_rate=args.spawn_rate,
+        # One checkpoint file per partition - workers never write the same file
+        site=f"{args.site}.part{args.worker}" if args.site else None,
+        warm_start=not args.no_warm_start,
+        cycle_budget_ms=args.cycle_budget_ms,
+        membrane_interval=args.membrane_interval
+    )
+    try:
+        partition = nexus.connect()
+        _, priori_data = _load_priori(partition['priori'])
+        if priori_data is None:
+            nexus.setup_failure = 'priori'
+        else:
+            nexus.run_monitoring(priori_data, use_unknown_for_all=partition.get('use_unknown_for_all', False))
+    except KeyboardInterrupt:
+        pass  # the coordinator sends STOP
+    finally:
+        nexus.cleanup()
+        if nexus.link is not None:
+            nexus.send_bye()  # no-op after a graceful shutdown; setup failures still report
+            nexus.link.close()
+
+
+def run_coordinator(args):
+    priori_path, priori_data = _load_priori(args.priori)
+    if priori_data is None:
+        return
+
+    coordinate_space = {}
+    for key, node_data in priori_data.get('coordinate_space', {}).items():
+        coord = parse_coordinate(key)
+        if coord is not None:
+            coordinate_space[coord] = node_data or {}
+
+    coordinator = NexusCoordinator(workers=args.workers, listen_port=args.listen_port)
+    coordinates = coordinator.select_coordinates(coordinate_space, select_all=args.all)
+    if not coordinates:
+        print("❌ No coordinates selected")
+        return
+
+    # Worker options: totals split per partition, checkpoints kept per partition
+    site = args.site or os.path.splitext(os.path.basename(args.priori))[0]
+    worker_args = ['--axon-sampling', args.axon_sampling,
+                   '--memory-budget-mb', str(args.memory_budget_mb / args.workers),
+                   '--max-neurons', str(max(1, args.max_neurons // args.workers)),
+                   '--spawn-rate', str(args.spawn_rate / args.workers),
+                   '--cycle-budget-ms', str(args.cycle_budget_ms),
+                   '--membrane-interval', str(args.membrane_interval)]
+    if args.no_warm_start:
+        worker_args.append('--no-warm-start')
+
+    if not args.no_spawn:
+        coordinator.launch_local_workers(args.chrome_base_port,
+                                         worker_args + ['--site', f"{site}.{args.workers}way"])
+    else:
+        print(f"⏳ Waiting for {args.workers} workers: "
+              f"python NexusCluster.py --worker N --connect {coordinator.address[0]}:{coordinator.address[1]}")
+
+    try:
+        coordinator.accept_workers()
+    except TimeoutError as e:
+        print(f"❌ {e}")
+        coordinator.shutdown()
+        return
+    coordinator.assign(coordinates, priori_path, use_unknown_for_all=args.test_unknown)
+    coordinator.run(duration=args.duration)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Nexus cluster - partitioned monitoring of one page')
+    parser.add_argument('--priori', type=str, help='Priori JSON (name in TheDevengers/ or a path)')
+    parser.add_argument('--workers', type=int, default=2, help='Worker processes / partitions (default: 2)')
+    parser.add_argument('--all', action='store_true', help='Select every priori coordinate (no selector UI)')
+    parser.add_argument('--duration', type=float, default=None, help='Stop after this many seconds')
+    parser.add_argument('--listen-port', type=int, default=0, help='Coordinator port (default: any free port)')
+    parser.add_argument('--chrome-base-port', type=int, default=9223,
+                        help='Worker i attaches to Chrome on base + i (default: 9223)')
+    parser.add_argument('--no-spawn', action='store_true', help='Wait for externally started workers')
+    parser.add_argument('--test-unknown', action='store_true', help='Use UNKNOWN pattern for all neurons')
+    # Worker mode (launched by the coordinator)
+    parser.add_argument('--worker', type=int, default=None, help='Run as worker with this index')
+    parser.add_argument('--connect', type=str, default=None, help='Coordinator host:port (worker mode)')
+    parser.add_argument('--port', type=str, default='9223', help='Chrome debug port (worker mode)')
+    # Nexus options (totals in coordinator mode, per worker in worker mode)
+    parser.add_argument('--axon-sampling', type=str, default='debug', choices=sorted(AxonSamplingPolicy.PRESETS))
+    parser.add_argument('--memory-budget-mb', type=float, default=256.0)
+    parser.add_argument('--max-neurons', type=int, default=500)
+    parser.add_argument('--spawn-rate', type=float, default=20.0)
+    parser.add_argument('--site', type=str, default=None)
+    parser.add_argument('--no-warm-start', action='store_true')
+    parser.add_argument('--cycle-budget-ms', type=float, default=250.0)
+    parser.add_argument('--membrane-interval', type=float, default=0.25)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        if not args.connect:
+            parser.error('--worker needs --connect host:port')
+        run_worker(args)
+    elif args.priori:
+        run_coordinator(args)
+    else:
+        parser.error('--priori is required in coordinator mode')
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+🛰️ NEXUS HEADLESS - unattended Nexus runs for services and benchmarks
+Coordinates come from the priori (its 'selected_coordinates' list, or every
+coordinate) narrowed by a filter expression instead of the selector UI. The run
+stops on a cycle count, a wall-clock limit or a steady-state criterion and writes
+run_summary.json with throughput and latency numbers - also when setup fails
+(stop_reason 'setup_failed:<step>'). pygame is never imported. Pass driver= to
+HeadlessNexus to run on an existing WebDriver instead of attaching to --port.
+
+    python NexusHeadless.py --priori page.json --select "prefix=0.1.2 pattern=ACTION_ELEMENT depth=3-6" --duration 60
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+from Nexus import Nexus, parse_coordinate
+from Neurons import AxonSamplingPolicy, Neuron, axon_json_default
+
+
+# ===== SELECTION =====
+
+class CoordinateFilter:
+    """
+    Whitespace-separated clauses, all of which must match; '|' separates alternatives:
+        prefix=0.1.2|0.1.5    coordinate lies in one of these subtrees
+        pattern=DATA_INPUT    priori pattern (pattern_roles, then structural role)
+        depth=3-6             depth range, open ended as 3- or -6, or exact as 4
+    """
+
+    def __init__(self, prefixes: Optional[List[Tuple]] = None, patterns: Optional[List[str]] = None,
+                 min_depth: Optional[int] = None, max_depth: Optional[int] = None):
+        self.prefixes = prefixes or []
+        self.patterns = patterns or []
+        self.min_depth = min_depth
+        self.max_depth = max_depth
+
+    @classmethod
+    def parse(cls, expression: Optional[str]) -> 'CoordinateFilter':
+        selection = cls()
+        for clause in (expression or '').split():
+            key, sep, value = clause.partition('=')
+            if not sep or not value:
+                raise ValueError(f"filter clause '{clause}' is not key=value")
+            key = key.strip().lower()
+            alternatives = [v for v in value.split('|') if v]
+            if key == 'prefix':
+                for prefix in alternatives:
+                    coord = parse_coordinate(prefix.replace('.', ','))
+                    if coord is None:
+                        raise ValueError(f"bad subtree prefix '{prefix}'")
+                    selection.prefixes.append(coord)
+            elif key == 'pattern':
+                for pattern in alternatives:
+                    if pattern.upper() not in Neuron.pattern_names:
+                        raise ValueError(f"unknown pattern '{pattern}' (one of {', '.join(Neuron.pattern_names)})")
+                    selection.patterns.append(pattern.upper())
+            elif key == 'depth':
+                low, dash, high = value.partition('-')
+                try:
+                    selection.min_depth = int(low) if low else None
+                    selection.max_depth = (int(high) if high else None) if dash else selection.min_depth
+                except ValueError:
+                    raise ValueError(f"bad depth range '{value}'")
+            else:
+                raise ValueError(f"unknown filter key '{key}' (prefix, pattern, depth)")
+        return selection
+
+    def matches(self, coord: Tuple, node_data: Dict, pattern: str) -> bool:
+        if self.prefixes and not any(coord[:len(prefix)] == prefix for prefix in self.prefixes):
+            return False
+        if self.patterns and pattern not in self.patterns:
+            return False
+        depth = node_data.get('depth', len(coord))
+        if self.min_depth is not None and depth < self.min_depth:
+            return False
+        if self.max_depth is not None and depth > self.max_depth:
+            return False
+        return True
+
+    def to_dict(self) -> Dict:
+        return {'prefixes': [list(p) for p in self.prefixes], 'patterns': self.patterns,
+                'min_depth': self.min_depth, 'max_depth': self.max_depth}
+
+
+# ===== HEADLESS NEXUS =====
+
+class HeadlessNexus(Nexus):
+    """
+    A Nexus with no selector UI and no ENTER listener. Checked once per loop tick:
+    max_cycles (every seeded neuron has run this many cycles since its spawn/restore
+    cycle - growth keeps adding neurons, so the seeds are the fixed population to
+    count on), duration
+    (seconds since monitoring started) and steady_fraction (this share of neurons
+    backed off into MONITORING, held for steady_hold seconds). Any one stops the run.
+    """
+
+    def __init__(self, selection: Optional[CoordinateFilter] = None, max_cycles: Optional[int] = None,
+                 duration: Optional[float] = None, steady_fraction: Optional[float] = None,
+                 steady_hold: float = 5.0, summary_path: Optional[str] = None, **nexus_kwargs):
+        super().__init__(**nexus_kwargs)
+        self.selection = selection or CoordinateFilter()
+        self.max_cycles = max_cycles
+        self.duration = duration
+        self.steady_fraction = steady_fraction
+        self.steady_hold = steady_hold
+        self.summary_path = summary_path or os.path.join(self.session_dir, "run_summary.json")
+
+        self.priori_selection = None   # 'selected_coordinates' from the priori, if it has one
+        self.stop_reason = None
+        self.steady_since = None
+        self.seed_neurons = []         # the priori-seeded population the cycle count is measured on
+
+    def run_monitoring(self, priori_data: Dict, use_unknown_for_all: bool = False):
+        self.priori_selection = priori_data.get('selected_coordinates')
+        super().run_monitoring(priori_data, use_unknown_for_all)
+        if self.setup_failure:
+            # Setup returned before the loop - no graceful shutdown ran, still leave a summary
+            self.stop_reason = f"setup_failed:{self.setup_failure}"
+            self._write_run_summary()
+
+    # ===== NEXUS HOOKS =====
+
+    def _select_coordinates(self) -> List[Tuple]:
+        """The priori's own selection (or all of it), narrowed by the filter expression"""
+        if self.priori_selection:
+            candidates = [coord for coord in (parse_coordinate(c) for c in self.priori_selection)
+                          if coord is not None and coord in self.coordinate_space]
+        else:
+            candidates = sorted(self.coordinate_space)
+        selected = [coord for coord in candidates
+                    if self.selection.matches(coord, self.coordinate_space.get(coord, {}),
+                                              self._determine_priori_pattern(self.coordinate_space.get(coord, {})))]
+        print(f"🛰️ Headless selection: {len(selected)}/{len(candidates)} coordinates "
+              f"({'priori selection' if self.priori_selection else 'all priori coordinates'})")
+        return selected
+
+    def _start_all_neuron_threads(self):
+        super()._start_all_neuron_threads()
+        self.seed_neurons = list(self.neurons.values())
+
+    def _on_loop_tick(self):
+        super()._on_loop_tick()
+        if self.stop_reason is None:
+            self.stop_reason = self._check_stop_conditions()
+            if self.stop_reason:
+                print(f"\n⏹️ Headless stop: {self.stop_reason}")
+                self.request_stop()
+
+    def _check_stop_conditions(self) -> Optional[str]:
+        neurons = list(self.neurons.values())
+        if self.duration is not None and time.time() - self.session_start_time >= self.duration:
+            return 'duration'
+        if self.max_cycles is not None and self.seed_neurons and all(
+                n.cycle_count - n.spawn_cycle >= self.max_cycles for n in self.seed_neurons):
+            return 'cycles'
+        if self.steady_fraction is not None and neurons:
+            steady = sum(1 for n in neurons if n.processing_phase == "MONITORING")
+            if steady >= self.steady_fraction * len(neurons):
+                self.steady_since = self.steady_since or time.time()
+                if time.time() - self.steady_since >= self.steady_hold:
+                    return 'steady_state'
+            else:
+                self.steady_since = None
+        return None
+
+    def _start_enter_key_listener(self):
+        pass  # no terminal to read - stop conditions, SIGTERM or request_stop() end the run
+
+    def _stop_enter_key_listener(self):
+        pass
+
+    def _check_for_enter_key(self) -> bool:
+        return False
+
+    def _perform_graceful_shutdown(self):
+        super()._perform_graceful_shutdown()
+        self.stop_reason = self.stop_reason or 'interrupted'
+        self._write_run_summary()
+
+    def _write_run_summary(self):
+        try:
+            with open(self.summary_path, 'w') as f:
+                json.dump(self.get_run_summary(), f, indent=2, default=axon_json_default)
+            print(f"📊 Run summary: {self.summary_path}")
+        except OSError as e:
+            print(f"⚠️ Run summary write failed: {e}")
+
+    # ===== SUMMARY =====
+
+    def get_run_summary(self) -> Dict:
+        """Machine-readable outcome of the run: selection, stop reason, throughput, latency"""
+        started = self.session_start_time
+        wall_seconds = max(time.time() - started, 1e-9) if started is not None else 0.0
+        scheduler = self.scheduler.get_metrics() if self.scheduler else {}
+        cycles = scheduler.get('dispatched', 0)
+        axons = getattr(self.axon_network, 'axon_counter', 0) if self.axon_network else 0
+        return {
+            'session_id': self.session_id,
+            'stop_reason': self.stop_reason,
+            'stop_conditions': {'max_cycles': self.max_cycles, 'duration': self.duration,
+                                'steady_fraction': self.steady_fraction, 'steady_hold': self.steady_hold},
+            'selection': {'filter': self.selection.to_dict(),
+                          'source': 'priori_selection' if self.priori_selection else 'all',
+                          'coordinates': len(self.selected_coordinates)},
+            'wall_seconds': wall_seconds,
+            'neurons': {'initial': len(self.seed_neurons), 'final': len(self.neurons)},
+            'throughput': {
+                'cycles': cycles,
+                'cycles_per_second': cycles / wall_seconds if wall_seconds else 0.0,
+                'axons': axons,
+                'axons_per_second': axons / wall_seconds if wall_seconds else 0.0,
+                'frames': self.frame_counter
+            },
+            'latency_ms': {
+                'cycle': self.get_cycle_budget_stats(),
+                'growth': self.get_growth_latency_stats(),
+                'scheduler_lateness': {'mean': scheduler.get('mean_lateness_ms', 0.0),
+                                       'max': scheduler.get('max_lateness_ms', 0.0)}
+            },
+            'steady_state': self.get_steady_state_stats(),
+            'growth_admission': self.growth_admission.get_metrics(),
+            'wakeups': dict(self.wakeup_reasons),
+            'session_dir': self.session_dir
+        }
+
+
+# ===== MAIN =====
+
+def _load_priori(priori: str) -> Tuple[str, Optional[Dict]]:
+    """Resolve a priori name like Nexus.py does (TheDevengers/), or take a path as-is"""
+    priori_path = priori if os.path.exists(priori) else os.path.join("TheDevengers", priori)
+    if not os.path.exists(priori_path):
+        print(f"❌ Priori file not found: {priori_path}")
+        return priori_path, None
+    with open(priori_path, 'r') as f:
+        return priori_path, json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Headless Nexus - unattended monitoring runs')
+    parser.add_argument('--priori', type=str, required=True, help='Priori JSON (name in TheDevengers/ or a path)')
+    parser.add_argument('--port', type=str, default='9223', help='Chrome debug port (default: 9223)')
+    parser.add_argument('--select', type=str, default=None,
+                        help='Filter expression, e.g. "prefix=0.1.2 pattern=ACTION_ELEMENT depth=3-6"')
+    parser.add_argument('--test-unknown', action='store_true', help='Use UNKNOWN pattern for all neurons')
+    # Stop conditions (first one met ends the run)
+    parser.add_argument('--cycles', type=int, default=None, help='Stop once every seeded neuron has run this many cycles since its spawn/restore')
+    parser.add_argument('--duration', type=float, default=None, help='Stop after this many seconds')
+    parser.add_argument('--steady', type=float, default=None,
+                        help='Stop once this fraction of neurons is in MONITORING (e.g. 0.9)')
+    parser.add_argument('--steady-hold', type=float, default=5.0,
+                        help='Seconds the steady fraction must hold (default: 5)')
+    parser.add_argument('--summary', type=str, default=None,
+                        help='Run summary path (default: <session dir>/run_summary.json)')
+    # Nexus options
+    parser.add_argument('--axon-sampling', type=str, default='production', choices=sorted(AxonSamplingPolicy.PRESETS))
+    parser.add_argument('--memory-budget-mb', type=float, default=256.0)
+    parser.add_argument('--max-neurons', type=int, default=500)
+    parser.add_argument('--spawn-rate', type=float, default=20.0)
+    parser.add_argument('--site', type=str, default=None)
+    parser.add_argument('--no-warm-start', action='store_true')
+    parser.add_argument('--pattern-priors', action='store_true')
+    parser.add_argument('--prior-blend', type=float, default=0.0)
+    parser.add_argument('--cycle-budget-ms', type=float, default=250.0)
+    parser.add_argument('--membrane-interval', type=float, default=0.25)
+    args = parser.parse_args()
+
+    if args.cycles is None and args.duration is None and args.steady is None:
+        parser.error('give at least one stop condition: --cycles, --duration or --steady')
+    try:
+        selection = CoordinateFilter.parse(args.select)
+    except ValueError as e:
+        parser.error(str(e))
+
+    priori_path, priori_data = _load_priori(args.priori)
+    if priori_data is None:
+        sys.exit(1)
+
+    nexus = HeadlessNexus(
+        selection=selection, max_cycles=args.cycles, duration=args.duration,
+        steady_fraction=args.steady, steady_hold=args.steady_hold, summary_path=args.summary,
+        port=args.port, axon_sampling=args.axon_sampling,
+        memory_budget_mb=args.memory_budget_mb,
+        max_neurons=args.max_neurons, spawn_rate=args.spawn_rate,
+        site=args.site or os.path.splitext(os.path.basename(priori_path))[0],
+        warm_start=not args.no_warm_start,
+        pattern_priors=args.pattern_priors, prior_blend=args.prior_blend,
+        cycle_budget_ms=args.cycle_budget_ms,
+        membrane_interval=args.membrane_interval
+    )
+    # Service managers stop with SIGTERM - treat it like ENTER
+    signal.signal(signal.SIGTERM, lambda signum, frame: nexus.request_stop())
+
+    try:
+        nexus.run_monitoring(priori_data, use_unknown_for_all=args.test_unknown)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        nexus.cleanup()
+    failed = nexus.stop_reason in (None, 'interrupted') or nexus.stop_reason.startswith('setup_failed')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()